@@ -0,0 +1,106 @@
+"""
+Load-test the thread-pool translation executor against the asyncio executor.
+
+A local LibreTranslate-compatible server answers every request after a fixed
+delay, standing in for a slow upstream. Both executors translate the same
+batches; the async one should keep far more requests in flight per process.
+
+    python benchmarks/bench_async_translation.py [--batches 400] [--latency 0.2] [--threads 4] [--concurrency 100]
+"""
+import os
+import sys
+import time
+import json
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.translation_cache import TranslationCache
+from src.services.translation_service import TranslationService
+from src.services.translation_providers import LibreTranslateProvider
+from src.services.translation_executor import TranslationExecutor, AsyncTranslationExecutor
+
+class BenchServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+class SlowTranslator(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency = 0.2
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(cls.latency)
+        payload = json.dumps({'translatedText': [f'[{body["target"]}] {text}' for text in body['q']]}).encode()
+
+        with cls.lock:
+            cls.in_flight -= 1
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+def make_service(url):
+    service = TranslationService(cache=TranslationCache(db_path=''), providers=[LibreTranslateProvider((3.05, 15), url)])
+    for limiter in service.rate_limiters.values():
+        limiter.rate = 0
+    return service
+
+def run(executor, batches):
+    SlowTranslator.peak = 0
+    start = time.perf_counter()
+    results = executor.translate_batches(batches)
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for result in results if result is None or any(r.startswith('[DEMO') for r in result))
+    return elapsed, failed, SlowTranslator.peak
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--batches', type=int, default=400)
+    parser.add_argument('--segments', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.2)
+    parser.add_argument('--threads', type=int, default=int(os.getenv('TRANSLATION_WORKERS', 4)))
+    parser.add_argument('--concurrency', type=int, default=100)
+    args = parser.parse_args()
+
+    SlowTranslator.latency = args.latency
+    server = BenchServer(('127.0.0.1', 0), SlowTranslator)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}'
+
+    def batches(tag):
+        # Distinct texts per run so the translation memory never short-circuits a request
+        return [
+            ([f'{tag} headline {i} part {j}' for j in range(args.segments)], 'bs', 'en')
+            for i in range(args.batches)
+        ]
+
+    print(f'{args.batches} batches x {args.segments} segments, upstream latency {args.latency * 1000:.0f} ms')
+    print(f'{"mode":<28}{"seconds":>10}{"batches/s":>12}{"peak in flight":>16}{"failed":>8}')
+
+    for name, executor, tag in (
+        (f'threads ({args.threads} workers)', TranslationExecutor(make_service(url), args.threads), 'sync'),
+        (f'async (concurrency {args.concurrency})', AsyncTranslationExecutor(make_service(url), args.concurrency), 'async'),
+    ):
+        elapsed, failed, peak = run(executor, batches(tag))
+        print(f'{name:<28}{elapsed:>10.2f}{args.batches / elapsed:>12.1f}{peak:>16}{failed:>8}')
+        executor.shutdown()
+
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
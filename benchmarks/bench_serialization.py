@@ -0,0 +1,97 @@
+"""
+Compare the ORM + to_dict + jsonify listing path with the column-tuple serializer.
+
+    python benchmarks/bench_serialization.py [--rows 20000] [--page-size 50] [--repeat 3]
+
+Each mode serializes every row of an in-memory article table in pages of
+--page-size rows and reports rows/sec. orjson is used when installed.
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify
+from sqlalchemy import insert, select
+from src.models.user import db
+from src.models.article import Article
+from src.services.article_serializer import ARTICLE_FIELDS, columns_for, json_response, parse_fields, rows_to_dicts, orjson
+
+LIST_FIELDS = parse_fields('id,title,title_translated,description,description_translated,'
+                           'url,image_url,source,published_at,is_translated')
+
+def make_app(rows):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        base = datetime(2024, 1, 1)
+        db.session.execute(insert(Article), [
+            {
+                'uuid': f'bench-{i}',
+                'title': f'Team wins match {i}',
+                'title_translated': f'Tim pobjeđuje utakmicu {i}',
+                'description': 'A close game decided in the final minutes. ' * 3,
+                'description_translated': 'Tijesna utakmica odlučena u posljednjim minutama. ' * 3,
+                'content': 'Full match report. ' * 60,
+                'content_translated': 'Kompletan izvještaj s utakmice. ' * 60,
+                'url': f'https://example.com/{i}',
+                'image_url': f'https://example.com/{i}.jpg',
+                'source': 'example.com',
+                'language': 'en',
+                'category': 'sports',
+                'published_at': base + timedelta(minutes=i),
+                'created_at': base + timedelta(minutes=i),
+                'translated_at': base + timedelta(minutes=i, seconds=30),
+                'is_translated': True
+            }
+            for i in range(rows)
+        ])
+        db.session.commit()
+    return app
+
+def orm_to_dict(offset, limit):
+    articles = Article.query.order_by(Article.id).offset(offset).limit(limit).all()
+    return jsonify({'articles': [article.to_dict() for article in articles]}).get_data()
+
+def tuples(fields):
+    def page(offset, limit):
+        rows = db.session.execute(select(*columns_for(fields)).order_by(Article.id).offset(offset).limit(limit)).all()
+        return json_response({'articles': rows_to_dicts(fields, rows)}).get_data()
+    return page
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    app = make_app(args.rows)
+    modes = (
+        ('ORM + to_dict + jsonify', orm_to_dict),
+        ('column tuples, all fields', tuples(ARTICLE_FIELDS)),
+        ('column tuples, list fields', tuples(LIST_FIELDS)),
+    )
+
+    print(f'{args.rows} rows, pages of {args.page_size}, encoder: {"orjson" if orjson else "json"}')
+    baseline = None
+    with app.test_request_context():
+        for name, page in modes:
+            best = float('inf')
+            size = 0
+            for _ in range(args.repeat):
+                db.session.expunge_all()
+                start = time.perf_counter()
+                size = sum(len(page(offset, args.page_size)) for offset in range(0, args.rows, args.page_size))
+                best = min(best, time.perf_counter() - start)
+
+            rate = args.rows / best
+            baseline = baseline or rate
+            print(f'{name:<30}{rate:>12,.0f} rows/s{rate / baseline:>8.1f}x{size / args.rows:>8.0f} B/row')
+
+if __name__ == '__main__':
+    main()
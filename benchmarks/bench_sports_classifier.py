@@ -0,0 +1,96 @@
+"""
+Compare the precompiled SportsClassifier with the previous per-call keyword scan.
+
+    python benchmarks/bench_sports_classifier.py [--articles 20000] [--repeat 5]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.sports_classifier import SportsClassifier
+
+def legacy_is_sports_related(article):
+    """
+    NewsService._is_sports_related before the classifier was introduced
+    """
+    sports_keywords = [
+        'sports', 'football', 'basketball', 'soccer', 'tennis', 'baseball',
+        'hockey', 'golf', 'olympics', 'fifa', 'nfl', 'nba', 'mlb', 'nhl',
+        'championship', 'tournament', 'league', 'match', 'game', 'player',
+        'team', 'coach', 'stadium', 'score', 'goal', 'touchdown', 'victory'
+    ]
+    if 'categories' in article:
+        categories = article['categories']
+        if isinstance(categories, list) and 'sports' in categories:
+            return True
+    text_to_check = []
+    if 'title' in article:
+        text_to_check.append(article['title'].lower())
+    if 'description' in article:
+        text_to_check.append(article['description'].lower())
+    if 'snippet' in article:
+        text_to_check.append(article['snippet'].lower())
+    combined_text = ' '.join(text_to_check)
+    return any(keyword in combined_text for keyword in sports_keywords)
+
+FILLER = ('markets economy election policy weather travel science health music film '
+          'technology startup budget parliament energy climate housing transport').split()
+SPORTS = ['football', 'league', 'coach', 'tennis', 'goals', 'matches', 'stadium']
+TRAPS = ['endgame', 'goalkeeping', 'teammates', 'scoreboard', 'rematch']
+
+def make_articles(count, seed=42):
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(60)]
+        roll = rng.random()
+        if roll < 0.3:
+            words[rng.randrange(len(words))] = rng.choice(SPORTS)
+        elif roll < 0.4:
+            words[rng.randrange(len(words))] = rng.choice(TRAPS)
+        articles.append({
+            'title': ' '.join(words[:10]).capitalize(),
+            'description': ' '.join(words[10:30]),
+            'snippet': ' '.join(words[30:]),
+            'categories': ['general']
+        })
+    return articles
+
+def timed(func, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    classifier = SportsClassifier()
+    classifier.get_pattern()
+
+    legacy_time, legacy = timed(lambda: [legacy_is_sports_related(a) for a in articles], args.repeat)
+    single_time, single = timed(lambda: [classifier.is_sports_related(a) for a in articles], args.repeat)
+    batch_time, batch = timed(lambda: classifier.classify_batch(articles), args.repeat)
+
+    assert single == batch
+    removed = sum(1 for old, new in zip(legacy, batch) if old and not new)
+
+    print(f"articles:          {len(articles)}")
+    print(f"legacy per-call:   {legacy_time * 1000:8.1f} ms  ({len(articles) / legacy_time:,.0f} articles/s)")
+    print(f"compiled per-call: {single_time * 1000:8.1f} ms  ({len(articles) / single_time:,.0f} articles/s)")
+    print(f"compiled batch:    {batch_time * 1000:8.1f} ms  ({len(articles) / batch_time:,.0f} articles/s)")
+    print(f"speedup (batch):   {legacy_time / batch_time:8.1f}x")
+    print(f"matches legacy/new: {sum(legacy)}/{sum(batch)} ({removed} substring false positives removed)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Read throughput of the article listing query while writers ingest and translate.
+
+Runs the same workload against a fresh SQLite file with the default engine
+settings and with the tuned profile from src/database/config.py (WAL,
+synchronous=NORMAL, busy_timeout, mmap, cache size, single-writer lock).
+Each profile runs in its own process.
+
+    python benchmarks/bench_sqlite_concurrency.py [--seconds 10] [--readers 8] [--writers 4]
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import argparse
+import threading
+import subprocess
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import insert, update
+from sqlalchemy.exc import OperationalError
+from src.models.user import db
+from src.models.article import Article
+from src.database.config import configure_database, tune_engine
+
+def make_app(path, profile):
+    app = Flask(__name__)
+    if profile == 'tuned':
+        configure_database(app, path)
+    else:
+        app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    db.init_app(app)
+    if profile == 'tuned':
+        tune_engine(db, app)
+
+    with app.app_context():
+        db.create_all()
+    return app
+
+def article_rows(start, count):
+    base = datetime(2024, 1, 1)
+    return [
+        {
+            'uuid': f'bench-{start + i}-{random.random()}',
+            'title': f'Match report {start + i}',
+            'description': 'Late winner settles the derby. ' * 4,
+            'content': 'Full report. ' * 100,
+            'url': f'https://example.com/{start + i}',
+            'source': 'example.com',
+            'language': 'en',
+            'category': 'sports',
+            'published_at': base + timedelta(minutes=start + i),
+            'is_translated': False
+        }
+        for i in range(count)
+    ]
+
+def percentile(values, pct):
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(pct / 100 * len(values)))] * 1000, 2)
+
+def run_profile(profile, seconds, readers, writers, batch):
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    app = make_app(path, profile)
+
+    with app.app_context():
+        db.session.execute(insert(Article), article_rows(0, 5000))
+        db.session.commit()
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    stats = {'reads': 0, 'writes': 0, 'read_errors': 0, 'write_errors': 0}
+    latencies = []
+
+    def reader():
+        with app.app_context():
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    Article.query.filter_by(category='sports').order_by(
+                        Article.published_at.desc(), Article.id.desc()
+                    ).limit(20).all()
+                    db.session.rollback()
+                    elapsed = time.perf_counter() - start
+                    with lock:
+                        stats['reads'] += 1
+                        latencies.append(elapsed)
+                except OperationalError:
+                    db.session.rollback()
+                    with lock:
+                        stats['read_errors'] += 1
+
+    def writer(worker):
+        counter = 100000 * (worker + 1)
+        with app.app_context():
+            while not stop.is_set():
+                try:
+                    db.session.execute(insert(Article), article_rows(counter, batch))
+                    counter += batch
+                    # Mark a random slice translated, like a translation commit
+                    low = random.randint(1, 5000)
+                    db.session.execute(
+                        update(Article).where(Article.id.between(low, low + batch))
+                        .values(is_translated=True, title_translated='Izvještaj')
+                    )
+                    db.session.commit()
+                    with lock:
+                        stats['writes'] += 1
+                except OperationalError:
+                    db.session.rollback()
+                    with lock:
+                        stats['write_errors'] += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return dict(
+        stats,
+        profile=profile,
+        reads_per_sec=round(stats['reads'] / seconds, 1),
+        write_commits_per_sec=round(stats['writes'] / seconds, 1),
+        read_p50_ms=percentile(latencies, 50),
+        read_p99_ms=percentile(latencies, 99)
+    )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--batch', type=int, default=50)
+    parser.add_argument('--profile', choices=['default', 'tuned'])
+    args = parser.parse_args()
+
+    if args.profile:
+        print(json.dumps(run_profile(args.profile, args.seconds, args.readers, args.writers, args.batch)))
+        return
+
+    print(f'{args.readers} readers, {args.writers} writers ({args.batch}-row commits), {args.seconds:g}s per profile')
+    print(f'{"profile":<10}{"reads/s":>10}{"p50 ms":>9}{"p99 ms":>9}{"commits/s":>11}{"read err":>10}{"write err":>11}')
+    for profile in ('default', 'tuned'):
+        output = subprocess.run(
+            [sys.executable, __file__, '--profile', profile, '--seconds', str(args.seconds),
+             '--readers', str(args.readers), '--writers', str(args.writers), '--batch', str(args.batch)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f'{profile:<10}{result["reads_per_sec"]:>10}{result["read_p50_ms"]!s:>9}{result["read_p99_ms"]!s:>9}'
+              f'{result["write_commits_per_sec"]:>11}{result["read_errors"]:>10}{result["write_errors"]:>11}')
+
+if __name__ == '__main__':
+    main()
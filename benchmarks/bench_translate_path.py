@@ -0,0 +1,165 @@
+"""
+Offline load test of the whole article translation path.
+
+Ingests a synthetic article volume (shared agency boilerplate, syndicated
+near-duplicate stories) into a fresh SQLite database, then runs translate-all
+through ArticleTranslationService against the LibreTranslate stub with
+injected latency and failures. Reports throughput, client and server latency
+percentiles, what the provider was sent and how failures were absorbed.
+
+    python benchmarks/bench_translate_path.py [--articles 2000] [--executor threads|async] \\
+        [--latency-ms 80] [--error-rate 0.02] [--throttle-rate 0.02] [--timeout-rate 0] [--json out.json]
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import func, select
+from datagen import generate_articles
+from libretranslate_stub import add_stub_arguments, config_from_args, percentile, start_stub
+from src.models.user import db
+from src.models.article import Article
+from src.database.migrations import run_migrations
+from src.services.http_client import http_client
+from src.services.news_service import NewsService
+from src.services.ingestion_service import IngestionService
+from src.services.translation_cache import TranslationCache
+from src.services.translation_service import TranslationService
+from src.services.translation_providers import LibreTranslateProvider
+from src.services.translation_executor import TranslationExecutor, AsyncTranslationExecutor
+from src.services.article_translation_service import ArticleTranslationService
+
+def make_app(path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        run_migrations(db.engine)
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--articles', type=int, default=2000)
+    parser.add_argument('--duplicate-ratio', type=float, default=0.2)
+    parser.add_argument('--executor', choices=['threads', 'async'], default='threads')
+    parser.add_argument('--workers', type=int, default=8, help='Threads, or in-flight requests for async.')
+    parser.add_argument('--batch-size', type=int, default=50, help='Segments per provider request.')
+    parser.add_argument('--url', help='Use a running LibreTranslate-compatible server instead of the stub.')
+    parser.add_argument('--json', help='Write the results to this file.')
+    add_stub_arguments(parser)
+    parser.set_defaults(latency_ms=80, timeout_rate=0, hang_seconds=5, retry_after=0.2, seed=1)
+    args = parser.parse_args()
+
+    stub = None if args.url else start_stub(config_from_args(args))
+    url = args.url or stub.url
+
+    app = make_app(os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    payloads = generate_articles(args.articles, duplicate_ratio=args.duplicate_ratio)
+
+    with app.app_context():
+        start = time.perf_counter()
+        ingested = IngestionService(NewsService()).store_articles(payloads)
+        ingest_seconds = time.perf_counter() - start
+
+        # No on-disk translation memory, so earlier runs do not skew the numbers
+        service = TranslationService(
+            cache=TranslationCache(db_path=''),
+            providers=[LibreTranslateProvider((3.05, max(args.hang_seconds / 2, 1)), url)]
+        )
+        service.batch_size = args.batch_size
+        service.backoff_base = 0.05
+        for limiter in service.rate_limiters.values():
+            limiter.rate = 0
+
+        if args.executor == 'async':
+            executor = AsyncTranslationExecutor(service, args.workers)
+        else:
+            executor = TranslationExecutor(service, args.workers)
+        articles = ArticleTranslationService(executor)
+
+        # Time every work unit as the executor sees it, retries and failover included
+        batch_latencies = []
+        translate_batch, translate_batch_async = service.translate_batch, service.translate_batch_async
+
+        def timed_translate_batch(*batch_args):
+            batch_start = time.perf_counter()
+            try:
+                return translate_batch(*batch_args)
+            finally:
+                batch_latencies.append((time.perf_counter() - batch_start) * 1000)
+
+        async def timed_translate_batch_async(*batch_args):
+            batch_start = time.perf_counter()
+            try:
+                return await translate_batch_async(*batch_args)
+            finally:
+                batch_latencies.append((time.perf_counter() - batch_start) * 1000)
+
+        service.translate_batch = timed_translate_batch
+        service.translate_batch_async = timed_translate_batch_async
+
+        start = time.perf_counter()
+        translated = articles.translate_untranslated()
+        translate_seconds = time.perf_counter() - start
+        executor.shutdown()
+
+        untranslated = db.session.scalar(select(func.count(Article.id)).where(Article.is_translated == False))
+        demo = db.session.scalar(
+            select(func.count(Article.id)).where(Article.title_translated.like('%[DEMO PREVOD]%'))
+        )
+
+    host = url.split('://', 1)[1]
+    results = {
+        'config': {key: value for key, value in vars(args).items() if key != 'json'},
+        'ingest': {
+            'articles': args.articles,
+            'stored': ingested['new_articles'],
+            'near_duplicates': ingested['near_duplicate_articles'],
+            'seconds': round(ingest_seconds, 3)
+        },
+        'translate': {
+            'articles_translated': translated,
+            'articles_left_untranslated': untranslated,
+            'demo_fallbacks': demo,
+            'seconds': round(translate_seconds, 3),
+            'articles_per_second': round(translated / translate_seconds, 1) if translate_seconds else None,
+            'sentences': articles.get_stats(),
+            'batch_latency_ms': {
+                'count': len(batch_latencies),
+                'p50': percentile(batch_latencies, 50),
+                'p95': percentile(batch_latencies, 95),
+                'p99': percentile(batch_latencies, 99)
+            },
+            'providers': service.get_provider_health(),
+            'client': http_client.get_metrics().get(host)
+        },
+        'server': stub.stats.to_dict() if stub else None
+    }
+
+    print(f"{args.articles} articles ({ingested['near_duplicate_articles']} near-duplicates), "
+          f"{args.executor} executor, {args.workers} workers")
+    print(f"translated {translated} in {translate_seconds:.2f}s "
+          f"({results['translate']['articles_per_second']} articles/s); "
+          f"{untranslated} left untranslated, {demo} demo fallbacks")
+    sentences = results['translate']['sentences']
+    print(f"sentences: {sentences['sentences_seen']} seen, {sentences['sentences_distinct']} sent "
+          f"({sentences['dedup_rate']}% reused)")
+    latency = results['translate']['batch_latency_ms']
+    print(f"batch latency ms: p50 {latency['p50']:.1f}  p95 {latency['p95']:.1f}  p99 {latency['p99']:.1f}")
+    if stub:
+        server = results['server']
+        print(f"server: {server['requests']} requests, {server['characters']} chars, outcomes {server['outcomes']}, "
+              f"p99 {server['latency_ms']['p99']:.1f} ms, peak in flight {server['peak_in_flight']}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+
+if __name__ == '__main__':
+    main()
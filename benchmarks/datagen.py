@@ -0,0 +1,177 @@
+"""
+Synthetic sports articles for the benchmarks.
+
+`generate_articles` builds raw TheNewsAPI payloads (what ingestion receives);
+`bulk_load` writes article rows straight into a database, streaming in
+chunks so 10k to 10M rows load with constant memory.
+
+    python benchmarks/datagen.py --articles 1000000 --output /tmp/articles-1m.db
+"""
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TEAMS = ['Arsenal', 'Chelsea', 'Liverpool', 'Real Madrid', 'Barcelona', 'Bayern', 'Juventus', 'Lakers',
+         'Celtics', 'Warriors', 'Yankees', 'Dodgers', 'Chiefs', 'Eagles', 'Red Sox', 'Maple Leafs']
+VERBS = ['beat', 'edge', 'thrash', 'hold', 'stun', 'overcome', 'draw with', 'fall to']
+SOURCES = ['espn.com', 'bbc.co.uk', 'reuters.com', 'apnews.com', 'skysports.com', 'theathletic.com']
+BOILERPLATE = [
+    'Subscribe to our newsletter for the latest sports news.',
+    'Reporting by our sports desk; editing by the news team.',
+    'All rights reserved.',
+    'Follow us on social media for live updates.',
+]
+FILLER = ['The coach praised the defence after the game.', 'Fans packed the stadium despite the rain.',
+          'Injuries continue to trouble the squad.', 'The result moves them up the table.',
+          'A late penalty decided the contest.', 'The captain scored his tenth goal of the season.',
+          'Attendance reached a season high.', 'Both sides meet again next month.']
+
+def _story(rng: random.Random, number: int):
+    home, away = rng.sample(TEAMS, 2)
+    score = f'{rng.randint(0, 5)}-{rng.randint(0, 5)}'
+    title = f'{home} {rng.choice(VERBS)} {away} {score} in round {rng.randint(1, 38)} clash #{number}'
+    description = f'{home} and {away} met in front of {rng.randint(10, 90)},000 fans. {rng.choice(FILLER)}'
+    content = ' '.join(
+        rng.sample(FILLER, rng.randint(2, 4))
+        + [f'{home} manager spoke about match {number} afterwards.']
+        + rng.sample(BOILERPLATE, rng.randint(1, 3))
+    )
+    return title, description, content
+
+def generate_articles(count: int, seed: int = 7, duplicate_ratio: float = 0.2, prefix: str = 'bench',
+                      start: int = 0) -> List[Dict]:
+    """
+    Raw API payloads: every article has a few unique sentences, most carry
+    boilerplate, and `duplicate_ratio` of them re-publish an earlier story
+    with small wording changes under another source
+    """
+    rng = random.Random(seed)
+    base = datetime.utcnow() - timedelta(hours=6)
+    stories = []
+    articles = []
+
+    for i in range(start, start + count):
+        if stories and rng.random() < duplicate_ratio:
+            title, description, content = rng.choice(stories)
+            title = title.replace(' in ', ' during ') if ' in ' in title else title + ' (updated)'
+        else:
+            title, description, content = _story(rng, i)
+            stories.append((title, description, content))
+
+        articles.append({
+            'uuid': f'{prefix}-{seed}-{i}',
+            'title': title,
+            'description': description,
+            'snippet': content,
+            'url': f'https://example.com/articles/{i}',
+            'image_url': f'https://example.com/images/{i}.jpg',
+            'source': rng.choice(SOURCES),
+            'language': 'en',
+            'categories': ['sports'],
+            'published_at': (base + timedelta(seconds=i)).isoformat() + 'Z'
+        })
+
+    return articles
+
+def iter_article_rows(count: int, seed: int = 7, translated_ratio: float = 0.8,
+                      days: int = 365) -> Iterator[Dict]:
+    """
+    Article column values for `count` rows published over the last `days` days,
+    `translated_ratio` of them with translations
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    span = days * 24 * 3600
+
+    for i in range(count):
+        title, description, content = _story(rng, i)
+        published_at = now - timedelta(seconds=rng.randrange(span))
+        translated = rng.random() < translated_ratio
+        yield {
+            'uuid': f'row-{seed}-{i}',
+            'title': title,
+            'title_translated': f'[bs] {title}' if translated else None,
+            'description': description,
+            'description_translated': f'[bs] {description}' if translated else None,
+            'content': content,
+            'content_translated': f'[bs] {content}' if translated else None,
+            'url': f'https://example.com/articles/{i}',
+            'image_url': f'https://example.com/images/{i}.jpg',
+            'source': SOURCES[i % len(SOURCES)],
+            'language': 'en',
+            'category': 'sports',
+            'published_at': published_at,
+            'created_at': published_at + timedelta(minutes=5),
+            'translated_at': published_at + timedelta(minutes=10) if translated else None,
+            'is_translated': translated,
+        }
+
+def bulk_load(engine, count: int, seed: int = 7, translated_ratio: float = 0.8, chunk_size: int = 10000,
+              progress=None) -> int:
+    """
+    Create the schema (with migrations: indexes, counters, search index) and insert
+    `count` rows in chunked transactions; returns the number of rows inserted
+    """
+    from src.models.user import db
+    from src.models.article import Article
+    from src.database.migrations import run_migrations
+    from src.services.stats_service import rebuild_counters
+
+    db.metadata.create_all(engine)
+    run_migrations(engine)
+
+    inserted = 0
+    chunk = []
+    with engine.connect() as conn:
+        if engine.dialect.name == 'sqlite':
+            # Loading only: durability does not matter, speed does
+            conn.exec_driver_sql('PRAGMA synchronous=OFF')
+            conn.exec_driver_sql('PRAGMA journal_mode=WAL')
+            conn.commit()
+
+        for row in iter_article_rows(count, seed, translated_ratio):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                with conn.begin():
+                    conn.execute(Article.__table__.insert(), chunk)
+                inserted += len(chunk)
+                chunk = []
+                if progress:
+                    progress(inserted)
+        if chunk:
+            with conn.begin():
+                conn.execute(Article.__table__.insert(), chunk)
+            inserted += len(chunk)
+
+        with conn.begin():
+            rebuild_counters(conn)
+
+    return inserted
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--articles', type=int, default=10000)
+    parser.add_argument('--output', required=True, help='SQLite file to create.')
+    parser.add_argument('--translated-ratio', type=float, default=0.8)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+
+    if os.path.exists(args.output):
+        parser.error(f'{args.output} already exists')
+
+    start = time.perf_counter()
+    engine = create_engine(f'sqlite:///{args.output}')
+    count = bulk_load(engine, args.articles, args.seed, args.translated_ratio,
+                      progress=lambda done: print(f'\r{done} rows', end='', flush=True))
+    elapsed = time.perf_counter() - start
+    print(f'\rLoaded {count} rows in {elapsed:.1f}s ({count / elapsed:.0f} rows/s) into {args.output}')
+
+if __name__ == '__main__':
+    main()
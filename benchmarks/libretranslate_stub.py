@@ -0,0 +1,264 @@
+"""
+Local LibreTranslate-compatible server for offline runs, CI and load tests.
+
+Answers POST /translate (JSON or form body, string or list `q`) and
+GET /languages like LibreTranslate. Translations come from a phrase table
+(see `flask build-phrase-table`) when one is given, otherwise the text is
+returned with a `[target]` prefix. Latency and failures can be injected:
+
+    python benchmarks/libretranslate_stub.py --port 5001 --latency-ms 80 --latency-sigma 0.6 \\
+        --error-rate 0.02 --throttle-rate 0.05 --timeout-rate 0.01 --phrase-table phrase_table.tsv
+
+    LIBRETRANSLATE_URL=http://127.0.0.1:5001 LIBRETRANSLATE_RATE_LIMIT=0 python main.py
+
+GET /stats returns the request, error and latency counters.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.translation_providers import PhraseTable
+
+LANGUAGES = [
+    {'code': code, 'name': name, 'targets': ['en', 'hr', 'bs', 'sr', 'de', 'es', 'fr', 'it', 'pt', 'ru']}
+    for code, name in (('en', 'English'), ('hr', 'Croatian'), ('bs', 'Bosnian'), ('sr', 'Serbian'),
+                       ('de', 'German'), ('es', 'Spanish'), ('fr', 'French'), ('it', 'Italian'),
+                       ('pt', 'Portuguese'), ('ru', 'Russian'))
+]
+
+# Phrase table languages to try for a requested target
+TARGET_ALIASES = {'hr': ('hr', 'bs')}
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+class StubConfig:
+    """
+    Injected behaviour: lognormal latency around `latency_ms` (plus a per-character
+    cost), and per-request probabilities of a 500, a 429 with Retry-After, a hang
+    longer than client timeouts, or a malformed body
+    """
+
+    def __init__(self, latency_ms: float = 50, latency_sigma: float = 0.5, per_char_us: float = 0,
+                 error_rate: float = 0, throttle_rate: float = 0, retry_after: float = 0.5,
+                 timeout_rate: float = 0, hang_seconds: float = 20, malformed_rate: float = 0,
+                 phrase_table: Optional[PhraseTable] = None, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.per_char_us = per_char_us
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.malformed_rate = malformed_rate
+        self.phrase_table = phrase_table
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+
+    def draw(self, chars: int) -> Tuple[str, float]:
+        """
+        Pick the outcome of one request: (kind, seconds to wait before answering)
+        """
+        with self.random_lock:
+            roll = self.random.random()
+            latency = self.latency_ms / 1000
+            if self.latency_sigma > 0:
+                latency *= self.random.lognormvariate(0, self.latency_sigma)
+        latency += chars * self.per_char_us / 1_000_000
+
+        for kind, rate in (('error', self.error_rate), ('throttle', self.throttle_rate),
+                           ('timeout', self.timeout_rate), ('malformed', self.malformed_rate)):
+            if roll < rate:
+                return kind, (self.hang_seconds if kind == 'timeout' else latency)
+            roll -= rate
+        return 'ok', latency
+
+    def translate(self, text: str, source: str, target: str) -> str:
+        if self.phrase_table is not None:
+            # The app asks LibreTranslate for Croatian when it wants Bosnian
+            for code in TARGET_ALIASES.get(target, (target,)):
+                translated = self.phrase_table.translate(text, source, code)
+                if translated is not None:
+                    return translated
+        return f'[{target}] {text}'
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.segments = 0
+        self.characters = 0
+        self.outcomes: Dict[str, int] = {}
+        self.latencies_ms: List[float] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def to_dict(self) -> Dict:
+        with self.lock:
+            samples = list(self.latencies_ms)
+            return {
+                'requests': self.requests,
+                'segments': self.segments,
+                'characters': self.characters,
+                'outcomes': dict(self.outcomes),
+                'peak_in_flight': self.peak_in_flight,
+                'latency_ms': {
+                    'p50': percentile(samples, 50),
+                    'p95': percentile(samples, 95),
+                    'p99': percentile(samples, 99),
+                    'max': max(samples) if samples else None
+                }
+            }
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address, config: StubConfig):
+        super().__init__(address, StubHandler)
+        self.config = config
+        self.stats = StubStats()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.startswith('/languages'):
+            self._send_json(200, LANGUAGES)
+        elif self.path.startswith('/stats'):
+            self._send_json(200, self.server.stats.to_dict())
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if not self.path.startswith('/translate'):
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        try:
+            if 'application/json' in (self.headers.get('Content-Type') or ''):
+                payload = json.loads(body)
+            else:
+                payload = {key: values if key == 'q' and len(values) > 1 else values[0]
+                           for key, values in parse_qs(body.decode('utf-8')).items()}
+            texts = payload['q']
+            source, target = payload.get('source', 'auto'), payload['target']
+        except (KeyError, ValueError, IndexError):
+            self._send_json(400, {'error': 'Invalid request: q and target are required'})
+            return
+
+        batch = texts if isinstance(texts, list) else [texts]
+        chars = sum(len(text) for text in batch)
+        config, stats = self.server.config, self.server.stats
+
+        with stats.lock:
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+        start = time.perf_counter()
+        kind, delay = config.draw(chars)
+        time.sleep(delay)
+
+        with stats.lock:
+            stats.in_flight -= 1
+            stats.requests += 1
+            stats.segments += len(batch)
+            stats.characters += chars
+            stats.outcomes[kind] = stats.outcomes.get(kind, 0) + 1
+            stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        if kind == 'error':
+            self._send_json(500, {'error': 'Injected failure'})
+        elif kind == 'throttle':
+            self._send_json(429, {'error': 'Too many requests'}, {'Retry-After': str(config.retry_after)})
+        elif kind == 'malformed':
+            self._send_json(200, {'translatedText': batch[:-1] if len(batch) > 1 else None})
+        else:
+            translated = [config.translate(text, source, target) for text in batch]
+            self._send_json(200, {'translatedText': translated if isinstance(texts, list) else translated[0]})
+
+    def _send_json(self, status: int, payload, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (e.g. after an injected hang)
+            pass
+
+    def log_message(self, *args):
+        pass
+
+def start_stub(config: StubConfig, host: str = '127.0.0.1', port: int = 0) -> StubServer:
+    """
+    Serve the stub from a daemon thread; port 0 picks a free port (see server.url)
+    """
+    server = StubServer((host, port), config)
+    threading.Thread(target=server.serve_forever, name='libretranslate-stub', daemon=True).start()
+    return server
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--latency-ms', type=float, default=50, help='Median response time.')
+    parser.add_argument('--latency-sigma', type=float, default=0.5,
+                        help='Lognormal spread of the response time (0 for a fixed delay).')
+    parser.add_argument('--per-char-us', type=float, default=0, help='Extra microseconds per character.')
+    parser.add_argument('--error-rate', type=float, default=0, help='Share of requests answered with 500.')
+    parser.add_argument('--throttle-rate', type=float, default=0, help='Share answered with 429 and Retry-After.')
+    parser.add_argument('--retry-after', type=float, default=0.5)
+    parser.add_argument('--timeout-rate', type=float, default=0, help='Share that hang for --hang-seconds.')
+    parser.add_argument('--hang-seconds', type=float, default=20)
+    parser.add_argument('--malformed-rate', type=float, default=0, help='Share with a truncated translatedText.')
+    parser.add_argument('--phrase-table', help='TSV from `flask build-phrase-table` used for translations.')
+    parser.add_argument('--seed', type=int, default=None)
+
+def config_from_args(args) -> StubConfig:
+    table = None
+    if args.phrase_table:
+        table = PhraseTable()
+        table.load(args.phrase_table)
+    return StubConfig(
+        latency_ms=args.latency_ms, latency_sigma=args.latency_sigma, per_char_us=args.per_char_us,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+        timeout_rate=args.timeout_rate, hang_seconds=args.hang_seconds, malformed_rate=args.malformed_rate,
+        phrase_table=table, seed=args.seed
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5001)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubServer((args.host, args.port), config_from_args(args))
+    print(f'LibreTranslate stub listening on {server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Local TheNewsAPI-compatible server for offline runs and load tests.
+
+Serves GET /v1/news/headlines and GET /v1/news/all with freshly generated
+sports articles (new uuids on every call, so ingestion always has work), with
+the same latency and failure injection as the LibreTranslate stub:
+
+    python benchmarks/mock_newsapi.py --port 5002 --latency-ms 150 --error-rate 0.01
+
+    NEWS_API_BASE_URL=http://127.0.0.1:5002/v1/news NEWS_CACHE_TTL=0 python main.py
+
+GET /stats returns the request, error and latency counters.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import itertools
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datagen import generate_articles
+from libretranslate_stub import StubConfig, StubStats, add_stub_arguments, config_from_args
+
+class NewsApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address, config: StubConfig):
+        super().__init__(address, NewsApiHandler)
+        self.config = config
+        self.stats = StubStats()
+        self.batches = itertools.count()
+        self.batches_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/v1/news'
+
+    def next_articles(self, limit: int):
+        with self.batches_lock:
+            batch = next(self.batches)
+        return generate_articles(limit, seed=batch, duplicate_ratio=0.1, prefix='mock')
+
+class NewsApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path == '/stats':
+            self._send_json(200, self.server.stats.to_dict())
+            return
+        if parts.path not in ('/v1/news/headlines', '/v1/news/all'):
+            self._send_json(404, {'error': {'code': 'endpoint_not_found'}})
+            return
+
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        limit = min(int(query.get('limit', 10)), 100)
+        config, stats = self.server.config, self.server.stats
+
+        with stats.lock:
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+        start = time.perf_counter()
+        kind, delay = config.draw(0)
+        time.sleep(delay)
+        articles = self.server.next_articles(limit)
+
+        with stats.lock:
+            stats.in_flight -= 1
+            stats.requests += 1
+            stats.segments += len(articles)
+            stats.outcomes[kind] = stats.outcomes.get(kind, 0) + 1
+            stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        if kind == 'error':
+            self._send_json(500, {'error': {'code': 'server_error'}})
+        elif kind == 'throttle':
+            self._send_json(429, {'error': {'code': 'rate_limit_reached'}}, {'Retry-After': str(config.retry_after)})
+        elif kind == 'malformed':
+            self._send_json(200, {'meta': {}})
+        elif parts.path == '/v1/news/headlines':
+            self._send_json(200, {'data': {'sports': articles}})
+        else:
+            page = int(query.get('page', 1))
+            self._send_json(200, {
+                'meta': {'found': limit * 10, 'returned': len(articles), 'limit': limit, 'page': page},
+                'data': articles
+            })
+
+    def _send_json(self, status: int, payload, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+def start_mock_newsapi(config: StubConfig, host: str = '127.0.0.1', port: int = 0) -> NewsApiServer:
+    """
+    Serve the mock from a daemon thread; port 0 picks a free port (see server.url)
+    """
+    server = NewsApiServer((host, port), config)
+    threading.Thread(target=server.serve_forever, name='mock-newsapi', daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5002)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server = NewsApiServer((args.host, args.port), config_from_args(args))
+    print(f'TheNewsAPI mock listening on {server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,476 @@
+"""
+End-to-end benchmark suite for the ingestion, translation and read paths.
+
+For every table size in --scales the suite loads synthetic articles into a
+fresh SQLite database, starts the TheNewsAPI mock and the LibreTranslate stub
+with the given latencies, and measures through the real blueprint and
+services:
+
+    get_articles, get_articles_deep_page, get_articles_cursor, get_articles_fields,
+    get_articles_cached, get_stats, search      (HTTP GETs through the Flask test client)
+    fetch_news                                  (fetch_news job: mock API -> ingestion)
+    translate_all                               (translate_all job: untranslated rows -> stub)
+
+translate_all resets a fixed set of --translate-limit articles to untranslated
+before every (untimed) call, so each measured operation translates that many
+articles instead of draining the backlog during warmup.
+
+Each scale runs in its own process. Per scenario it reports throughput
+(operations/s, or articles/s for translate_all), p50/p95/p99/max latency, the peak Python allocation per operation and the
+process RSS. Results are written as JSON; with --baseline the run is compared
+against stored results and exits with status 1 on a regression.
+
+    python benchmarks/run_suite.py --scales 10k,100k [--requests 300] [--concurrency 4] \\
+        [--output results.json] [--baseline baseline.json] [--tolerance 0.25] [--save-baseline baseline.json]
+
+Large scales take a while to generate; --data-dir keeps the generated
+databases (copied before every run) so 1M-10M rows are only built once.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import platform
+import argparse
+import itertools
+import threading
+import subprocess
+import tempfile
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import resource
+except ImportError:  # not available on Windows; RSS is reported as None
+    resource = None
+
+from datagen import TEAMS, bulk_load
+from libretranslate_stub import StubConfig, percentile, start_stub
+from mock_newsapi import start_mock_newsapi
+
+RESULT_MARKER = 'SUITE_RESULT '
+
+# Metrics compared against the baseline: (name, True when larger is worse)
+COMPARED_METRICS = (('p50_ms', True), ('p95_ms', True), ('throughput', False))
+
+def parse_scale(value: str) -> int:
+    multipliers = {'k': 1_000, 'm': 1_000_000}
+    value = value.strip().lower()
+    if value and value[-1] in multipliers:
+        return int(float(value[:-1]) * multipliers[value[-1]])
+    return int(value)
+
+def _rss_mib() -> Optional[float]:
+    if resource is None:
+        return None
+    # KiB on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor, 1)
+
+def measure(app, op: Callable[[], None], ops: int, concurrency: int = 1, warmup: int = 5,
+            memory_samples: int = 10, setup: Optional[Callable[[], None]] = None,
+            items_per_op: int = 1, unit: str = 'ops') -> Dict:
+    """
+    Run `op` `ops` times from `concurrency` threads, each call inside an app context.
+
+    `setup` runs untimed before every call (single-threaded only, so its time
+    can be taken out of the wall clock); throughput counts `items_per_op`
+    `unit`s per operation.
+    """
+    if setup and concurrency > 1:
+        raise ValueError('setup needs concurrency 1')
+
+    def call(fn: Callable[[], None]):
+        with app.app_context():
+            fn()
+
+    setup_seconds = [0.0]
+
+    def prepare():
+        if setup:
+            start = time.perf_counter()
+            call(setup)
+            setup_seconds[0] += time.perf_counter() - start
+
+    for _ in range(warmup):
+        prepare()
+        call(op)
+
+    latencies: List[float] = []
+    errors = []
+    lock = threading.Lock()
+    counter = itertools.count()
+
+    def worker():
+        while next(counter) < ops:
+            try:
+                prepare()
+            except Exception as e:
+                with lock:
+                    errors.append(repr(e))
+                continue
+            start = time.perf_counter()
+            try:
+                call(op)
+            except Exception as e:
+                with lock:
+                    errors.append(repr(e))
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                latencies.append(elapsed)
+
+    setup_seconds[0] = 0.0
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(max(concurrency, 1))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start - setup_seconds[0]
+
+    # Separate pass: tracing allocations would distort the timings above
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(memory_samples, ops)):
+            prepare()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            call(op)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops': len(latencies),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'seconds': round(seconds, 3),
+        'throughput': round(len(latencies) * items_per_op / seconds, 1) if seconds else None,
+        'throughput_unit': f'{unit}/s',
+        'p50_ms': _round(percentile(latencies, 50)),
+        'p95_ms': _round(percentile(latencies, 95)),
+        'p99_ms': _round(percentile(latencies, 99)),
+        'max_ms': _round(max(latencies) if latencies else None),
+        'memory_peak_kib': round(percentile(peaks, 50) / 1024, 1) if peaks else None,
+        'rss_mib': _rss_mib()
+    }
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+def prepare_database(scale: int, data_dir: Optional[str], workdir: str) -> str:
+    """
+    Return a private database file with `scale` articles, generated or copied from --data-dir
+    """
+    from sqlalchemy import create_engine
+
+    path = os.path.join(workdir, 'articles.db')
+    cached = os.path.join(data_dir, f'articles-{scale}.db') if data_dir else None
+
+    if cached and os.path.exists(cached):
+        shutil.copyfile(cached, path)
+        return path
+
+    target = cached or path
+    if cached:
+        os.makedirs(data_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    engine = create_engine(f'sqlite:///{target}')
+    bulk_load(engine, scale)
+    # Fold the WAL into the main file so the copy below is complete
+    with engine.connect() as conn:
+        conn.exec_driver_sql('PRAGMA wal_checkpoint(TRUNCATE)')
+    engine.dispose()
+    print(f'[{scale}] generated {scale} articles in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+
+    if cached:
+        shutil.copyfile(cached, path)
+    return path
+
+def run_scale(args) -> Dict:
+    """
+    Worker process: set up one table size and run every selected scenario
+    """
+    logging.basicConfig(level=logging.ERROR)
+    workdir = tempfile.mkdtemp(prefix='bench-suite-')
+    db_path = prepare_database(args.scale, args.data_dir, workdir)
+
+    news_api = start_mock_newsapi(StubConfig(latency_ms=args.news_latency_ms, latency_sigma=0.3, seed=1))
+    translator = start_stub(StubConfig(latency_ms=args.translate_latency_ms, latency_sigma=0.3, seed=2))
+
+    # The service singletons read their configuration at import time
+    os.environ.update({
+        'NEWS_API_BASE_URL': news_api.url,
+        'NEWS_CACHE_TTL': '0',
+        'LIBRETRANSLATE_URL': translator.url,
+        'LIBRETRANSLATE_RATE_LIMIT': '0',
+        'TRANSLATION_PROVIDERS': 'libretranslate',
+        'TRANSLATION_CACHE_PATH': '',
+        # Measure the handlers, not the response cache (get_articles_cached turns it on)
+        'RESPONSE_CACHE_TTL': '0',
+    })
+
+    from flask import Flask
+    from sqlalchemy import func, select, update
+    from src.models.user import db
+    from src.models.article import Article
+    from src.database.config import get_engine_options, tune_engine
+    from src.services.response_cache import response_cache
+    from src.routes.news import news_bp, ingestion_service, article_translation_service, translation_service
+
+    app = Flask(__name__)
+    app.register_blueprint(news_bp, url_prefix='/api/news')
+    uri = f'sqlite:///{db_path}'
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = get_engine_options(uri)
+    db.init_app(app)
+    tune_engine(db, app)
+
+    with app.app_context():
+        translated = db.session.scalar(select(func.count(Article.id)).where(Article.is_translated == True))
+        # The lowest canonical ids, which translate_untranslated picks first once reset
+        backlog_ids = db.session.scalars(
+            select(Article.id).where(Article.canonical_id.is_(None)).order_by(Article.id).limit(args.translate_limit)
+        ).all()
+
+    client = app.test_client()
+
+    def get(url: str) -> Callable[[], None]:
+        def op():
+            response = client.get(url)
+            if response.status_code != 200:
+                raise RuntimeError(f'GET {url} returned {response.status_code}')
+        return op
+
+    def cursor_walk() -> Callable[[], None]:
+        state = {'cursor': None}
+        lock = threading.Lock()
+
+        def op():
+            with lock:
+                cursor = state['cursor']
+            url = '/api/news/articles?per_page=20&pagination=cursor'
+            response = client.get(url + (f'&cursor={cursor}' if cursor else ''))
+            if response.status_code != 200:
+                raise RuntimeError(f'GET {url} returned {response.status_code}')
+            with lock:
+                state['cursor'] = response.get_json()['pagination']['next_cursor']
+        return op
+
+    def search() -> Callable[[], None]:
+        terms = itertools.cycle(TEAMS)
+
+        def op():
+            get(f'/api/news/search?q={next(terms)}')()
+        return op
+
+    def cached(op: Callable[[], None]) -> Callable[[], None]:
+        def run():
+            response_cache.ttl = 30
+            try:
+                op()
+            finally:
+                response_cache.ttl = 0
+        return run
+
+    def reset_backlog():
+        db.session.execute(
+            update(Article).where(Article.id.in_(backlog_ids)).values(is_translated=False, translated_at=None)
+        )
+        db.session.commit()
+        # Translate through the provider each time, not from the previous call's memory
+        translation_service.cache.clear()
+
+    def translate_backlog():
+        count = article_translation_service.translate_untranslated(len(backlog_ids))
+        if count != len(backlog_ids):
+            raise RuntimeError(f'translate_all translated {count} of {len(backlog_ids)} articles')
+
+    deep_page = max(translated // 20 // 2, 1)
+    read_ops, write_ops = args.requests, args.write_ops
+
+    # name -> (operation, count, concurrency); writes run last because they change the data
+    scenarios = {
+        'get_articles': (get('/api/news/articles?per_page=20'), read_ops, args.concurrency),
+        'get_articles_deep_page': (get(f'/api/news/articles?per_page=20&page={deep_page}'), read_ops, args.concurrency),
+        'get_articles_cursor': (cursor_walk(), read_ops, 1),
+        'get_articles_fields': (
+            get('/api/news/articles?per_page=50&fields=id,title_translated,published_at'), read_ops, args.concurrency
+        ),
+        'get_articles_cached': (cached(get('/api/news/articles?per_page=20')), read_ops, args.concurrency),
+        'get_stats': (get('/api/news/stats'), read_ops, args.concurrency),
+        'search': (search(), read_ops, args.concurrency),
+        'fetch_news': (lambda: ingestion_service.fetch_and_store('us', 'en', 20), write_ops, 1),
+        'translate_all': (translate_backlog, write_ops, 1),
+    }
+    # Extra measure() arguments per scenario
+    options = {
+        'translate_all': {'setup': reset_backlog, 'items_per_op': len(backlog_ids), 'unit': 'articles'},
+    }
+
+    selected = args.scenarios.split(',') if args.scenarios else list(scenarios)
+    unknown = set(selected) - set(scenarios)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in selected:
+        op, ops, concurrency = scenarios[name]
+        results[name] = measure(app, op, ops, concurrency, memory_samples=args.memory_samples, **options.get(name, {}))
+        print(f"[{args.scale}] {name}: {results[name]['throughput']} {results[name]['throughput_unit']}, "
+              f"p95 {results[name]['p95_ms']} ms", file=sys.stderr)
+
+    results['_upstreams'] = {'news_api': news_api.stats.to_dict(), 'translator': translator.stats.to_dict()}
+    shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """
+    Compare two suite results; returns one row per compared metric with a `regression` flag
+    """
+    rows = []
+    for scale, scenarios in current['results'].items():
+        for name, result in scenarios.items():
+            base = baseline.get('results', {}).get(scale, {}).get(name)
+            if name.startswith('_') or not base:
+                continue
+            for metric, larger_is_worse in COMPARED_METRICS:
+                before, after = base.get(metric), result.get(metric)
+                # Throughput in different units (e.g. a baseline from before articles/s) is not comparable
+                if metric == 'throughput' and \
+                        base.get('throughput_unit', 'ops/s') != result.get('throughput_unit', 'ops/s'):
+                    continue
+                if not before or after is None:
+                    continue
+                change = (after - before) / before
+                regression = change > tolerance if larger_is_worse else change < -tolerance
+                rows.append({
+                    'scale': scale, 'scenario': name, 'metric': metric,
+                    'baseline': before, 'current': after,
+                    'change_pct': round(change * 100, 1), 'regression': regression
+                })
+            if result.get('errors', 0) > base.get('errors', 0):
+                rows.append({
+                    'scale': scale, 'scenario': name, 'metric': 'errors',
+                    'baseline': base.get('errors', 0), 'current': result['errors'],
+                    'change_pct': None, 'regression': True
+                })
+    return rows
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def print_results(results: Dict):
+    header = f"{'scale':>9}  {'scenario':<24}{'ops':>6}{'throughput':>18}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}" \
+             f"{'KiB/op':>9}{'errors':>8}"
+    print(header)
+    for scale, scenarios in results.items():
+        for name, result in scenarios.items():
+            if name.startswith('_'):
+                continue
+            throughput = f"{result['throughput']} {result.get('throughput_unit', 'ops/s')}"
+            print(f"{scale:>9}  {name:<24}{result['ops']:>6}{throughput:>18}{result['p50_ms']:>9}"
+                  f"{result['p95_ms']:>9}{result['p99_ms']:>9}{result['memory_peak_kib']!s:>9}{result['errors']:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='10k', help='Comma-separated table sizes, e.g. 10k,100k,1M,10M.')
+    parser.add_argument('--scenarios', help='Comma-separated subset of scenarios to run.')
+    parser.add_argument('--requests', type=int, default=300, help='Operations per read scenario.')
+    parser.add_argument('--write-ops', type=int, default=10, help='Operations per fetch/translate scenario.')
+    parser.add_argument('--concurrency', type=int, default=4, help='Client threads for read scenarios.')
+    parser.add_argument('--translate-limit', type=int, default=200, help='Articles per translate_all operation.')
+    parser.add_argument('--memory-samples', type=int, default=10)
+    parser.add_argument('--news-latency-ms', type=float, default=100)
+    parser.add_argument('--translate-latency-ms', type=float, default=80)
+    parser.add_argument('--data-dir', help='Keep generated databases here and reuse them.')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/suite-<time>.json).')
+    parser.add_argument('--baseline', help='Compare against this results file; exit 1 on regression.')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative change before failing.')
+    parser.add_argument('--save-baseline', help='Also write the results to this file as the new baseline.')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--scale', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(RESULT_MARKER + json.dumps(run_scale(args)))
+        return
+
+    passthrough = [
+        '--requests', str(args.requests), '--write-ops', str(args.write_ops),
+        '--concurrency', str(args.concurrency), '--translate-limit', str(args.translate_limit),
+        '--memory-samples', str(args.memory_samples), '--news-latency-ms', str(args.news_latency_ms),
+        '--translate-latency-ms', str(args.translate_latency_ms)
+    ]
+    if args.scenarios:
+        passthrough += ['--scenarios', args.scenarios]
+    if args.data_dir:
+        passthrough += ['--data-dir', args.data_dir]
+
+    results = {}
+    for scale in (parse_scale(value) for value in args.scales.split(',')):
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--worker', '--scale', str(scale)] + passthrough,
+            stdout=subprocess.PIPE, text=True
+        )
+        lines = [line for line in completed.stdout.splitlines() if line.startswith(RESULT_MARKER)]
+        if completed.returncode != 0 or not lines:
+            raise SystemExit(f'Scale {scale} failed with exit code {completed.returncode}')
+        results[str(scale)] = json.loads(lines[-1][len(RESULT_MARKER):])
+
+    report = {
+        'meta': {
+            'started_at': datetime.utcnow().isoformat() + 'Z',
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'config': {key: value for key, value in vars(args).items()
+                       if key not in ('worker', 'scale', 'output', 'baseline', 'save_baseline')}
+        },
+        'results': results
+    }
+
+    print_results(results)
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'results', f"suite-{datetime.utcnow():%Y%m%dT%H%M%SZ}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'Results written to {output}')
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Baseline saved to {args.save_baseline}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            rows = compare(report, json.load(f), args.tolerance)
+        regressions = [row for row in rows if row['regression']]
+        for row in rows:
+            flag = 'REGRESSION' if row['regression'] else 'ok'
+            change = f"{row['change_pct']:+.1f}%" if row['change_pct'] is not None else ''
+            print(f"{row['scale']:>9}  {row['scenario']:<24}{row['metric']:<12}"
+                  f"{row['baseline']!s:>10} -> {row['current']!s:<10}{change:>9}  {flag}")
+        if regressions:
+            print(f'{len(regressions)} regression(s) beyond {args.tolerance:.0%} of the baseline')
+            sys.exit(1)
+        print(f'No regressions beyond {args.tolerance:.0%} of the baseline')
+
+if __name__ == '__main__':
+    main()
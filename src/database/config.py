@@ -0,0 +1,147 @@
+import os
+import threading
+from typing import Dict
+import logging
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+logger = logging.getLogger(__name__)
+
+# Applied to every new SQLite connection, in order
+SQLITE_PRAGMAS = (
+    # Readers keep working while a writer commits
+    ('journal_mode', os.getenv('SQLITE_JOURNAL_MODE', 'WAL')),
+    # Durable at checkpoints; safe with WAL and far fewer fsyncs than FULL
+    ('synchronous', os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')),
+    # Wait for the write lock instead of failing with "database is locked"
+    ('busy_timeout', int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))),
+    ('mmap_size', int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))),
+    # Negative values are KiB: 64 MiB page cache per connection
+    ('cache_size', int(os.getenv('SQLITE_CACHE_SIZE', -64000))),
+    ('temp_store', 'MEMORY'),
+)
+
+def get_database_uri(default_path: str) -> str:
+    """
+    DATABASE_URL when set (e.g. postgresql://...), otherwise the SQLite file at `default_path`
+    """
+    return os.getenv('DATABASE_URL') or f'sqlite:///{default_path}'
+
+def get_engine_options(uri: str) -> Dict:
+    """
+    Pool settings for the configured database
+    """
+    url = make_url(uri)
+    if url.get_backend_name() == 'sqlite':
+        if url.database in (None, '', ':memory:'):
+            # In-memory databases use a single-connection pool
+            return {}
+        # Many reader connections; writes are serialized by SQLiteWriteLock
+        return {
+            'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+            'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+            'connect_args': {'timeout': SQLiteWriteLock.timeout()},
+        }
+
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_pre_ping': True,
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+    }
+
+def configure_database(app, default_path: str):
+    """
+    Set the database URI and engine options on the app (call before db.init_app)
+    """
+    uri = get_database_uri(default_path)
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', get_engine_options(uri))
+
+def apply_sqlite_pragmas(engine: Engine):
+    """
+    Run SQLITE_PRAGMAS on every connection the engine opens
+    """
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in SQLITE_PRAGMAS:
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
+# Statements that need SQLite's write lock
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'CREATE', 'DROP', 'ALTER')
+
+class SQLiteWriteLock:
+    """
+    Single-writer strategy: a process-wide lock taken by a connection at its
+    first write statement and released when its transaction ends.
+
+    SQLite allows one writer at a time. Without this, writer threads compete
+    inside SQLite's busy handler, which polls with sleeps and gives up with
+    "database is locked". With it, they queue on a Python lock and reach SQLite
+    one at a time, while readers use the other pooled connections against the WAL
+    snapshot without blocking. The lock is hooked into the engine, so ORM
+    flushes, Core statements on session.connection() and engine.begin() blocks
+    all take it. Writers in other processes are still handled by busy_timeout.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def timeout() -> float:
+        return int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000)) / 1000
+
+    def acquire(self, info: Dict):
+        if info.get('sqlite_write_lock'):
+            return
+        if not self._lock.acquire(timeout=self.timeout()):
+            # Fall through to SQLite's own locking rather than deadlock
+            logger.warning('Timed out waiting for the SQLite write lock')
+            return
+        info['sqlite_write_lock'] = True
+
+    def release(self, info: Dict):
+        if info.pop('sqlite_write_lock', False):
+            self._lock.release()
+
+    def install(self, engine: Engine):
+        """
+        Hook the lock into an engine's connections (info is per pooled connection)
+        """
+        @event.listens_for(engine, 'before_cursor_execute')
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip()[:7].upper().startswith(WRITE_STATEMENTS):
+                self.acquire(conn.info)
+
+        @event.listens_for(engine, 'commit')
+        def on_commit(conn):
+            self.release(conn.info)
+
+        @event.listens_for(engine, 'rollback')
+        def on_rollback(conn):
+            self.release(conn.info)
+
+        # Connections returned to the pool mid-transaction are rolled back by the pool
+        @event.listens_for(engine, 'checkin')
+        def on_checkin(dbapi_connection, connection_record):
+            self.release(connection_record.info)
+
+sqlite_write_lock = SQLiteWriteLock()
+
+def tune_engine(db, app):
+    """
+    Apply the SQLite profile to the app's engine and sessions; no-op for other databases
+    """
+    with app.app_context():
+        engine = db.engine
+
+    if engine.dialect.name != 'sqlite':
+        return
+
+    apply_sqlite_pragmas(engine)
+    sqlite_write_lock.install(engine)
+    logger.info('SQLite tuning applied: ' + ', '.join(f'{name}={value}' for name, value in SQLITE_PRAGMAS))
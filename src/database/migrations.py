@@ -0,0 +1,202 @@
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Set, Tuple
+import logging
+import click
+from sqlalchemy import Column, Integer, MetaData, String, Table, DateTime, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import visitors
+from src.models.article import Article
+from src.models.feed_watermark import FeedWatermark
+from src.models.job import Job
+from src.services.stats_service import rebuild_counters
+from src.services.search_service import create_search_index
+
+logger = logging.getLogger(__name__)
+
+# Bookkeeping table recording which migrations ran
+_metadata = MetaData()
+schema_migrations = Table(
+    'schema_migrations', _metadata,
+    Column('version', Integer, primary_key=True),
+    Column('name', String(200), nullable=False),
+    Column('applied_at', DateTime, nullable=False)
+)
+
+def _create_missing_indexes(table) -> Callable[[Connection], None]:
+    """
+    Migration step creating every index declared on `table` that the database lacks
+    """
+    def step(conn: Connection):
+        existing = {column['name'] for column in inspect(conn).get_columns(table.name)}
+        for index in table.indexes:
+            # Indexes on columns added by a later migration are created by that migration
+            if all(column.name in existing for column in _index_columns(index)):
+                index.create(conn, checkfirst=True)
+    return step
+
+def _index_columns(index) -> Set:
+    """
+    Columns an index covers, including the ones in a partial index's WHERE clause
+    """
+    columns = set(index.columns)
+    for dialect in ('sqlite', 'postgresql'):
+        where = index.dialect_options[dialect].get('where')
+        if where is not None:
+            columns.update(element for element in visitors.iterate(where) if isinstance(element, Column))
+    return columns
+
+def _recreate_index(table, index_name: str) -> Callable[[Connection], None]:
+    """
+    Migration step replacing an index whose definition changed (e.g. a partial index's WHERE clause)
+    """
+    def step(conn: Connection):
+        index = next(index for index in table.indexes if index.name == index_name)
+        conn.exec_driver_sql(f'DROP INDEX IF EXISTS {index_name}')
+        index.create(conn)
+    return step
+
+def _add_missing_column(table, column_name: str) -> Callable[[Connection], None]:
+    """
+    Migration step adding a column declared on `table` to databases created before it existed
+    """
+    def step(conn: Connection):
+        inspector = inspect(conn)
+        # A table created later by create_all already has the column
+        if not inspector.has_table(table.name):
+            return
+        if column_name in {column['name'] for column in inspector.get_columns(table.name)}:
+            return
+        column = table.c[column_name]
+        column_type = column.type.compile(dialect=conn.dialect)
+        references = ''.join(
+            f' REFERENCES {fk.column.table.name} ({fk.column.name})' for fk in column.foreign_keys
+        )
+        conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {column_name} {column_type}{references}')
+    return step
+
+def _steps(*steps: Callable[[Connection], None]) -> Callable[[Connection], None]:
+    def step(conn: Connection):
+        for run in steps:
+            run(conn)
+    return step
+
+# Append-only list of (version, name, step); never renumber or edit applied entries
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, 'article hot-path indexes', _create_missing_indexes(Article.__table__)),
+    (2, 'backfill article counters', rebuild_counters),
+    (3, 'article full-text search index', create_search_index),
+    (4, 'article translated_at index', _create_missing_indexes(Article.__table__)),
+    (5, 'article canonical_id for near-duplicates', _steps(
+        _add_missing_column(Article.__table__, 'canonical_id'),
+        _create_missing_indexes(Article.__table__)
+    )),
+    (6, 'feed watermark backfill checkpoint', _steps(
+        _add_missing_column(FeedWatermark.__table__, 'backfill_before'),
+        _add_missing_column(FeedWatermark.__table__, 'pending_published_at'),
+        _add_missing_column(FeedWatermark.__table__, 'pending_uuid')
+    )),
+    (7, 'job heartbeat', _add_missing_column(Job.__table__, 'heartbeat_at')),
+    (8, 'partial indexes for the canonical translate backlog', _steps(
+        _recreate_index(Article.__table__, 'ix_article_untranslated'),
+        _recreate_index(Article.__table__, 'ix_article_canonical_id')
+    )),
+]
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    Apply pending migrations in order, each in its own transaction; returns applied versions
+    """
+    _metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        applied = {row[0] for row in conn.execute(select(schema_migrations.c.version))}
+
+    newly_applied = []
+    for version, name, step in MIGRATIONS:
+        if version in applied:
+            continue
+
+        with engine.begin() as conn:
+            step(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=version, name=name, applied_at=datetime.utcnow()
+            ))
+
+        logger.info(f"Applied migration {version}: {name}")
+        newly_applied.append(version)
+
+    return newly_applied
+
+def explain_hot_queries(engine: Engine) -> Dict[str, Dict]:
+    """
+    Run EXPLAIN QUERY PLAN (SQLite only) for the hot Article queries and report index usage
+    """
+    if engine.dialect.name != 'sqlite':
+        raise RuntimeError('EXPLAIN QUERY PLAN is only available on SQLite')
+
+    article = Article.__table__
+    week_ago = datetime.utcnow() - timedelta(days=7)
+
+    queries = {
+        'articles_translated': (
+            select(article).where(article.c.category == 'sports', article.c.is_translated == True)
+            .order_by(article.c.published_at.desc(), article.c.id.desc()).limit(20),
+            'ix_article_category_translated_published'
+        ),
+        'articles_all': (
+            select(article).where(article.c.category == 'sports')
+            .order_by(article.c.published_at.desc(), article.c.id.desc()).limit(20),
+            'ix_article_category_published'
+        ),
+        'stats_recent': (
+            select(article.c.id).where(article.c.created_at >= week_ago),
+            'ix_article_created_at'
+        ),
+        'translate_backlog': (
+            select(article)
+            .where(article.c.is_translated == False, article.c.canonical_id.is_(None), article.c.id > 0)
+            .order_by(article.c.id).limit(200),
+            'ix_article_untranslated'
+        ),
+        'article_duplicates': (
+            select(article.c.id).where(article.c.canonical_id == 1).order_by(article.c.canonical_id),
+            'ix_article_canonical_id'
+        ),
+    }
+
+    report = {}
+    with engine.connect() as conn:
+        for name, (query, expected_index) in queries.items():
+            sql = str(query.compile(dialect=engine.dialect, compile_kwargs={'literal_binds': True}))
+            plan = [row[-1] for row in conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}')]
+            report[name] = {
+                'expected_index': expected_index,
+                'uses_index': any(expected_index in step for step in plan),
+                'temp_sort': any('USE TEMP B-TREE' in step for step in plan),
+                'plan': plan
+            }
+
+    return report
+
+def register_commands(app):
+    """
+    Add `flask migrate` and `flask check-indexes` commands
+    """
+    from src.models.user import db
+
+    @app.cli.command('migrate')
+    def migrate_command():
+        """Apply pending schema migrations."""
+        applied = run_migrations(db.engine)
+        click.echo(f"Applied migrations: {applied}" if applied else 'Database is up to date')
+
+    @app.cli.command('check-indexes')
+    def check_indexes_command():
+        """Verify the hot queries use their indexes (EXPLAIN QUERY PLAN)."""
+        ok = True
+        for name, result in explain_hot_queries(db.engine).items():
+            status = 'ok' if result['uses_index'] and not result['temp_sort'] else 'MISSING'
+            ok = ok and status == 'ok'
+            click.echo(f"{name}: {status} ({'; '.join(result['plan'])})")
+        if not ok:
+            raise SystemExit(1)
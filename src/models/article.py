@@ -20,6 +20,8 @@ class Article(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     translated_at = db.Column(db.DateTime, nullable=True)
     is_translated = db.Column(db.Boolean, nullable=False, default=False)
+    # Set on near-duplicates to the article that represents their story; NULL on canonical rows
+    canonical_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=True)
 
     def __repr__(self):
         return f'<Article {self.title[:50]}...>'
@@ -42,6 +44,50 @@ class Article(db.Model):
             'published_at': self.published_at.isoformat() if self.published_at else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'translated_at': self.translated_at.isoformat() if self.translated_at else None,
-            'is_translated': self.is_translated
+            'is_translated': self.is_translated,
+            'canonical_id': self.canonical_id
         }
 
+
+# Indexes for the hot queries; existing databases receive them through
+# src/database/migrations.py because db.create_all() skips existing tables.
+
+# Listing with translated_only (filter on category/is_translated, keyset on published_at, id)
+db.Index(
+    'ix_article_category_translated_published',
+    Article.category,
+    Article.is_translated,
+    Article.published_at.desc(),
+    Article.id.desc()
+)
+
+# Listing without the translation filter
+db.Index(
+    'ix_article_category_published',
+    Article.category,
+    Article.published_at.desc(),
+    Article.id.desc()
+)
+
+# Recent-articles window in /stats
+db.Index('ix_article_created_at', Article.created_at)
+
+# The event stream tails recently translated rows
+db.Index('ix_article_translated_at', Article.translated_at)
+
+# Duplicates of a canonical article, for collapsed listings. Partial, so it only
+# holds the duplicates and the planner never picks it for canonical_id IS NULL
+db.Index(
+    'ix_article_canonical_id',
+    Article.canonical_id,
+    sqlite_where=Article.canonical_id.isnot(None),
+    postgresql_where=Article.canonical_id.isnot(None)
+)
+
+# translate-all scans untranslated canonical rows by id; the partial index only holds that backlog
+db.Index(
+    'ix_article_untranslated',
+    Article.id,
+    sqlite_where=(Article.is_translated == False) & Article.canonical_id.is_(None),
+    postgresql_where=(Article.is_translated == False) & Article.canonical_id.is_(None)
+)
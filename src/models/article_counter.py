@@ -0,0 +1,22 @@
+from src.models.user import db
+
+class ArticleCounter(db.Model):
+    """
+    Running totals behind /api/news/stats.
+
+    `scope` is one of total, translated, category, source, day or translated_day;
+    `key` is the category/source name or ISO date ('' for the global totals).
+    """
+    scope = db.Column(db.String(20), primary_key=True)
+    key = db.Column(db.String(200), primary_key=True, default='')
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<ArticleCounter {self.scope}:{self.key}={self.value}>'
+
+    def to_dict(self):
+        return {
+            'scope': self.scope,
+            'key': self.key,
+            'value': self.value
+        }
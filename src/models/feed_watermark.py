@@ -0,0 +1,28 @@
+from datetime import datetime
+from src.models.user import db
+
+class FeedWatermark(db.Model):
+    feed_key = db.Column(db.String(50), primary_key=True)
+    last_published_at = db.Column(db.DateTime, nullable=True)
+    last_uuid = db.Column(db.String(100), nullable=True)
+    last_polled_at = db.Column(db.DateTime, nullable=True)
+    # Checkpoint of a page walk that stopped before reaching last_published_at:
+    # everything from backfill_before up to pending_published_at is stored
+    backfill_before = db.Column(db.DateTime, nullable=True)
+    pending_published_at = db.Column(db.DateTime, nullable=True)
+    pending_uuid = db.Column(db.String(100), nullable=True)
+    articles_ingested = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<FeedWatermark {self.feed_key} {self.last_published_at}>'
+
+    def to_dict(self):
+        return {
+            'feed_key': self.feed_key,
+            'last_published_at': self.last_published_at.isoformat() if self.last_published_at else None,
+            'last_uuid': self.last_uuid,
+            'last_polled_at': self.last_polled_at.isoformat() if self.last_polled_at else None,
+            'articles_ingested': self.articles_ingested,
+            'backfill_before': self.backfill_before.isoformat() if self.backfill_before else None,
+            'pending_published_at': self.pending_published_at.isoformat() if self.pending_published_at else None
+        }
@@ -1,8 +1,25 @@
-from flask import Blueprint, jsonify, request
-from datetime import datetime, timedelta
+from flask import Blueprint, Response, jsonify, request, stream_with_context, url_for
+from datetime import datetime
 from src.models.article import Article, db
 from src.services.news_service import NewsService
 from src.services.translation_service import TranslationService
+from src.services.translation_executor import create_translation_executor
+from src.services.article_translation_service import ArticleTranslationService
+from src.services.ingestion_service import IngestionService, parse_feeds
+from src.models.feed_watermark import FeedWatermark
+from src.services.scheduler import scheduler
+from src.services.response_cache import response_cache
+from src.services.event_stream import article_events
+from src.services.export_service import export_service, EXPORT_FORMATS, parse_date_filter, parse_translated_filter
+from src.services.stats_service import stats_service
+from src.services.search_service import search_service
+from src.services.near_duplicates import near_duplicate_index
+from src.services.http_client import http_client
+from src.services.job_queue import job_queue
+from src.services.pagination import encode_cursor, decode_cursor
+from src.services.article_serializer import columns_for, json_response, parse_fields, rows_to_dicts
+from sqlalchemy import func, select, tuple_
+import os
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,11 +27,31 @@ logger = logging.getLogger(__name__)
 news_bp = Blueprint('news', __name__)
 news_service = NewsService()
 translation_service = TranslationService()
+# TRANSLATION_EXECUTOR=async sends provider requests from one event loop instead of a thread pool
+translation_executor = create_translation_executor(translation_service)
+article_translation_service = ArticleTranslationService(translation_executor)
+ingestion_service = IngestionService(news_service)
+
+# Upper bound for a single translate-all call
+TRANSLATE_ALL_MAX_LIMIT = int(os.getenv('TRANSLATE_ALL_MAX_LIMIT', 5000))
+
+# Feeds polled by the scheduler, as locale:language pairs
+INGEST_FEEDS = parse_feeds(os.getenv('INGEST_FEEDS', 'us:en'))
+INGEST_INTERVAL_SECONDS = int(os.getenv('INGEST_INTERVAL_SECONDS', 300))
+
+# How often the materialized stats counters are recomputed from scratch
+STATS_RECONCILE_INTERVAL_SECONDS = int(os.getenv('STATS_RECONCILE_INTERVAL_SECONDS', 3600))
 
 @news_bp.route('/articles', methods=['GET'])
+@response_cache.cached
 def get_articles():
     """
-    Get translated sports articles with pagination and filtering
+    Get translated sports articles with pagination and filtering.
+
+    Rows are selected as column tuples (no ORM objects or to_dict); fields=
+    limits the returned columns, e.g. fields=id,title,title_translated,published_at.
+    collapse=true lists one article per story: near-duplicates are left out and
+    each canonical article carries the number of its duplicates.
     """
     try:
         # Get query parameters
@@ -22,41 +59,65 @@ def get_articles():
         per_page = request.args.get('per_page', 10, type=int)
         category = request.args.get('category', 'sports')
         translated_only = request.args.get('translated_only', 'true').lower() == 'true'
+        fields = parse_fields(request.args.get('fields'))
+        collapse = request.args.get('collapse', 'false').lower() == 'true'
         
-        # Limit per_page to prevent abuse
+        # Limit per_page to prevent abuse; non-positive values fall back to 20 as before
         per_page = min(per_page, 50)
+        if per_page < 1:
+            per_page = 20
         
         # Build query
-        query = Article.query.filter_by(category=category)
+        filters = [Article.category == category]
         
         if translated_only:
-            query = query.filter_by(is_translated=True)
+            filters.append(Article.is_translated == True)
+        
+        if collapse:
+            filters.append(Article.canonical_id.is_(None))
         
-        # Order by publication date (newest first)
-        query = query.order_by(Article.published_at.desc())
+        # Order by publication date (newest first), id breaks ties
+        order_by = (Article.published_at.desc(), Article.id.desc())
+        
+        cursor = request.args.get('cursor')
+        if cursor is not None or request.args.get('pagination') == 'cursor':
+            include_total = request.args.get('include_total', 'false').lower() == 'true'
+            return _get_articles_page_by_cursor(filters, order_by, fields, cursor, per_page, include_total, collapse)
+        
+        # Duplicate counts are looked up by id even when the projection leaves it out
+        selected = fields + ('id',) if collapse and 'id' not in fields else fields
         
         # Paginate results
-        pagination = query.paginate(
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
+        page = max(page, 1)
+        total = db.session.scalar(select(func.count(Article.id)).where(*filters))
+        rows = db.session.execute(
+            select(*columns_for(selected)).where(*filters).order_by(*order_by)
+            .offset((page - 1) * per_page).limit(per_page)
+        ).all()
+        pages = -(-total // per_page)
         
-        articles = [article.to_dict() for article in pagination.items]
+        articles = rows_to_dicts(fields, rows)
+        if collapse:
+            _attach_duplicate_counts(articles, [row[selected.index('id')] for row in rows])
         
-        return jsonify({
+        return json_response({
             'success': True,
             'articles': articles,
             'pagination': {
                 'page': page,
                 'per_page': per_page,
-                'total': pagination.total,
-                'pages': pagination.pages,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
+                'total': total,
+                'pages': pages,
+                'has_next': page < pages,
+                'has_prev': page > 1
             }
         })
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error getting articles: {e}")
         return jsonify({
@@ -64,7 +125,73 @@ def get_articles():
             'error': 'Failed to retrieve articles'
         }), 500
 
+def _attach_duplicate_counts(articles, article_ids):
+    """
+    Set 'duplicates' on each article dict to the number of near-duplicates linked to it
+    """
+    counts = dict(db.session.execute(
+        select(Article.canonical_id, func.count(Article.id))
+        .where(Article.canonical_id.in_(article_ids))
+        .group_by(Article.canonical_id)
+    ).all()) if article_ids else {}
+    
+    for article, article_id in zip(articles, article_ids):
+        article['duplicates'] = counts.get(article_id, 0)
+
+def _get_articles_page_by_cursor(filters, order_by, fields, cursor, per_page, include_total, collapse=False):
+    """
+    Keyset pagination: seek past (published_at, id) of the previous page instead of OFFSET
+    """
+    total = db.session.scalar(select(func.count(Article.id)).where(*filters)) if include_total else None
+    
+    if cursor:
+        published_at, article_id = decode_cursor(cursor, 2)
+        try:
+            published_at = datetime.fromisoformat(published_at)
+            article_id = int(article_id)
+        except (TypeError, ValueError):
+            raise ValueError('Invalid cursor')
+        
+        filters = filters + [tuple_(Article.published_at, Article.id) < tuple_(published_at, article_id)]
+    
+    # The cursor needs (published_at, id) even when the projection leaves them out
+    selected = fields + tuple(name for name in ('published_at', 'id') if name not in fields)
+    
+    # One extra row tells whether another page exists
+    rows = db.session.execute(
+        select(*columns_for(selected)).where(*filters).order_by(*order_by).limit(per_page + 1)
+    ).all()
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor([
+            last[selected.index('published_at')].isoformat(),
+            last[selected.index('id')]
+        ])
+    
+    pagination = {
+        'per_page': per_page,
+        'next_cursor': next_cursor,
+        'has_next': has_next
+    }
+    if include_total:
+        pagination['total'] = total
+    
+    articles = rows_to_dicts(fields, rows)
+    if collapse:
+        _attach_duplicate_counts(articles, [row[selected.index('id')] for row in rows])
+    
+    return json_response({
+        'success': True,
+        'articles': articles,
+        'pagination': pagination
+    })
+
 @news_bp.route('/articles/<int:article_id>', methods=['GET'])
+@response_cache.cached
 def get_article(article_id):
     """
     Get a specific article by ID
@@ -83,83 +210,94 @@ def get_article(article_id):
             'error': 'Article not found'
         }), 404
 
-@news_bp.route('/fetch-news', methods=['POST'])
-def fetch_news():
+@news_bp.route('/articles/<int:article_id>/duplicates', methods=['GET'])
+@response_cache.cached
+def get_article_duplicates(article_id):
     """
-    Fetch new sports news from external APIs
+    Get the canonical article of a story and the near-duplicates linked to it
     """
     try:
-        # Get parameters
-        data = request.get_json() or {}
-        locale = data.get('locale', 'us')
-        language = data.get('language', 'en')
-        limit = min(data.get('limit', 10), 20)  # Limit to prevent abuse
-        
-        # Fetch news from external API
-        articles_data = news_service.get_sports_headlines(locale, language, limit)
+        article = Article.query.get_or_404(article_id)
+        canonical_id = article.canonical_id or article.id
         
-        # If no articles from API, use demo articles
-        if not articles_data:
-            articles_data = news_service.get_demo_articles()
+        fields = parse_fields(request.args.get('fields'))
+        rows = db.session.execute(
+            select(*columns_for(fields))
+            .where((Article.id == canonical_id) | (Article.canonical_id == canonical_id))
+            .order_by(Article.id)
+        ).all()
         
-        new_articles = []
-        updated_articles = []
+        return json_response({
+            'success': True,
+            'canonical_id': canonical_id,
+            'articles': rows_to_dicts(fields, rows)
+        })
         
-        for article_data in articles_data:
-            try:
-                # Check if article already exists
-                existing_article = Article.query.filter_by(uuid=article_data['uuid']).first()
-                
-                if existing_article:
-                    updated_articles.append(existing_article.to_dict())
-                    continue
-                
-                # Parse published date
-                published_at = datetime.utcnow()
-                if 'published_at' in article_data:
-                    try:
-                        # Handle different date formats
-                        date_str = article_data['published_at']
-                        if date_str.endswith('Z'):
-                            date_str = date_str[:-1]
-                        published_at = datetime.fromisoformat(date_str.replace('T', ' '))
-                    except:
-                        published_at = datetime.utcnow()
-                
-                # Create new article
-                article = Article(
-                    uuid=article_data['uuid'],
-                    title=article_data.get('title', ''),
-                    description=article_data.get('description', ''),
-                    content=article_data.get('snippet', ''),
-                    url=article_data.get('url', ''),
-                    image_url=article_data.get('image_url', ''),
-                    source=article_data.get('source', 'unknown'),
-                    language=article_data.get('language', 'en'),
-                    category='sports',
-                    published_at=published_at
-                )
-                
-                db.session.add(article)
-                new_articles.append(article.to_dict())
-                
-            except Exception as e:
-                logger.error(f"Error processing article {article_data.get('uuid', 'unknown')}: {e}")
-                continue
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Error getting duplicates of article {article_id}: {e}")
+        return jsonify({
+            'success': False,
+            'error': 'Article not found'
+        }), 404
+
+@news_bp.route('/search', methods=['GET'])
+@response_cache.cached
+def search_articles():
+    """
+    Full-text search over original and translated article text
+    """
+    try:
+        query = request.args.get('q', '')
+        per_page = max(1, min(request.args.get('per_page', 10, type=int), 50))
+        cursor = request.args.get('cursor')
         
-        # Commit all new articles
-        db.session.commit()
+        results = search_service.search(query, per_page, cursor)
         
         return jsonify({
             'success': True,
-            'message': f'Fetched {len(new_articles)} new articles',
-            'new_articles': len(new_articles),
-            'existing_articles': len(updated_articles),
-            'articles': new_articles
+            'query': query,
+            **results
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Error searching articles: {e}")
+        return jsonify({
+            'success': False,
+            'error': 'Failed to search articles'
+        }), 500
+
+@news_bp.route('/fetch-news', methods=['POST'])
+def fetch_news():
+    """
+    Queue a fetch of new sports news from external APIs
+    """
+    try:
+        # Get parameters
+        data = request.get_json(silent=True) or {}
+        locale = data.get('locale', 'us')
+        language = data.get('language', 'en')
+        limit = min(data.get('limit', 10), 20)  # Limit to prevent abuse
+        
+        job = job_queue.enqueue('fetch_news', {
+            'locale': locale,
+            'language': language,
+            'limit': limit
         })
         
+        return _job_accepted(job, 'News fetch queued')
+        
     except Exception as e:
-        logger.error(f"Error fetching news: {e}")
+        logger.error(f"Error queueing news fetch: {e}")
         db.session.rollback()
         return jsonify({
             'success': False,
@@ -169,7 +307,7 @@ def fetch_news():
 @news_bp.route('/translate-article/<int:article_id>', methods=['POST'])
 def translate_article(article_id):
     """
-    Translate a specific article to Bosnian
+    Queue translation of a specific article to Bosnian
     """
     try:
         article = Article.query.get_or_404(article_id)
@@ -181,38 +319,12 @@ def translate_article(article_id):
                 'article': article.to_dict()
             })
         
-        # Translate title
-        if article.title:
-            article.title_translated = translation_service.translate_text(
-                article.title, 'bs', article.language
-            )
-        
-        # Translate description
-        if article.description:
-            article.description_translated = translation_service.translate_text(
-                article.description, 'bs', article.language
-            )
-        
-        # Translate content
-        if article.content:
-            article.content_translated = translation_service.translate_text(
-                article.content, 'bs', article.language
-            )
+        job = job_queue.enqueue('translate_article', {'article_id': article_id})
         
-        # Update translation status
-        article.is_translated = True
-        article.translated_at = datetime.utcnow()
-        
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Article translated successfully',
-            'article': article.to_dict()
-        })
+        return _job_accepted(job, 'Article translation queued')
         
     except Exception as e:
-        logger.error(f"Error translating article {article_id}: {e}")
+        logger.error(f"Error queueing translation of article {article_id}: {e}")
         db.session.rollback()
         return jsonify({
             'success': False,
@@ -222,80 +334,129 @@ def translate_article(article_id):
 @news_bp.route('/translate-all', methods=['POST'])
 def translate_all_articles():
     """
-    Translate all untranslated articles
+    Queue translation of all untranslated articles
     """
     try:
-        # Get untranslated articles
-        untranslated_articles = Article.query.filter_by(is_translated=False).limit(10).all()
-        
-        translated_count = 0
-        
-        for article in untranslated_articles:
-            try:
-                # Translate title
-                if article.title:
-                    article.title_translated = translation_service.translate_text(
-                        article.title, 'bs', article.language
-                    )
-                
-                # Translate description
-                if article.description:
-                    article.description_translated = translation_service.translate_text(
-                        article.description, 'bs', article.language
-                    )
-                
-                # Translate content
-                if article.content:
-                    article.content_translated = translation_service.translate_text(
-                        article.content, 'bs', article.language
-                    )
-                
-                # Update translation status
-                article.is_translated = True
-                article.translated_at = datetime.utcnow()
-                translated_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error translating article {article.id}: {e}")
-                continue
+        data = request.get_json(silent=True) or {}
+        limit = min(int(data.get('limit', TRANSLATE_ALL_MAX_LIMIT)), TRANSLATE_ALL_MAX_LIMIT)
         
-        db.session.commit()
+        job = job_queue.enqueue('translate_all', {'limit': limit})
         
+        return _job_accepted(job, 'Bulk translation queued')
+        
+    except Exception as e:
+        logger.error(f"Error queueing bulk translation: {e}")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': 'Failed to translate articles'
+        }), 500
+
+@news_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Get progress and result of a background job
+    """
+    job = job_queue.get(job_id)
+    
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    })
+
+@news_bp.route('/feeds', methods=['GET'])
+def get_feeds():
+    """
+    Get the high-water marks of the scheduled ingestion feeds
+    """
+    try:
+        watermarks = FeedWatermark.query.order_by(FeedWatermark.feed_key).all()
         return jsonify({
             'success': True,
-            'message': f'Translated {translated_count} articles',
-            'translated_count': translated_count
+            'interval_seconds': INGEST_INTERVAL_SECONDS,
+            'feeds': [watermark.to_dict() for watermark in watermarks]
         })
         
     except Exception as e:
-        logger.error(f"Error in bulk translation: {e}")
-        db.session.rollback()
+        logger.error(f"Error getting feeds: {e}")
         return jsonify({
             'success': False,
-            'error': 'Failed to translate articles'
+            'error': 'Failed to get feeds'
         }), 500
 
+def _job_accepted(job, message):
+    return jsonify({
+        'success': True,
+        'message': message,
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': url_for('news.get_job', job_id=job.id)
+    }), 202
+
+def run_fetch_news_job(payload, report_progress):
+    """
+    Job handler: fetch headlines and store new articles
+    """
+    return ingestion_service.fetch_and_store(
+        payload.get('locale', 'us'),
+        payload.get('language', 'en'),
+        payload.get('limit', 10)
+    )
+
+def run_translate_article_job(payload, report_progress):
+    """
+    Job handler: translate one article
+    """
+    # Serialized per article, so concurrent jobs never translate the same row twice
+    article = article_translation_service.translate_article(payload['article_id'], 'bs')
+    if article is None:
+        raise ValueError(f"Article {payload['article_id']} not found")
+    if not article.is_translated:
+        raise RuntimeError('Translation providers are unavailable; the article was left untranslated')
+    
+    return {'article': article.to_dict()}
+
+def run_translate_all_job(payload, report_progress):
+    """
+    Job handler: translate untranslated articles in committed chunks
+    """
+    limit = payload.get('limit', TRANSLATE_ALL_MAX_LIMIT)
+    translated_count = article_translation_service.translate_untranslated(
+        limit, 'bs', progress=lambda done: report_progress(done * 100 // max(limit, 1))
+    )
+    
+    return {'translated_count': translated_count}
+
+job_queue.register('fetch_news', run_fetch_news_job)
+job_queue.register('translate_article', run_translate_article_job)
+job_queue.register('translate_all', run_translate_all_job)
+
+scheduler.register('reconcile-stats', STATS_RECONCILE_INTERVAL_SECONDS, stats_service.reconcile)
+
+for feed_locale, feed_language in INGEST_FEEDS:
+    scheduler.register(
+        f'ingest:{feed_locale}:{feed_language}',
+        INGEST_INTERVAL_SECONDS,
+        lambda locale=feed_locale, language=feed_language: ingestion_service.ingest_incremental(locale, language)
+    )
+
 @news_bp.route('/stats', methods=['GET'])
+@response_cache.cached
 def get_stats():
     """
     Get statistics about articles and translations
     """
     try:
-        total_articles = Article.query.count()
-        translated_articles = Article.query.filter_by(is_translated=True).count()
-        recent_articles = Article.query.filter(
-            Article.created_at >= datetime.utcnow() - timedelta(days=7)
-        ).count()
-        
         return jsonify({
             'success': True,
-            'stats': {
-                'total_articles': total_articles,
-                'translated_articles': translated_articles,
-                'untranslated_articles': total_articles - translated_articles,
-                'recent_articles': recent_articles,
-                'translation_percentage': round((translated_articles / total_articles * 100) if total_articles > 0 else 0, 1)
-            }
+            'stats': stats_service.get_stats(),
+            'near_duplicates': near_duplicate_index.get_stats()
         })
         
     except Exception as e:
@@ -305,3 +466,152 @@ def get_stats():
             'error': 'Failed to get statistics'
         }), 500
 
+
+@news_bp.route('/export', methods=['GET'])
+def export_articles():
+    """
+    Stream every article (with translations) as NDJSON or CSV.
+
+    Filters: since/until on published_at (ISO dates) and translated=true|false;
+    fields= limits the exported columns.
+    gzip=true compresses the download on the fly.
+    """
+    try:
+        export_format = request.args.get('format', 'ndjson')
+        compress = request.args.get('gzip', 'false').lower() == 'true'
+        
+        # Validate everything before the response starts streaming
+        chunks = export_service.export(
+            export_format,
+            fields=parse_fields(request.args.get('fields')),
+            since=parse_date_filter(request.args.get('since')),
+            until=parse_date_filter(request.args.get('until')),
+            translated=parse_translated_filter(request.args.get('translated')),
+            compress=compress
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    filename = f"articles-{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.{export_format}"
+    if compress:
+        filename += '.gz'
+    
+    return Response(
+        stream_with_context(chunks),
+        mimetype='application/gzip' if compress else EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+# Event types a /stream subscriber can ask for
+STREAM_EVENT_TYPES = ('created', 'translated')
+
+# How long EventSource clients wait before reconnecting
+STREAM_RETRY_MS = int(os.getenv('STREAM_RETRY_MS', 3000))
+
+@news_bp.route('/stream', methods=['GET'])
+def stream_articles():
+    """
+    Push article created/translated events as they are committed.
+
+    Server-Sent Events by default (or with ?format=sse); NDJSON for
+    ?format=ndjson or Accept: application/x-ndjson. Resumes after the
+    Last-Event-ID header or ?last_event_id=; an event of type 'reset' means
+    events were missed and the client should refetch /articles first.
+    Answers 503 once EVENT_MAX_SUBSCRIBERS streams are open.
+    """
+    stream_format = request.args.get('format')
+    if stream_format is None:
+        stream_format = 'ndjson' if 'application/x-ndjson' in request.headers.get('Accept', '') else 'sse'
+    if stream_format not in ('sse', 'ndjson'):
+        return jsonify({'success': False, 'error': "format must be 'sse' or 'ndjson'"}), 400
+    
+    types = set(request.args.get('types', ','.join(STREAM_EVENT_TYPES)).split(','))
+    if not types <= set(STREAM_EVENT_TYPES):
+        return jsonify({'success': False, 'error': f"types must be a subset of {', '.join(STREAM_EVENT_TYPES)}"}), 400
+    category = request.args.get('category')
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    
+    # Under sync workers every subscriber pins a thread, so cap them rather than starve other requests
+    if article_events.is_full:
+        return jsonify({
+            'success': False,
+            'error': 'Too many stream subscribers, try again later'
+        }), 503, {'Retry-After': str(STREAM_RETRY_MS // 1000 or 1)}
+    
+    def generate():
+        if stream_format == 'sse':
+            yield f"retry: {STREAM_RETRY_MS}\n\n"
+        
+        for event in article_events.subscribe(last_event_id):
+            if event is None:
+                yield ': keepalive\n\n' if stream_format == 'sse' else '{"type": "heartbeat"}\n'
+                continue
+            
+            if event.type != 'reset':
+                if event.type not in types or (category and event.data.get('category') != category):
+                    continue
+            
+            yield event.to_sse() if stream_format == 'sse' else event.to_ndjson()
+    
+    mimetype = 'text/event-stream' if stream_format == 'sse' else 'application/x-ndjson'
+    return Response(generate(), mimetype=mimetype, headers={
+        'Cache-Control': 'no-cache',
+        # Stop nginx from buffering the stream
+        'X-Accel-Buffering': 'no'
+    })
+
+@news_bp.route('/stream/stats', methods=['GET'])
+def get_stream_stats():
+    """
+    Get subscriber and event counters of the article event stream
+    """
+    return jsonify({
+        'success': True,
+        'stream': article_events.get_stats()
+    })
+
+@news_bp.route('/upstreams', methods=['GET'])
+def get_upstream_metrics():
+    """
+    Get request counts and latency percentiles per upstream host, plus upstream response cache counters
+    """
+    return jsonify({
+        'success': True,
+        'upstreams': http_client.get_metrics(),
+        'cache': news_service.cache.get_stats(),
+        'coalescing': [
+            news_service.flights.get_stats(),
+            ingestion_service.flights.get_stats(),
+            translation_service.flights.get_stats()
+        ]
+    })
+
+@news_bp.route('/providers', methods=['GET'])
+def get_translation_providers():
+    """
+    Get health (circuit breaker state, latency) of the translation providers
+    """
+    return jsonify({
+        'success': True,
+        'ordering': translation_service.provider_ordering,
+        'providers': translation_service.get_provider_health()
+    })
+
+@news_bp.route('/translation-cache', methods=['GET'])
+def get_translation_cache_stats():
+    """
+    Get hit/miss/eviction counters of the translation memory and sentence reuse counters
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'cache': translation_service.cache.get_stats(),
+            'segments': article_translation_service.get_stats()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting translation cache stats: {e}")
+        return jsonify({
+            'success': False,
+            'error': 'Failed to get translation cache statistics'
+        }), 500
@@ -0,0 +1,62 @@
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from flask import Response
+from src.models.article import Article
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+# Serializable Article columns by field name, in Article.to_dict order
+ARTICLE_COLUMNS = {
+    column.key: column for column in (
+        Article.id, Article.uuid,
+        Article.title, Article.title_translated,
+        Article.description, Article.description_translated,
+        Article.content, Article.content_translated,
+        Article.url, Article.image_url, Article.source, Article.language, Article.category,
+        Article.published_at, Article.created_at, Article.translated_at, Article.is_translated,
+        Article.canonical_id
+    )
+}
+ARTICLE_FIELDS = tuple(ARTICLE_COLUMNS)
+
+def parse_fields(value: Optional[str], default: Tuple[str, ...] = ARTICLE_FIELDS) -> Tuple[str, ...]:
+    """
+    Parse a `fields=` projection such as 'id,title,published_at'; raises ValueError on unknown names
+    """
+    if not value:
+        return default
+
+    fields = tuple(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+    unknown = [name for name in fields if name not in ARTICLE_COLUMNS]
+    if unknown or not fields:
+        raise ValueError(f"Unknown fields: {', '.join(unknown) or value}. Available: {', '.join(ARTICLE_FIELDS)}")
+    return fields
+
+def columns_for(fields: Sequence[str]) -> List:
+    return [ARTICLE_COLUMNS[name] for name in fields]
+
+def rows_to_dicts(fields: Sequence[str], rows: Iterable[Sequence]) -> List[Dict]:
+    """
+    Turn selected column tuples into dicts; extra trailing columns in a row are ignored
+    """
+    return [dict(zip(fields, row)) for row in rows]
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def dumps(payload) -> bytes:
+    """
+    Encode to JSON bytes with orjson when installed; datetimes become ISO 8601 strings either way
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def json_response(payload, status: int = 200) -> Response:
+    return Response(dumps(payload), status=status, mimetype='application/json')
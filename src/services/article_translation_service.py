@@ -0,0 +1,198 @@
+import os
+import threading
+from datetime import datetime
+from typing import Callable, List, Dict, Optional, Tuple, Union
+import logging
+from src.models.article import Article, db
+from src.services.translation_executor import TranslationExecutor, AsyncTranslationExecutor
+from src.services.response_cache import response_cache
+from src.services.event_stream import article_feed
+from src.services.single_flight import KeyedLocks
+from src.services.stats_service import stats_service
+from src.services.text_segments import join_sentences, split_sentences
+from src.services.translation_providers import DEMO_TRANSLATION_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# Article fields that are translated, paired with the column receiving the translation
+TRANSLATABLE_FIELDS = (
+    ('title', 'title_translated'),
+    ('description', 'description_translated'),
+    ('content', 'content_translated'),
+)
+
+def _sentences(parts: List[str]) -> List[str]:
+    # Sentences sit at even positions of split_sentences parts; blank ones need no translation
+    return [part for part in parts[0::2] if part.strip()]
+
+class ArticleTranslationService:
+    def __init__(self, executor: Union[TranslationExecutor, AsyncTranslationExecutor]):
+        self.executor = executor
+        self.translation_service = executor.translation_service
+        self.commit_every = int(os.getenv('TRANSLATION_COMMIT_EVERY', 200))
+        # Held from claiming an article until its translation is committed
+        self.article_locks = KeyedLocks()
+        # Sentences in translated fields vs. the distinct ones actually requested
+        self._stats_lock = threading.Lock()
+        self.sentences_seen = 0
+        self.sentences_distinct = 0
+
+    def translate_article(self, article_id: int, target_language: str = 'bs') -> Optional[Article]:
+        """
+        Translate one article unless it already is; a concurrent call for the same
+        article waits for the first one and then finds it translated
+        """
+        with self.article_locks.hold(article_id):
+            # Reload so a translation committed while we waited is seen
+            article = Article.query.filter_by(id=article_id).execution_options(populate_existing=True).first()
+            if article is None:
+                return None
+
+            if not article.is_translated:
+                self.translate_articles([article], target_language)
+                db.session.commit()
+                response_cache.invalidate()
+                article_feed.notify()
+
+            return article
+
+    def translate_articles(self, articles: List[Article], target_language: str = 'bs') -> int:
+        """
+        Translate the fields of many articles with batched, concurrent provider requests.
+
+        Fields are split into sentences and only the distinct sentences of the
+        whole batch are sent, packed per source language into work units of at
+        most one provider batch each; the translation memory then filters out
+        sentences translated before, so providers only see novel text. Fields
+        are reassembled from their translated sentences. An article is marked
+        translated only when every one of its sentences was, by a provider
+        rather than the demo fallback; the caller commits
+        the session. Returns the number of articles newly marked as translated.
+        """
+        plans = self._plan_fields(articles)
+        units = self._build_units(plans)
+        batches = [(sentences, target_language, language) for language, sentences in units]
+        results = self.executor.translate_batches(batches)
+
+        translations: Dict[str, Dict[str, str]] = {}
+        for (language, sentences), translated in zip(units, results):
+            if translated is None:
+                continue
+            known = translations.setdefault(language, {})
+            for sentence, text in zip(sentences, translated):
+                # A demo fallback is not a translation: leave the article for a later retry
+                if text and not text.startswith(DEMO_TRANSLATION_PREFIX):
+                    known[sentence] = text
+
+        newly_translated = []
+        now = datetime.utcnow()
+
+        for article, fields in plans:
+            known = translations.get(article.language or 'en', {})
+            if not all(sentence in known for _, parts in fields for sentence in _sentences(parts)):
+                continue
+
+            for translated_field, parts in fields:
+                setattr(article, translated_field, join_sentences(parts, known))
+
+            if not article.is_translated:
+                newly_translated.append(article)
+            article.is_translated = True
+            article.translated_at = now
+
+        stats_service.record_translated(newly_translated)
+        return len(newly_translated)
+
+    def _plan_fields(self, articles: List[Article]) -> List[Tuple[Article, List[Tuple[str, List[str]]]]]:
+        """
+        Pair each article with (translated column, sentence parts) for its non-empty fields
+        """
+        plans = []
+        for article in articles:
+            fields = [
+                (translated_field, split_sentences(getattr(article, field)))
+                for field, translated_field in TRANSLATABLE_FIELDS
+                if getattr(article, field)
+            ]
+            plans.append((article, fields))
+        return plans
+
+    def _build_units(self, plans: List[Tuple[Article, List[Tuple[str, List[str]]]]]) -> List[Tuple[str, List[str]]]:
+        """
+        Split the distinct sentences of all articles into (language, sentences) units that fit one provider batch
+        """
+        batch_size = self.translation_service.batch_size
+        distinct: Dict[str, Dict[str, None]] = {}
+        seen = 0
+
+        for article, fields in plans:
+            sentences = distinct.setdefault(article.language or 'en', {})
+            for _, parts in fields:
+                for sentence in _sentences(parts):
+                    sentences[sentence] = None
+                    seen += 1
+
+        units = []
+        for language, sentences in distinct.items():
+            sentences = list(sentences)
+            for start in range(0, len(sentences), batch_size):
+                units.append((language, sentences[start:start + batch_size]))
+
+        with self._stats_lock:
+            self.sentences_seen += seen
+            self.sentences_distinct += sum(len(sentences) for sentences in distinct.values())
+        return units
+
+    def get_stats(self) -> Dict:
+        """
+        Sentence counters: how much of the translated text was repeated within its batch
+        """
+        with self._stats_lock:
+            return {
+                'sentences_seen': self.sentences_seen,
+                'sentences_distinct': self.sentences_distinct,
+                'dedup_rate': round((1 - self.sentences_distinct / self.sentences_seen) * 100, 1)
+                if self.sentences_seen else 0
+            }
+
+    def translate_untranslated(self, limit: Optional[int] = None, target_language: str = 'bs',
+                               progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Translate up to `limit` untranslated articles, committing every `commit_every` rows.
+
+        Near-duplicates (rows with a canonical_id) are skipped: their story is
+        translated once, on the canonical row. `progress` is called with the running translated count after each commit.
+        """
+        translated_count = 0
+        last_id = 0
+
+        while limit is None or translated_count < limit:
+            chunk_size = self.commit_every if limit is None else min(self.commit_every, limit - translated_count)
+
+            articles = Article.query.filter(
+                Article.is_translated == False,
+                Article.canonical_id.is_(None),
+                Article.id > last_id
+            ).order_by(Article.id).limit(chunk_size).all()
+
+            if not articles:
+                break
+
+            last_id = articles[-1].id
+
+            # Skip rows another caller is translating right now
+            with self.article_locks.hold_available([article.id for article in articles]) as claimed:
+                if claimed:
+                    articles = Article.query.filter(
+                        Article.id.in_(claimed),
+                        Article.is_translated == False
+                    ).order_by(Article.id).execution_options(populate_existing=True).all()
+                    translated_count += self.translate_articles(articles, target_language)
+                    db.session.commit()
+                    response_cache.invalidate()
+                    article_feed.notify()
+
+            if progress:
+                progress(translated_count)
+
+        return translated_count
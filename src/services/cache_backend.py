@@ -0,0 +1,289 @@
+import os
+import json
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import logging
+
+try:
+    import redis
+except ImportError:  # optional, only needed for CACHE_BACKEND=redis
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+class CacheBackend:
+    """
+    Key/value cache with TTLs and single-flight loading.
+
+    Values must be JSON-serializable and are treated as read-only by callers.
+    `is_shared` tells whether other processes see the same entries.
+    """
+
+    is_shared = False
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value, or call `loader` once per key while concurrent callers wait for it.
+
+        None results and exceptions are not cached.
+        """
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict:
+        raise NotImplementedError
+
+class MemoryCache(CacheBackend):
+    """
+    Per-process LRU with per-entry expiry; single flight across this process's threads
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, default_ttl: Optional[float] = None):
+        self.max_entries = max_entries or int(os.getenv('CACHE_MAX_ENTRIES', 10000))
+        self.default_ttl = default_ttl or float(os.getenv('CACHE_DEFAULT_TTL', 300))
+
+        # key -> (expires_at, value)
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        # key -> [lock, callers using it]; removed when the last caller leaves
+        self._key_locks: Dict[str, list] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.loads = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            slot = self._key_locks.get(key)
+            if slot is None:
+                slot = self._key_locks[key] = [threading.Lock(), 0]
+            slot[1] += 1
+
+        try:
+            with slot[0]:
+                # Whoever held the lock before us may have filled the entry
+                value = self.get(key)
+                if value is None:
+                    self.loads += 1
+                    value = loader()
+                    if value is not None:
+                        self.set(key, value, ttl)
+            return value
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    del self._key_locks[key]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'memory',
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'loads': self.loads,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups * 100, 1) if lookups > 0 else 0
+            }
+
+class RedisCache(CacheBackend):
+    """
+    Cache shared by every worker and node through a Redis-protocol server.
+
+    Values are stored as JSON. Single flight uses a `SET NX PX` lock per key:
+    the lock holder loads and stores the value while other workers poll for it,
+    loading it themselves only if the holder does not finish within
+    `lock_timeout`. Redis errors degrade to cache misses instead of failing calls.
+    """
+
+    is_shared = True
+
+    def __init__(self, client, prefix: Optional[str] = None, default_ttl: Optional[float] = None,
+                 lock_timeout: Optional[float] = None, poll_interval: float = 0.05):
+        self.client = client
+        self.prefix = prefix if prefix is not None else os.getenv('CACHE_KEY_PREFIX', 'sports-news:')
+        self.default_ttl = default_ttl or float(os.getenv('CACHE_DEFAULT_TTL', 300))
+        self.lock_timeout = lock_timeout or float(os.getenv('CACHE_LOCK_TIMEOUT', 10))
+        self.poll_interval = poll_interval
+
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.lock_waits = 0
+        self.errors = 0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisCache':
+        if redis is None:
+            raise RuntimeError('CACHE_BACKEND=redis requires the redis package (pip install redis)')
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        try:
+            raw = self.client.mget([self.prefix + key for key in keys])
+        except Exception as e:
+            logger.error(f"Redis cache read error: {e}")
+            self._count('errors')
+            return [None] * len(keys)
+
+        values = [json.loads(item) if item is not None else None for item in raw]
+        hits = sum(1 for value in values if value is not None)
+        self._count('hits', hits)
+        self._count('misses', len(values) - hits)
+        return values
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        try:
+            self.client.set(self.prefix + key, json.dumps(value), px=int((ttl or self.default_ttl) * 1000))
+        except Exception as e:
+            logger.error(f"Redis cache write error: {e}")
+            self._count('errors')
+
+    def delete(self, key: str):
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as e:
+            logger.error(f"Redis cache delete error: {e}")
+            self._count('errors')
+
+    def get_or_set(self, key: str, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock_key = f'{self.prefix}lock:{key}'
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_timeout
+
+        while True:
+            try:
+                acquired = self.client.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000))
+            except Exception as e:
+                logger.error(f"Redis cache lock error: {e}")
+                self._count('errors')
+                return self._load(key, loader, ttl)
+
+            if acquired:
+                try:
+                    value = self.get(key)
+                    return value if value is not None else self._load(key, loader, ttl)
+                finally:
+                    self._release(lock_key, token)
+
+            # Another worker is loading this key
+            self._count('lock_waits')
+            if time.monotonic() >= deadline:
+                return self._load(key, loader, ttl)
+
+            time.sleep(self.poll_interval)
+            value = self.get(key)
+            if value is not None:
+                return value
+
+    def _load(self, key: str, loader: Callable[[], Any], ttl: Optional[float]) -> Any:
+        self._count('loads')
+        value = loader()
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+    def _release(self, lock_key: str, token: str):
+        """
+        Delete the lock only if we still own it (it may have expired and been taken over)
+        """
+        try:
+            with self.client.pipeline() as pipe:
+                pipe.watch(lock_key)
+                owner = pipe.get(lock_key)
+                if owner is not None and owner.decode() == token:
+                    pipe.multi()
+                    pipe.delete(lock_key)
+                    pipe.execute()
+                else:
+                    pipe.unwatch()
+        except Exception as e:
+            # Expiry will release it
+            logger.warning(f"Could not release cache lock {lock_key}: {e}")
+
+    def get_stats(self) -> Dict:
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'redis',
+                'hits': self.hits,
+                'misses': self.misses,
+                'loads': self.loads,
+                'lock_waits': self.lock_waits,
+                'errors': self.errors,
+                'hit_rate': round(self.hits / lookups * 100, 1) if lookups > 0 else 0
+            }
+
+def create_cache_backend() -> CacheBackend:
+    """
+    Build the backend selected by CACHE_BACKEND ('memory' or 'redis' with CACHE_REDIS_URL)
+    """
+    backend = os.getenv('CACHE_BACKEND', 'memory')
+    if backend == 'redis':
+        return RedisCache.from_url(os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0'))
+    if backend != 'memory':
+        raise ValueError(f"Unknown CACHE_BACKEND '{backend}', expected 'memory' or 'redis'")
+    return MemoryCache()
+
+shared_cache = create_cache_backend()
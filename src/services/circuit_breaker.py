@@ -0,0 +1,127 @@
+import os
+import time
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker with a sliding window of recent call outcomes.
+
+    closed:    calls flow; when at least `min_calls` of the last `window` calls
+               exist and the failure rate reaches `failure_rate`, the breaker opens.
+    open:      calls are rejected immediately for `open_seconds`.
+    half_open: up to `half_open_calls` trial calls are let through; a success
+               closes the breaker, a failure opens it again.
+
+    It also keeps an exponentially weighted moving average of successful call
+    latency so callers can prefer the fastest healthy backend.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, window: Optional[int] = None, failure_rate: Optional[float] = None,
+                 min_calls: Optional[int] = None, open_seconds: Optional[float] = None,
+                 half_open_calls: int = 1, latency_alpha: float = 0.3):
+        self.name = name
+        self.window = window or int(os.getenv('CIRCUIT_BREAKER_WINDOW', 20))
+        self.failure_rate = failure_rate or float(os.getenv('CIRCUIT_BREAKER_FAILURE_RATE', 0.5))
+        self.min_calls = min_calls or int(os.getenv('CIRCUIT_BREAKER_MIN_CALLS', 5))
+        self.open_seconds = open_seconds or float(os.getenv('CIRCUIT_BREAKER_OPEN_SECONDS', 30))
+        self.half_open_calls = half_open_calls
+        self.latency_alpha = latency_alpha
+
+        self._state = self.CLOSED
+        self._outcomes = deque(maxlen=self.window)
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._lock = threading.Lock()
+
+        self.latency_ms: Optional[float] = None
+        self.total_successes = 0
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.last_failure_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._trial_calls = 0
+
+    def allow_request(self) -> bool:
+        """
+        Return whether a call may go out now (counts half-open trial calls)
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.HALF_OPEN and self._trial_calls < self.half_open_calls:
+                self._trial_calls += 1
+                return True
+
+            self.total_rejected += 1
+            return False
+
+    def record_success(self, latency_ms: Optional[float] = None):
+        with self._lock:
+            self.total_successes += 1
+            if latency_ms is not None:
+                if self.latency_ms is None:
+                    self.latency_ms = latency_ms
+                else:
+                    self.latency_ms += self.latency_alpha * (latency_ms - self.latency_ms)
+
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self):
+        with self._lock:
+            self.total_failures += 1
+            self.last_failure_at = time.time()
+
+            if self._state == self.HALF_OPEN:
+                self._open()
+                return
+
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+                self._open()
+
+    def _open(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            self._maybe_half_open()
+            failures = self._outcomes.count(False)
+            retry_in = None
+            if self._state == self.OPEN:
+                retry_in = round(max(self.open_seconds - (time.monotonic() - self._opened_at), 0), 1)
+
+            return {
+                'name': self.name,
+                'state': self._state,
+                'window_calls': len(self._outcomes),
+                'window_failure_rate': round(failures / len(self._outcomes), 2) if self._outcomes else 0,
+                'latency_ms': round(self.latency_ms, 1) if self.latency_ms is not None else None,
+                'successes': self.total_successes,
+                'failures': self.total_failures,
+                'rejected': self.total_rejected,
+                'retry_in_seconds': retry_in
+            }
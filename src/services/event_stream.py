@@ -0,0 +1,258 @@
+import os
+import uuid
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+from sqlalchemy import func, select
+from src.models.article import Article, db
+from src.services.article_serializer import ARTICLE_FIELDS, columns_for, dumps
+
+logger = logging.getLogger(__name__)
+
+class Event:
+    def __init__(self, seq: int, event_id: str, event_type: str, data: Dict):
+        self.seq = seq
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+
+    def to_sse(self) -> str:
+        return f"id: {self.id}\nevent: {self.type}\ndata: {dumps(self.data).decode('utf-8')}\n\n"
+
+    def to_ndjson(self) -> str:
+        return dumps({'id': self.id, 'type': self.type, 'data': self.data}).decode('utf-8') + '\n'
+
+class EventBroadcaster:
+    """
+    In-process fan-out of events to any number of subscribers.
+
+    Published events go into a bounded ring buffer; subscribers do not get their
+    own queues but wait on one condition and read the buffer from their last
+    sequence number, so publishing costs the same for 1 or 10,000 listeners.
+    Event ids are '<epoch>-<seq>' where the epoch changes on every process start;
+    a Last-Event-ID from another epoch or older than the buffer gets a 'reset'
+    event telling the client to refetch before following the stream.
+    """
+
+    def __init__(self, buffer_size: Optional[int] = None, heartbeat_seconds: Optional[float] = None):
+        self.buffer_size = buffer_size or int(os.getenv('EVENT_BUFFER_SIZE', 1000))
+        self.heartbeat_seconds = heartbeat_seconds or float(os.getenv('EVENT_HEARTBEAT_SECONDS', 15))
+        # Each subscriber holds a server thread for as long as it is connected (0 disables the cap)
+        self.max_subscribers = int(os.getenv('EVENT_MAX_SUBSCRIBERS', 4))
+        self.epoch = uuid.uuid4().hex[:8]
+
+        self._events = deque(maxlen=self.buffer_size)
+        self._seq = 0
+        self._condition = threading.Condition()
+        self._subscribers = 0
+        self._published = 0
+
+    @property
+    def subscribers(self) -> int:
+        return self._subscribers
+
+    @property
+    def is_full(self) -> bool:
+        return 0 < self.max_subscribers <= self._subscribers
+
+    def publish(self, event_type: str, data: Dict) -> Event:
+        with self._condition:
+            self._seq += 1
+            event = Event(self._seq, f'{self.epoch}-{self._seq}', event_type, data)
+            self._events.append(event)
+            self._published += 1
+            self._condition.notify_all()
+        return event
+
+    def _resume_seq(self, last_event_id: Optional[str]) -> Tuple[int, bool]:
+        """
+        Map a Last-Event-ID to the sequence to continue after; the flag says events were missed
+        """
+        if not last_event_id:
+            return self._seq, False
+
+        epoch, _, seq = last_event_id.partition('-')
+        try:
+            seq = int(seq)
+        except ValueError:
+            return self._seq, True
+
+        oldest = self._events[0].seq if self._events else self._seq + 1
+        if epoch != self.epoch or seq > self._seq or seq < oldest - 1:
+            return self._seq, True
+        return seq, False
+
+    def _events_after(self, seq: int) -> List[Event]:
+        if not self._events or seq >= self._seq:
+            return []
+        start = max(seq - self._events[0].seq + 1, 0)
+        return list(self._events)[start:]
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Iterator[Optional[Event]]:
+        """
+        Yield events published after `last_event_id`, and None whenever a heartbeat is due
+        """
+        with self._condition:
+            seq, missed = self._resume_seq(last_event_id)
+            self._subscribers += 1
+
+        try:
+            if missed:
+                yield Event(seq, f'{self.epoch}-{seq}', 'reset', {'reason': 'events missed, refetch and resume'})
+
+            while True:
+                with self._condition:
+                    events = self._events_after(seq)
+                    if not events:
+                        self._condition.wait(self.heartbeat_seconds)
+                        events = self._events_after(seq)
+
+                    # A slow subscriber that fell out of the buffer must resync
+                    if events and events[0].seq != seq + 1:
+                        seq = self._seq
+                        events = [Event(seq, f'{self.epoch}-{seq}', 'reset', {'reason': 'subscriber fell behind'})]
+
+                if not events:
+                    yield None
+                    continue
+
+                for event in events:
+                    yield event
+                    seq = event.seq
+        finally:
+            with self._condition:
+                self._subscribers -= 1
+
+    def get_stats(self) -> Dict:
+        with self._condition:
+            return {
+                'epoch': self.epoch,
+                'subscribers': self._subscribers,
+                'max_subscribers': self.max_subscribers,
+                'published': self._published,
+                'buffered': len(self._events),
+                'last_event_id': f'{self.epoch}-{self._seq}' if self._seq else None
+            }
+
+class ArticleChangeFeed:
+    """
+    Single event source for article changes: one thread tails the article table
+    and publishes 'created' and 'translated' events to the broadcaster.
+
+    Tailing the database (new ids, recent translated_at) picks up commits made by
+    any process, including standalone job workers. In-process writers call
+    notify() after committing so the tail runs immediately instead of waiting
+    for the next poll. Nothing is queried while there are no subscribers.
+    """
+
+    def __init__(self, broadcaster: EventBroadcaster):
+        self.broadcaster = broadcaster
+        self.poll_seconds = float(os.getenv('EVENT_POLL_SECONDS', 1))
+        # translated_at is set before the commit; rescan this far back so late commits are not missed
+        self.translated_slack = timedelta(seconds=float(os.getenv('EVENT_TRANSLATED_SLACK_SECONDS', 10)))
+        self.batch_size = int(os.getenv('EVENT_POLL_BATCH_SIZE', 500))
+
+        self.app = None
+        self._thread = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._last_id: Optional[int] = None
+        self._translated_since: Optional[datetime] = None
+        self._seen_translations: Dict[Tuple[int, datetime], datetime] = {}
+
+    def init_app(self, app):
+        self.app = app
+
+    def start_if_enabled(self):
+        if os.getenv('EVENT_STREAM_ENABLED', 'true').lower() == 'true':
+            self.start()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='article-events', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+
+    def notify(self):
+        """
+        Ask the tail to run now (called after in-process commits)
+        """
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wakeup.wait(self.poll_seconds)
+            self._wakeup.clear()
+
+            if not self.broadcaster.subscribers:
+                # Start from "now" when the next subscriber arrives
+                self._last_id = None
+                continue
+
+            try:
+                with self.app.app_context():
+                    self.poll()
+            except Exception as e:
+                logger.error(f"Article event tail failed: {e}")
+
+    def poll(self) -> int:
+        """
+        Publish events for articles created or translated since the last poll; returns the count
+        """
+        if self._last_id is None:
+            self._last_id = db.session.query(func.coalesce(func.max(Article.id), 0)).scalar()
+            self._translated_since = datetime.utcnow()
+            self._seen_translations = {
+                (article['id'], article['translated_at']): article['translated_at']
+                for article in self._recent_translations()
+            }
+            return 0
+
+        published = 0
+
+        while True:
+            created = self._select(Article.id > self._last_id, order_by=(Article.id,), limit=self.batch_size)
+            for article in created:
+                self.broadcaster.publish('created', article)
+                self._last_id = article['id']
+            published += len(created)
+            if len(created) < self.batch_size:
+                break
+
+        for article in self._recent_translations():
+            key = (article['id'], article['translated_at'])
+            if key in self._seen_translations:
+                continue
+            self._seen_translations[key] = article['translated_at']
+            self._translated_since = max(self._translated_since, article['translated_at'])
+            self.broadcaster.publish('translated', article)
+            published += 1
+
+        cutoff = self._translated_since - self.translated_slack
+        self._seen_translations = {
+            key: translated_at for key, translated_at in self._seen_translations.items() if translated_at >= cutoff
+        }
+
+        return published
+
+    def _recent_translations(self) -> List[Dict]:
+        return self._select(
+            Article.translated_at > self._translated_since - self.translated_slack,
+            order_by=(Article.translated_at, Article.id)
+        )
+
+    def _select(self, condition, order_by, limit: Optional[int] = None) -> List[Dict]:
+        # Plain column tuples are much cheaper than hydrating Article objects
+        stmt = select(*columns_for(ARTICLE_FIELDS)).where(condition).order_by(*order_by)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return [dict(zip(ARTICLE_FIELDS, row)) for row in db.session.execute(stmt)]
+
+article_events = EventBroadcaster()
+article_feed = ArticleChangeFeed(article_events)
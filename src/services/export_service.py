@@ -0,0 +1,168 @@
+import os
+import io
+import csv
+import zlib
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+import logging
+import click
+from sqlalchemy import select
+from src.models.article import Article, db
+from src.services.article_serializer import ARTICLE_FIELDS, columns_for, dumps, parse_fields
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+def parse_date_filter(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO date or datetime filter into naive UTC; raises ValueError when malformed
+    """
+    if not value:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value[:-1] if value.endswith('Z') else value)
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}', expected ISO 8601 such as 2024-05-01 or 2024-05-01T12:00:00")
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def parse_translated_filter(value: Optional[str]) -> Optional[bool]:
+    if value is None or value == '' or value == 'all':
+        return None
+    if value.lower() in ('true', '1', 'yes'):
+        return True
+    if value.lower() in ('false', '0', 'no'):
+        return False
+    raise ValueError("translated must be 'true', 'false' or 'all'")
+
+class ExportService:
+    """
+    Streams the article table as NDJSON or CSV with constant memory.
+
+    Rows are read through one query with `yield_per`, so the driver hands them
+    over in fixed-size batches (a server-side cursor on PostgreSQL) instead of
+    materializing the table, and every row is serialized as soon as it arrives.
+    """
+
+    def __init__(self):
+        self.batch_size = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+        # Rows serialized before a chunk is handed to the response
+        self.flush_rows = int(os.getenv('EXPORT_FLUSH_ROWS', 100))
+
+    def iter_rows(self, fields: Sequence[str] = ARTICLE_FIELDS, since: Optional[datetime] = None,
+                  until: Optional[datetime] = None, translated: Optional[bool] = None) -> Iterator[Tuple]:
+        """
+        Yield article rows as tuples in `fields` order, filtered by published_at and translation status
+        """
+        stmt = select(*columns_for(fields)).order_by(Article.id)
+        if since is not None:
+            stmt = stmt.where(Article.published_at >= since)
+        if until is not None:
+            stmt = stmt.where(Article.published_at < until)
+        if translated is not None:
+            stmt = stmt.where(Article.is_translated == translated)
+
+        result = db.session.execute(stmt.execution_options(yield_per=self.batch_size))
+        try:
+            for row in result:
+                yield tuple(row)
+        finally:
+            result.close()
+
+    def export(self, export_format: str, fields: Sequence[str] = ARTICLE_FIELDS, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, translated: Optional[bool] = None,
+               compress: bool = False) -> Iterator[bytes]:
+        """
+        Yield the serialized export in chunks, gzip-compressed on the fly when `compress` is set
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+        rows = self.iter_rows(fields, since, until, translated)
+        if export_format == 'csv':
+            chunks = self._iter_csv(fields, rows)
+        else:
+            chunks = self._iter_ndjson(fields, rows)
+
+        return _gzip_chunks(chunks) if compress else chunks
+
+    def _iter_ndjson(self, fields: Sequence[str], rows: Iterable[Tuple]) -> Iterator[bytes]:
+        lines = []
+        for row in rows:
+            lines.append(dumps(dict(zip(fields, row))))
+            if len(lines) >= self.flush_rows:
+                yield b'\n'.join(lines) + b'\n'
+                lines = []
+        if lines:
+            yield b'\n'.join(lines) + b'\n'
+
+    def _iter_csv(self, fields: Sequence[str], rows: Iterable[Tuple]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+
+        written = 0
+        for row in rows:
+            writer.writerow([_serialize(value) for value in row])
+            written += 1
+            if written % self.flush_rows == 0:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode('utf-8')
+
+def _serialize(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Compress a byte stream into one gzip member without buffering it
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def register_export_command(app):
+    """
+    Add the `flask export-articles` command
+    """
+    @app.cli.command('export-articles')
+    @click.option('--format', 'export_format', type=click.Choice(list(EXPORT_FORMATS)), default='ndjson')
+    @click.option('--output', '-o', type=click.Path(dir_okay=False, allow_dash=True), default='-',
+                  help='File to write; defaults to stdout.')
+    @click.option('--gzip', 'compress', is_flag=True, help='Compress the output with gzip.')
+    @click.option('--since', help='Only articles published at or after this ISO date.')
+    @click.option('--until', help='Only articles published before this ISO date.')
+    @click.option('--translated', type=click.Choice(['true', 'false', 'all']), default='all')
+    @click.option('--fields', help='Comma-separated columns to export (default: all).')
+    def export_articles_command(export_format, output, compress, since, until, translated, fields):
+        """Stream the article table as NDJSON or CSV."""
+        try:
+            chunks = export_service.export(
+                export_format,
+                fields=parse_fields(fields),
+                since=parse_date_filter(since),
+                until=parse_date_filter(until),
+                translated=parse_translated_filter(translated),
+                compress=compress
+            )
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+
+        with click.open_file(output, 'wb') as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+
+export_service = ExportService()
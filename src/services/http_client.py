@@ -0,0 +1,231 @@
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # optional, see requirements-async.txt
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+
+# Methods that are safe to resend after a read error or a retryable status
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+class HostMetrics:
+    def __init__(self, window: int):
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=window)
+
+    def to_dict(self) -> Dict:
+        latencies = sorted(self.latencies)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'latency_ms': {
+                'avg': round(sum(latencies) / len(latencies), 1) if latencies else None,
+                'p50': _percentile(latencies, 50),
+                'p95': _percentile(latencies, 95),
+                'p99': _percentile(latencies, 99),
+                'max': round(latencies[-1], 1) if latencies else None
+            }
+        }
+
+class HttpClient:
+    """
+    Shared HTTP layer: one pooled keep-alive requests.Session per upstream host.
+
+    Connection failures are retried for every method (nothing was sent yet);
+    read errors and 429/5xx responses are retried with jittered exponential
+    backoff only for idempotent methods. Connect and read timeouts are separate.
+    """
+
+    def __init__(self):
+        self.pool_maxsize = int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+        self.connect_timeout = float(os.getenv('HTTP_CONNECT_TIMEOUT', 3.05))
+        self.read_timeout = float(os.getenv('HTTP_READ_TIMEOUT', 30))
+        self.max_retries = int(os.getenv('HTTP_MAX_RETRIES', 3))
+        self.backoff_factor = float(os.getenv('HTTP_BACKOFF_FACTOR', 0.3))
+        self.backoff_jitter = float(os.getenv('HTTP_BACKOFF_JITTER', 0.3))
+        self.metrics_window = int(os.getenv('HTTP_METRICS_WINDOW', 1000))
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _build_retry(self) -> Retry:
+        return Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            allowed_methods=IDEMPOTENT_METHODS,
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_factor=self.backoff_factor,
+            backoff_jitter=self.backoff_jitter,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Return the pooled session for the URL's scheme and host
+        """
+        parts = urlsplit(url)
+        origin = f'{parts.scheme}://{parts.netloc}'
+
+        session = self._sessions.get(origin)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(origin)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.pool_maxsize,
+                    max_retries=self._build_retry()
+                )
+                session.mount(f'{parts.scheme}://', adapter)
+                self._sessions[origin] = session
+                self._metrics[parts.netloc] = HostMetrics(self.metrics_window)
+        return session
+
+    def request(self, method: str, url: str, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        """
+        Send a request through the host's pooled session, recording latency
+        """
+        session = self.get_session(url)
+        host = urlsplit(url).netloc
+
+        if timeout is None:
+            timeout = (self.connect_timeout, self.read_timeout)
+        elif not isinstance(timeout, tuple):
+            timeout = (min(self.connect_timeout, timeout), timeout)
+
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = session.request(method, url, timeout=timeout, **kwargs)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self.record(host, (time.perf_counter() - start) * 1000, failed)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def record(self, host: str, elapsed_ms: float, failed: bool):
+        """
+        Add one request outcome to the host's metrics
+        """
+        with self._lock:
+            metrics = self._metrics.setdefault(host, HostMetrics(self.metrics_window))
+            metrics.requests += 1
+            if failed:
+                metrics.errors += 1
+            metrics.latencies.append(elapsed_ms)
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        """
+        Return request counts and latency percentiles per upstream host
+        """
+        with self._lock:
+            return {host: metrics.to_dict() for host, metrics in self._metrics.items()}
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+class AsyncHttpClient:
+    """
+    asyncio counterpart of HttpClient built on httpx.AsyncClient.
+
+    One pooled client is kept per event loop; connection failures are retried by
+    the transport and latency is recorded into the shared HttpClient metrics so
+    /upstreams shows both modes together.
+    """
+
+    def __init__(self, metrics: Optional[HttpClient] = None):
+        if httpx is None:
+            raise RuntimeError('The async translation executor requires httpx (pip install -r requirements-async.txt)')
+
+        self.metrics = metrics if metrics is not None else http_client
+        self.max_connections = int(os.getenv('HTTP_ASYNC_MAX_CONNECTIONS', 100))
+        self.connect_timeout = self.metrics.connect_timeout
+        self.read_timeout = self.metrics.read_timeout
+        self.max_retries = self.metrics.max_retries
+        self._clients: Dict[int, 'httpx.AsyncClient'] = {}
+
+    def _get_client(self) -> 'httpx.AsyncClient':
+        loop_id = id(asyncio.get_running_loop())
+        client = self._clients.get(loop_id)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                transport=httpx.AsyncHTTPTransport(retries=self.max_retries)
+            )
+            self._clients[loop_id] = client
+        return client
+
+    async def request(self, method: str, url: str, timeout: Optional[Timeout] = None, **kwargs) -> 'httpx.Response':
+        """
+        Send a request through the loop's pooled client, recording latency
+        """
+        if isinstance(timeout, tuple):
+            kwargs['timeout'] = httpx.Timeout(timeout[1], connect=timeout[0])
+        elif timeout is not None:
+            kwargs['timeout'] = timeout
+
+        host = urlsplit(url).netloc
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = await self._get_client().request(method, url, **kwargs)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self.metrics.record(host, (time.perf_counter() - start) * 1000, failed)
+
+    async def get(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> 'httpx.Response':
+        return await self.request('POST', url, **kwargs)
+
+    async def aclose(self):
+        """
+        Close the client of the running loop
+        """
+        client = self._clients.pop(id(asyncio.get_running_loop()), None)
+        if client is not None:
+            await client.aclose()
+
+def _percentile(values, percentile: float) -> Optional[float]:
+    if not values:
+        return None
+    index = min(len(values) - 1, int(round(percentile / 100 * (len(values) - 1))))
+    return round(values[index], 1)
+
+http_client = HttpClient()
@@ -0,0 +1,340 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Set, Tuple
+import logging
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from src.models.article import Article, db
+from src.models.feed_watermark import FeedWatermark
+from src.services.news_service import NewsService
+from src.services.response_cache import response_cache
+from src.services.event_stream import article_feed
+from src.services.stats_service import stats_service
+from src.services.single_flight import SingleFlight
+from src.services.near_duplicates import NearDuplicateIndex, near_duplicate_index
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on bound parameters per existence lookup (SQLite allows 32766)
+EXISTING_LOOKUP_CHUNK = 5000
+
+class IngestionService:
+    def __init__(self, news_service: NewsService, duplicate_index: Optional[NearDuplicateIndex] = near_duplicate_index):
+        self.news_service = news_service
+        # Near-duplicates of recent stories are linked to a canonical row; DEDUP_ENABLED=false turns it off
+        self.duplicate_index = duplicate_index if os.getenv('DEDUP_ENABLED', 'true').lower() == 'true' else None
+        self.page_size = int(os.getenv('INGEST_PAGE_SIZE', 20))
+        self.max_pages = int(os.getenv('INGEST_MAX_PAGES', 5))
+        self.initial_lookback = timedelta(hours=int(os.getenv('INGEST_INITIAL_LOOKBACK_HOURS', 24)))
+        # Concurrent identical fetches share one upstream call and one insert
+        self.flights = SingleFlight('fetch_and_store')
+
+    def fetch_and_store(self, locale: str = 'us', language: str = 'en', limit: int = 10) -> Dict:
+        """
+        Fetch sports headlines and store the ones that are not in the database yet
+        """
+        return self.flights.do(
+            (locale, language, limit),
+            lambda: self._fetch_and_store(locale, language, limit)
+        )
+
+    def _fetch_and_store(self, locale: str, language: str, limit: int) -> Dict:
+        # Fetch news from external API
+        articles_data = self.news_service.get_sports_headlines(locale, language, limit)
+
+        # If no articles from API, use demo articles
+        if not articles_data:
+            articles_data = self.news_service.get_demo_articles()
+
+        return self.store_articles(articles_data)
+
+    def ingest_incremental(self, locale: str = 'us', language: str = 'en') -> Dict:
+        """
+        Ingest articles newer than the feed's high-water mark.
+
+        Pages arrive newest first, so the mark only advances once a walk has run
+        out of pages. A walk cut short by INGEST_MAX_PAGES or a fetch error keeps
+        what it stored and checkpoints the oldest timestamp it saw; the next poll
+        resumes below that checkpoint. Fetch errors are re-raised to the caller.
+        """
+        feed_key = f'{locale}:{language}'
+        watermark = db.session.get(FeedWatermark, feed_key)
+        if watermark is None:
+            watermark = FeedWatermark(feed_key=feed_key, articles_ingested=0)
+            db.session.add(watermark)
+
+        published_after = watermark.last_published_at or (datetime.utcnow() - self.initial_lookback)
+        published_before = watermark.backfill_before
+
+        new_items = []
+        # Newest and oldest timestamps the API actually supplied in this walk
+        newest = (watermark.pending_published_at, watermark.pending_uuid)
+        oldest = None
+        complete = False
+        error = None
+
+        try:
+            for articles, items in self.news_service.iter_sports_news_pages(
+                locale, language, _format_api_time(published_after), self.page_size, self.max_pages,
+                _format_api_time(published_before) if published_before else None
+            ):
+                for item in items:
+                    published_at = parse_timestamp(item.get('published_at'))
+                    if published_at is None:
+                        continue
+                    if newest[0] is None or published_at > newest[0]:
+                        newest = (published_at, item.get('uuid'))
+                    if oldest is None or published_at < oldest:
+                        oldest = published_at
+
+                for item in articles:
+                    # published_after is inclusive, so skip what the last poll already saw
+                    if self._seen_before(item, watermark):
+                        continue
+                    new_items.append(item)
+
+                complete = len(items) < self.page_size
+        except Exception as e:
+            logger.error(f"Feed {feed_key}: page walk failed after {len(new_items)} items: {e}")
+            error = e
+
+        if new_items:
+            result = self.store_articles(new_items)
+        else:
+            result = {'new_articles': 0, 'existing_articles': 0, 'articles': []}
+
+        if complete:
+            if newest[0] is not None and (
+                watermark.last_published_at is None or newest[0] > watermark.last_published_at
+            ):
+                watermark.last_published_at, watermark.last_uuid = newest
+            watermark.backfill_before = None
+            watermark.pending_published_at = watermark.pending_uuid = None
+        elif oldest is not None:
+            # published_before is sent at second precision; round up so the boundary second is re-read
+            watermark.backfill_before = oldest.replace(microsecond=0) + timedelta(seconds=1)
+            watermark.pending_published_at, watermark.pending_uuid = newest
+
+        watermark.last_polled_at = datetime.utcnow()
+        watermark.articles_ingested += result['new_articles']
+        db.session.commit()
+
+        logger.info(
+            f"Feed {feed_key}: {len(new_items)} items past watermark, {result['new_articles']} new"
+            + ('' if complete else f", resuming below {watermark.backfill_before}")
+        )
+        if error is not None:
+            raise error
+        return result
+
+    def _seen_before(self, item: Dict, watermark: FeedWatermark) -> bool:
+        if watermark.last_published_at is None:
+            return False
+        published_at = parse_timestamp(item.get('published_at'))
+        if published_at is None:
+            return False
+        return published_at < watermark.last_published_at or (
+            published_at == watermark.last_published_at and item.get('uuid') == watermark.last_uuid
+        )
+
+    def store_articles(self, articles_data: List[Dict]) -> Dict:
+        """
+        Insert new articles from raw API payloads in bulk and commit them.
+
+        The batch is deduplicated in memory, existing uuids are resolved with one
+        IN query and the remaining rows are written with a single
+        INSERT ... ON CONFLICT(uuid) DO NOTHING, so concurrent ingestion of the
+        same uuid cannot fail the commit. New rows that are near-duplicates of a
+        recent story get its canonical_id and are left out of bulk translation.
+        """
+        rows: Dict[str, Dict] = {}
+        duplicates = 0
+        invalid = 0
+
+        for article_data in articles_data:
+            try:
+                row = self._build_row(article_data)
+            except Exception as e:
+                logger.error(f"Error processing article {article_data.get('uuid', 'unknown')}: {e}")
+                invalid += 1
+                continue
+
+            if row['uuid'] in rows:
+                duplicates += 1
+                continue
+            rows[row['uuid']] = row
+
+        existing = self._find_existing_uuids(list(rows))
+        new_rows = [row for uuid, row in rows.items() if uuid not in existing]
+
+        # The MinHash work happens here, before the inserts take the single-writer lock
+        signatures = self._prepare_near_duplicates(new_rows)
+        inserted = self._insert_ignoring_duplicates(new_rows) if new_rows else []
+        near_duplicates = self._link_near_duplicates(inserted, signatures)
+        stats_service.record_ingested(inserted)
+
+        # Commit all new articles
+        db.session.commit()
+        if inserted:
+            response_cache.invalidate()
+            article_feed.notify()
+
+        skipped = len(articles_data) - len(inserted)
+
+        return {
+            'new_articles': len(inserted),
+            'existing_articles': len(rows) - len(inserted),
+            'duplicate_articles': duplicates,
+            'near_duplicate_articles': near_duplicates,
+            'invalid_articles': invalid,
+            'inserted': len(inserted),
+            'skipped': skipped,
+            'articles': [Article(**row).to_dict() for row in inserted]
+        }
+
+    def _prepare_near_duplicates(self, rows: List[Dict]) -> Dict[str, Tuple[int, ...]]:
+        """
+        Catch the index up with the database and sign the rows about to be inserted
+        """
+        if self.duplicate_index is None or not rows:
+            return {}
+
+        self.duplicate_index.refresh()
+        return self.duplicate_index.signatures(rows)
+
+    def _link_near_duplicates(self, inserted: List[Dict], signatures: Dict[str, Tuple[int, ...]]) -> int:
+        """
+        Set canonical_id on inserted rows that repeat a recent story; returns how many did
+        """
+        if self.duplicate_index is None or not inserted:
+            return 0
+
+        canonical = self.duplicate_index.assign(inserted, signatures)
+        if not canonical:
+            return 0
+
+        table = Article.__table__
+        db.session.execute(
+            update(table).where(table.c.id == bindparam('article_id')).values(canonical_id=bindparam('canonical')),
+            [{'article_id': article_id, 'canonical': canonical_id} for article_id, canonical_id in canonical.items()]
+        )
+        for row in inserted:
+            row['canonical_id'] = canonical.get(row['id'])
+
+        logger.info(f"Linked {len(canonical)} of {len(inserted)} new articles to existing stories")
+        return len(canonical)
+
+    def _build_row(self, article_data: Dict) -> Dict:
+        """
+        Map a raw API payload to Article column values
+        """
+        now = datetime.utcnow()
+        return {
+            'uuid': article_data['uuid'],
+            'title': article_data.get('title') or '',
+            'description': article_data.get('description', ''),
+            'content': article_data.get('snippet', ''),
+            'url': article_data.get('url') or '',
+            'image_url': article_data.get('image_url', ''),
+            'source': article_data.get('source') or 'unknown',
+            'language': article_data.get('language') or 'en',
+            'category': 'sports',
+            'published_at': parse_published_at(article_data.get('published_at')),
+            'created_at': now,
+            'is_translated': False
+        }
+
+    def _find_existing_uuids(self, uuids: List[str]) -> Set[str]:
+        """
+        Resolve which uuids are already stored, one IN query per EXISTING_LOOKUP_CHUNK uuids
+        """
+        existing = set()
+        for start in range(0, len(uuids), EXISTING_LOOKUP_CHUNK):
+            chunk = uuids[start:start + EXISTING_LOOKUP_CHUNK]
+            existing.update(
+                uuid for (uuid,) in db.session.query(Article.uuid).filter(Article.uuid.in_(chunk))
+            )
+        return existing
+
+    def _insert_ignoring_duplicates(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Bulk insert rows, skipping uuids that appeared concurrently; returns the inserted rows with ids
+        """
+        table = Article.__table__
+        dialect = db.session.get_bind().dialect.name
+
+        if dialect == 'sqlite':
+            stmt = sqlite_insert(table).on_conflict_do_nothing(index_elements=['uuid'])
+        elif dialect == 'postgresql':
+            stmt = postgresql_insert(table).on_conflict_do_nothing(index_elements=['uuid'])
+        else:
+            return self._insert_rows_one_by_one(rows)
+
+        result = db.session.execute(stmt.returning(table.c.id, table.c.uuid), rows)
+        ids = {uuid: article_id for article_id, uuid in result}
+
+        inserted = []
+        for row in rows:
+            if row['uuid'] in ids:
+                inserted.append(dict(row, id=ids[row['uuid']]))
+        return inserted
+
+    def _insert_rows_one_by_one(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Fallback for dialects without ON CONFLICT DO NOTHING or RETURNING (e.g. MySQL):
+        insert each row in a savepoint and skip the ones whose uuid already exists
+        """
+        table = Article.__table__
+        inserted = []
+        for row in rows:
+            try:
+                with db.session.begin_nested():
+                    result = db.session.execute(insert(table).values(row))
+            except IntegrityError:
+                continue
+            inserted.append(dict(row, id=result.inserted_primary_key[0]))
+        return inserted
+
+def parse_timestamp(date_str) -> Optional[datetime]:
+    """
+    Parse an API timestamp to naive UTC; None when it is missing or malformed
+    """
+    if not date_str:
+        return None
+
+    try:
+        # Handle different date formats
+        if date_str.endswith('Z'):
+            date_str = date_str[:-1]
+        published_at = datetime.fromisoformat(date_str.replace('T', ' '))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+    # Store naive UTC like the rest of the timestamps
+    if published_at.tzinfo is not None:
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return published_at
+
+def parse_published_at(date_str) -> datetime:
+    """
+    Parse an API timestamp, falling back to the current time
+    """
+    return parse_timestamp(date_str) or datetime.utcnow()
+
+def _format_api_time(value: datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%S')
+
+def parse_feeds(value: str) -> List[Tuple[str, str]]:
+    """
+    Parse a feed list such as 'us:en,gb:en' into (locale, language) pairs
+    """
+    feeds = []
+    for entry in value.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        locale, _, language = entry.partition(':')
+        feeds.append((locale.strip(), language.strip() or 'en'))
+    return feeds
@@ -0,0 +1,237 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+import logging
+from src.models.job import Job, db
+
+logger = logging.getLogger(__name__)
+
+# handler(payload, report_progress) -> JSON-serializable result
+JobHandler = Callable[[Dict, Callable[[int], None]], Dict]
+
+class JobQueue:
+    """
+    Background job queue backed by the `job` table.
+
+    Workers run as daemon threads inside the serving process (JOB_WORKER_MODE=inline)
+    or in a separate process started with `flask worker` or `python worker.py`
+    (JOB_WORKER_MODE=external). Jobs are claimed with a conditional UPDATE, so any
+    number of workers can share one database.
+    """
+
+    def __init__(self):
+        self.handlers: Dict[str, JobHandler] = {}
+        self.app = None
+        self.poll_interval = float(os.getenv('JOB_POLL_INTERVAL', 1.0))
+        # Running jobs touch heartbeat_at this often; a job silent for JOB_STALE_SECONDS is requeued
+        self.heartbeat_interval = float(os.getenv('JOB_HEARTBEAT_SECONDS', 30))
+        self.stale_after = timedelta(seconds=int(os.getenv('JOB_STALE_SECONDS', 150)))
+        self._last_stale_check = 0.0
+        self._wakeup = threading.Event()
+        self._threads = []
+
+    def register(self, job_type: str, handler: JobHandler):
+        """
+        Register the function that executes jobs of `job_type`
+        """
+        self.handlers[job_type] = handler
+
+    def init_app(self, app):
+        """
+        Bind the queue to an app; workers are started by the entry points, not on import
+        """
+        self.app = app
+
+    def start_inline_workers(self):
+        """
+        Start in-process workers unless they run externally (called by the serving entry points)
+        """
+        if os.getenv('JOB_WORKER_MODE', 'inline') == 'inline':
+            self.start_workers(int(os.getenv('JOB_WORKERS', 1)))
+
+    def start_workers(self, count: int = 1):
+        """
+        Start `count` daemon worker threads
+        """
+        for _ in range(count):
+            thread = threading.Thread(target=self.run_worker, name='job-worker', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def join(self):
+        """
+        Block on the worker threads (used by the standalone worker process)
+        """
+        for thread in self._threads:
+            thread.join()
+
+    def enqueue(self, job_type: str, payload: Optional[Dict] = None) -> Job:
+        """
+        Persist a new job and wake up a worker; returns the queued job
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job = Job(type=job_type, payload=json.dumps(payload or {}))
+        db.session.add(job)
+        db.session.commit()
+
+        self._wakeup.set()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return db.session.get(Job, job_id)
+
+    def run_worker(self):
+        """
+        Worker loop: execute queued jobs, sleeping between empty polls
+        """
+        while True:
+            try:
+                self._maybe_requeue_stale()
+                if not self.run_pending():
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+            except Exception as e:
+                logger.error(f"Job worker error: {e}")
+                time.sleep(self.poll_interval)
+
+    def run_pending(self, max_jobs: Optional[int] = None) -> int:
+        """
+        Claim and execute queued jobs until none are left; returns how many ran
+        """
+        executed = 0
+
+        while max_jobs is None or executed < max_jobs:
+            with self.app.app_context():
+                job = self._claim()
+                if job is None:
+                    break
+                self._execute(job)
+            executed += 1
+
+        return executed
+
+    def _claim(self) -> Optional[Job]:
+        """
+        Atomically move the oldest queued job to `running`
+        """
+        while True:
+            job_id = db.session.query(Job.id).filter_by(status='queued').order_by(Job.created_at).limit(1).scalar()
+            if job_id is None:
+                return None
+
+            now = datetime.utcnow()
+            claimed = Job.query.filter_by(id=job_id, status='queued').update({
+                'status': 'running',
+                'started_at': now,
+                'heartbeat_at': now,
+                'attempts': Job.attempts + 1
+            }, synchronize_session=False)
+            db.session.commit()
+
+            if claimed:
+                return db.session.get(Job, job_id)
+
+    def _execute(self, job: Job):
+        job_id = job.id
+        job_type = job.type
+        handler = self.handlers.get(job_type)
+        payload = json.loads(job.payload) if job.payload else {}
+
+        def report_progress(progress: int):
+            Job.query.filter_by(id=job_id).update({
+                'progress': max(0, min(int(progress), 100)),
+                'heartbeat_at': datetime.utcnow()
+            })
+            db.session.commit()
+
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job_id, finished), name=f'job-heartbeat-{job_id[:8]}', daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job type '{job_type}'")
+
+            result = handler(payload, report_progress)
+
+            Job.query.filter_by(id=job_id).update({
+                'status': 'succeeded',
+                'progress': 100,
+                'result': json.dumps(result),
+                'finished_at': datetime.utcnow()
+            })
+            db.session.commit()
+
+        except Exception as e:
+            logger.error(f"Job {job_id} ({job_type}) failed: {e}")
+            db.session.rollback()
+            Job.query.filter_by(id=job_id).update({
+                'status': 'failed',
+                'error': str(e),
+                'finished_at': datetime.utcnow()
+            })
+            db.session.commit()
+
+        finally:
+            finished.set()
+            heartbeat.join()
+
+    def _heartbeat(self, job_id: str, finished: threading.Event):
+        """
+        Touch heartbeat_at while the job runs, from its own session so the handler's transaction is not involved
+        """
+        while not finished.wait(self.heartbeat_interval):
+            try:
+                with self.app.app_context():
+                    Job.query.filter_by(id=job_id, status='running').update({'heartbeat_at': datetime.utcnow()})
+                    db.session.commit()
+            except Exception as e:
+                logger.warning(f"Job {job_id} heartbeat failed: {e}")
+
+    def _maybe_requeue_stale(self):
+        # Checked from every worker loop, at most once per heartbeat interval
+        if time.monotonic() - self._last_stale_check < self.heartbeat_interval:
+            return
+        self._last_stale_check = time.monotonic()
+        with self.app.app_context():
+            self._requeue_stale()
+
+    def _requeue_stale(self):
+        """
+        Return jobs whose worker stopped sending heartbeats (crashed or killed) to the queue
+        """
+        cutoff = datetime.utcnow() - self.stale_after
+        last_seen = db.func.coalesce(Job.heartbeat_at, Job.started_at)
+        requeued = Job.query.filter(Job.status == 'running', last_seen < cutoff).update(
+            {'status': 'queued'}, synchronize_session=False
+        )
+        db.session.commit()
+
+        if requeued:
+            logger.warning(f"Requeued {requeued} stale jobs")
+
+job_queue = JobQueue()
+
+def register_worker_command(app):
+    """
+    Add the `flask worker` command
+    """
+    import click
+    from src.services.scheduler import scheduler
+
+    @app.cli.command('worker')
+    @click.option('--workers', type=int, default=lambda: int(os.getenv('JOB_WORKERS', 1)),
+                  help='Worker threads; defaults to JOB_WORKERS.')
+    def worker_command(workers):
+        """Run background jobs (and the scheduler when SCHEDULER_ENABLED=true) until interrupted."""
+        job_queue.start_workers(workers)
+        scheduler.start_if_enabled()
+        click.echo(f"Running {workers} job worker(s)")
+        job_queue.join()
@@ -0,0 +1,230 @@
+import os
+import re
+import hashlib
+import random
+import threading
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+from sqlalchemy import select
+from src.models.article import Article, db
+
+logger = logging.getLogger(__name__)
+
+# 2**61 - 1, the modulus of the MinHash permutations
+_PRIME = (1 << 61) - 1
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+def normalize_text(text: Optional[str]) -> List[str]:
+    """
+    Lowercase, strip accents and punctuation; returns the words
+    """
+    if not text:
+        return []
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return _WORD_RE.findall(text)
+
+def shingles(title: Optional[str], description: Optional[str], size: int = 2) -> Set[int]:
+    """
+    Hashed word n-grams of normalized title + description
+    """
+    words = normalize_text(title) + normalize_text(description)
+    if len(words) < size:
+        grams = [' '.join(words)] if words else []
+    else:
+        grams = [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+    # Stable across processes, unlike hash()
+    return {int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big') for gram in grams}
+
+class MinHasher:
+    """
+    MinHash signatures: the Jaccard similarity of two shingle sets is estimated
+    by the fraction of equal positions in their signatures
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, hashed_shingles: Iterable[int]) -> Tuple[int, ...]:
+        values = list(hashed_shingles)
+        if not values:
+            return ()
+        return tuple(min((a * value + b) % _PRIME for value in values) for a, b in self.params)
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        if not first or not second:
+            return 0.0
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+class _Entry:
+    __slots__ = ('article_id', 'canonical_id', 'language', 'signature', 'created_at')
+
+    def __init__(self, article_id, canonical_id, language, signature, created_at):
+        self.article_id = article_id
+        self.canonical_id = canonical_id
+        self.language = language
+        self.signature = signature
+        self.created_at = created_at
+
+class NearDuplicateIndex:
+    """
+    LSH index over MinHash signatures of recently ingested articles.
+
+    Signatures are cut into `bands` bands; articles sharing any band are
+    candidates and are confirmed by estimated similarity >= `threshold`. A
+    near-duplicate links to its match's canonical article, so a story forms one
+    cluster with one canonical row however many sources publish it.
+
+    The index is rebuilt from the article table on first use and then tails
+    rows inserted since (also by other processes); entries older than `window`
+    are dropped, so stories are only clustered with recent ones.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, num_perm: int = 128, bands: int = 32,
+                 window: Optional[timedelta] = None):
+        if num_perm % bands:
+            raise ValueError('num_perm must be a multiple of bands')
+        self.threshold = threshold or float(os.getenv('DEDUP_THRESHOLD', 0.6))
+        self.window = window or timedelta(hours=int(os.getenv('DEDUP_WINDOW_HOURS', 48)))
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+
+        self._lock = threading.RLock()
+        self._entries: Dict[int, _Entry] = {}
+        # (language, band number, band values) -> article ids
+        self._buckets: Dict[Tuple, Set[int]] = {}
+        self._last_id: Optional[int] = None
+
+        self.lookups = 0
+        self.duplicates_found = 0
+
+    def _band_keys(self, language: str, signature: Tuple[int, ...]) -> List[Tuple]:
+        step = self.rows_per_band
+        return [(language, band, signature[band * step:(band + 1) * step]) for band in range(self.bands)]
+
+    def signature(self, title: Optional[str], description: Optional[str]) -> Tuple[int, ...]:
+        return self.hasher.signature(shingles(title, description))
+
+    def find(self, language: str, signature: Tuple[int, ...]) -> Optional[_Entry]:
+        """
+        Most similar indexed article at or above the threshold
+        """
+        if not signature:
+            return None
+
+        with self._lock:
+            candidates = set()
+            for key in self._band_keys(language, signature):
+                candidates.update(self._buckets.get(key, ()))
+
+            best, best_score = None, self.threshold
+            for article_id in candidates:
+                entry = self._entries[article_id]
+                score = MinHasher.similarity(signature, entry.signature)
+                if score >= best_score:
+                    best, best_score = entry, score
+            return best
+
+    def add(self, article_id: int, canonical_id: Optional[int], language: str,
+            signature: Tuple[int, ...], created_at: datetime):
+        if not signature:
+            return
+        with self._lock:
+            if article_id in self._entries:
+                return
+            self._entries[article_id] = _Entry(article_id, canonical_id, language, signature, created_at)
+            for key in self._band_keys(language, signature):
+                self._buckets.setdefault(key, set()).add(article_id)
+
+    def _evict(self, cutoff: datetime):
+        expired = [entry for entry in self._entries.values() if entry.created_at < cutoff]
+        for entry in expired:
+            del self._entries[entry.article_id]
+            for key in self._band_keys(entry.language, entry.signature):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(entry.article_id)
+                    if not bucket:
+                        del self._buckets[key]
+
+    def refresh(self):
+        """
+        Index articles inserted since the last refresh and drop the ones outside the window
+        """
+        cutoff = datetime.utcnow() - self.window
+        stmt = select(Article.id, Article.canonical_id, Article.language, Article.title,
+                      Article.description, Article.created_at).where(Article.created_at >= cutoff)
+
+        with self._lock:
+            if self._last_id is not None:
+                stmt = stmt.where(Article.id > self._last_id)
+
+            for article_id, canonical_id, language, title, description, created_at in \
+                    db.session.execute(stmt.order_by(Article.id)):
+                self._last_id = article_id
+                self.add(article_id, canonical_id, language or 'en', self.signature(title, description), created_at)
+
+            if self._last_id is None:
+                self._last_id = 0
+            self._evict(cutoff)
+
+    def signatures(self, rows: List[Dict]) -> Dict[str, Tuple[int, ...]]:
+        """
+        MinHash signatures of rows about to be inserted, by uuid; computed up front so
+        the insert transaction only does lookups
+        """
+        return {row['uuid']: self.signature(row.get('title'), row.get('description')) for row in rows}
+
+    def assign(self, rows: List[Dict], signatures: Optional[Dict[str, Tuple[int, ...]]] = None) -> Dict[int, int]:
+        """
+        Cluster freshly inserted rows (with ids, in insertion order) against the
+        index and each other; returns {article id: canonical id} for the duplicates.
+
+        Call refresh() before inserting the rows: assign only runs the LSH lookups,
+        so it is cheap inside the write transaction.
+        """
+        canonical = {}
+        signatures = signatures or {}
+
+        with self._lock:
+            for row in rows:
+                language = row.get('language') or 'en'
+                signature = signatures.get(row['uuid'])
+                if signature is None:
+                    signature = self.signature(row.get('title'), row.get('description'))
+                self.lookups += 1
+
+                match = self.find(language, signature)
+                canonical_id = None
+                if match is not None and match.article_id != row['id']:
+                    canonical_id = match.canonical_id or match.article_id
+                    canonical[row['id']] = canonical_id
+                    self.duplicates_found += 1
+
+                self.add(row['id'], canonical_id, language, signature, row.get('created_at') or datetime.utcnow())
+
+            # The rows are indexed now; the next refresh must not read and sign them again
+            if rows:
+                self._last_id = max(self._last_id or 0, max(row['id'] for row in rows))
+
+        return canonical
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'indexed': len(self._entries),
+                'window_hours': self.window.total_seconds() / 3600,
+                'threshold': self.threshold,
+                'lookups': self.lookups,
+                'duplicates_found': self.duplicates_found
+            }
+
+near_duplicate_index = NearDuplicateIndex()
@@ -1,48 +1,37 @@
 import requests
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from urllib.parse import urlencode
+from typing import Iterator, List, Dict, Optional, Tuple
 import logging
+from src.services.sports_classifier import SportsClassifier
+from src.services.http_client import HttpClient, http_client
+from src.services.cache_backend import CacheBackend, shared_cache
+from src.services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 class NewsService:
-    def __init__(self):
+    def __init__(self, http: Optional[HttpClient] = None, cache: Optional[CacheBackend] = None):
+        self.http = http if http is not None else http_client
+        # Upstream responses are cached for every worker sharing the backend (0 disables)
+        self.cache = cache if cache is not None else shared_cache
+        self.cache_ttl = float(os.getenv('NEWS_CACHE_TTL', 60))
+        # Identical requests in flight at the same time share one upstream call
+        self.flights = SingleFlight('news')
         self.api_key = os.getenv('NEWS_API_KEY', 'demo_key')
-        self.base_url = 'https://api.thenewsapi.com/v1/news'
+        # Point at a compatible mock for offline runs (see benchmarks/mock_newsapi.py)
+        self.base_url = os.getenv('NEWS_API_BASE_URL', 'https://api.thenewsapi.com/v1/news').rstrip('/')
+        self.classifier = SportsClassifier()
         
     def get_sports_headlines(self, locale: str = 'us', language: str = 'en', limit: int = 10) -> List[Dict]:
         """
         Fetch sports headlines from The News API
         """
         try:
-            url = f"{self.base_url}/headlines"
-            params = {
-                'api_token': self.api_key,
-                'locale': locale,
-                'language': language,
-                'categories': 'sports',
-                'limit': limit
-            }
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract sports articles from the response
-            articles = []
-            if 'data' in data:
-                # The News API returns data organized by category
-                if 'sports' in data['data']:
-                    articles = data['data']['sports']
-                elif 'general' in data['data']:
-                    # Sometimes sports news appears in general category
-                    articles = data['data']['general']
-                    # Filter for sports-related content
-                    articles = [article for article in articles if self._is_sports_related(article)]
+            url, params = self._headlines_request(locale, language, limit)
             
-            return articles
+            return self._parse_headlines(self._get_json(url, params), language)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching news from API: {e}")
@@ -51,71 +40,142 @@ class NewsService:
             logger.error(f"Unexpected error in get_sports_headlines: {e}")
             return []
     
-    def get_all_sports_news(self, locale: str = 'us', language: str = 'en', limit: int = 20) -> List[Dict]:
+    def _headlines_request(self, locale: str, language: str, limit: int) -> Tuple[str, Dict]:
+        url = f"{self.base_url}/headlines"
+        params = {
+            'api_token': self.api_key,
+            'locale': locale,
+            'language': language,
+            'categories': 'sports',
+            'limit': limit
+        }
+        return url, params
+    
+    def _parse_headlines(self, data: Dict, language: str) -> List[Dict]:
+        # Extract sports articles from the response
+        articles = []
+        if 'data' in data:
+            # The News API returns data organized by category
+            if 'sports' in data['data']:
+                articles = data['data']['sports']
+            elif 'general' in data['data']:
+                # Sometimes sports news appears in general category
+                articles = data['data']['general']
+                # Filter for sports-related content
+                articles = self._filter_sports_related(articles, language)
+        
+        return articles
+    
+    def get_all_sports_news(self, locale: str = 'us', language: str = 'en', limit: int = 20,
+                            published_after: Optional[str] = None, page: int = 1) -> List[Dict]:
         """
         Fetch all sports news using the all news endpoint with sports filtering
         """
-        try:
-            url = f"{self.base_url}/all"
-            params = {
-                'api_token': self.api_key,
-                'locale': locale,
-                'language': language,
-                'categories': 'sports',
-                'limit': limit,
-                'search': 'sports OR football OR basketball OR soccer OR tennis OR baseball OR hockey'
-            }
-            
-            response = requests.get(url, params=params, timeout=30)
+        articles, _ = self._get_all_sports_page(locale, language, limit, published_after, page)
+        return articles
+    
+    def _cache_key(self, url: str, params: Dict) -> str:
+        # The API token is left out so rotating it does not orphan entries
+        query = urlencode(sorted((key, value) for key, value in params.items() if key != 'api_token'))
+        return f'news:{url}?{query}'
+    
+    def _get_json(self, url: str, params: Dict) -> Dict:
+        """
+        GET an API endpoint through the cache; when an entry is missing only one caller fetches it
+        """
+        key = self._cache_key(url, params)
+        
+        def fetch():
+            response = self.http.get(url, params=params)
             response.raise_for_status()
+            return response.json()
+        
+        def load():
+            return self.flights.do(key, fetch)
+        
+        if self.cache_ttl <= 0:
+            return load()
+        return self.cache.get_or_set(key, load, self.cache_ttl)
+    
+    def iter_sports_news_pages(self, locale: str = 'us', language: str = 'en', published_after: Optional[str] = None,
+                               limit: int = 20, max_pages: int = 5,
+                               published_before: Optional[str] = None) -> Iterator[Tuple[List[Dict], List[Dict]]]:
+        """
+        Yield (sports articles, raw page items) per page of articles published in
+        the window (newest first), until a short page or `max_pages` is reached.
+        Fetch errors are raised, so a failed page is never mistaken for the end of the feed
+        """
+        for page in range(1, max_pages + 1):
+            url, params = self._all_sports_request(locale, language, limit, published_after, page, published_before)
+            data = self._get_json(url, params)
+            if not isinstance(data.get('data'), list):
+                raise ValueError(f"Unexpected response for page {page}: {str(data)[:200]}")
             
-            data = response.json()
+            items = data['data']
+            yield self._filter_sports_related(items, language), items
             
-            articles = []
-            if 'data' in data:
-                articles = data['data']
-                # Additional filtering for sports content
-                articles = [article for article in articles if self._is_sports_related(article)]
+            if len(items) < limit:
+                break
+    
+    def _get_all_sports_page(self, locale: str, language: str, limit: int,
+                             published_after: Optional[str], page: int) -> Tuple[List[Dict], int]:
+        """
+        Fetch one page of the all news endpoint; returns (sports articles, raw item count)
+        """
+        try:
+            url, params = self._all_sports_request(locale, language, limit, published_after, page)
             
-            return articles
+            return self._parse_all_sports_page(self._get_json(url, params), language)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching all sports news: {e}")
-            return []
+            return [], 0
         except Exception as e:
             logger.error(f"Unexpected error in get_all_sports_news: {e}")
-            return []
+            return [], 0
+    
+    def _all_sports_request(self, locale: str, language: str, limit: int, published_after: Optional[str],
+                            page: int, published_before: Optional[str] = None) -> Tuple[str, Dict]:
+        url = f"{self.base_url}/all"
+        params = {
+            'api_token': self.api_key,
+            'locale': locale,
+            'language': language,
+            'categories': 'sports',
+            'limit': limit,
+            'page': page,
+            'sort': 'published_at',
+            'search': 'sports OR football OR basketball OR soccer OR tennis OR baseball OR hockey'
+        }
+        if published_after:
+            params['published_after'] = published_after
+        if published_before:
+            params['published_before'] = published_before
+        return url, params
+    
+    def _parse_all_sports_page(self, data: Dict, language: str) -> Tuple[List[Dict], int]:
+        articles = []
+        returned = 0
+        if 'data' in data:
+            articles = data['data']
+            returned = data.get('meta', {}).get('returned', len(articles))
+            # Additional filtering for sports content
+            articles = self._filter_sports_related(articles, language)
+        
+        return articles, returned
     
     def _is_sports_related(self, article: Dict) -> bool:
         """
         Check if an article is sports-related based on title, description, and categories
         """
-        sports_keywords = [
-            'sports', 'football', 'basketball', 'soccer', 'tennis', 'baseball', 
-            'hockey', 'golf', 'olympics', 'fifa', 'nfl', 'nba', 'mlb', 'nhl',
-            'championship', 'tournament', 'league', 'match', 'game', 'player',
-            'team', 'coach', 'stadium', 'score', 'goal', 'touchdown', 'victory'
-        ]
-        
-        # Check categories first
-        if 'categories' in article:
-            categories = article['categories']
-            if isinstance(categories, list) and 'sports' in categories:
-                return True
-        
-        # Check title and description for sports keywords
-        text_to_check = []
-        if 'title' in article:
-            text_to_check.append(article['title'].lower())
-        if 'description' in article:
-            text_to_check.append(article['description'].lower())
-        if 'snippet' in article:
-            text_to_check.append(article['snippet'].lower())
-        
-        combined_text = ' '.join(text_to_check)
-        
-        # Check if any sports keywords are present
-        return any(keyword in combined_text for keyword in sports_keywords)
+        return self.classifier.is_sports_related(article, article.get('language'))
+    
+    def _filter_sports_related(self, articles: List[Dict], language: Optional[str] = None) -> List[Dict]:
+        """
+        Keep only sports-related articles, classifying the whole list in one pass
+        """
+        matches = self.classifier.classify_batch(articles, language)
+        return [article for article, is_sports in zip(articles, matches) if is_sports]
     
     def get_demo_articles(self) -> List[Dict]:
         """
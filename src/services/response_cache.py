@@ -0,0 +1,119 @@
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Optional, Tuple
+from flask import Response, request
+
+class CachedResponse:
+    def __init__(self, generation: int, body: bytes, mimetype: str, etag: str):
+        self.generation = generation
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = etag
+        self.created_at = time.monotonic()
+
+class ResponseCache:
+    """
+    In-memory cache of rendered GET responses with generation-based invalidation.
+
+    Entries are keyed on endpoint, view arguments and normalized query args.
+    `invalidate()` bumps the generation so every cached response is rebuilt on
+    its next request; entries also expire after RESPONSE_CACHE_TTL seconds so
+    processes that did not see the write (e.g. a separate job worker) converge.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None,
+                 max_age: Optional[int] = None):
+        self.max_entries = max_entries or int(os.getenv('RESPONSE_CACHE_SIZE', 1000))
+        self.ttl = ttl if ttl is not None else float(os.getenv('RESPONSE_CACHE_TTL', 30))
+        self.max_age = max_age if max_age is not None else int(os.getenv('RESPONSE_CACHE_MAX_AGE', 0))
+        self.generation = 0
+        self._entries: 'OrderedDict[Tuple, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self):
+        """
+        Mark every cached response as stale (call after ingestion/translation commits)
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def cached(self, view):
+        """
+        Decorator serving a view from the cache with ETag / If-None-Match support
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+
+            key = self._make_key(kwargs)
+            entry = self._get(key)
+
+            if entry is None:
+                with self._lock:
+                    generation = self.generation
+
+                response = view(*args, **kwargs)
+                if isinstance(response, tuple) or response.status_code != 200:
+                    return response
+
+                body = response.get_data()
+                entry = CachedResponse(generation, body, response.mimetype, hashlib.sha256(body).hexdigest()[:32])
+                self._set(key, entry)
+
+            response = Response(entry.body, mimetype=entry.mimetype)
+            response.set_etag(entry.etag)
+            if self.max_age > 0:
+                response.headers['Cache-Control'] = f'public, max-age={self.max_age}'
+            else:
+                response.headers['Cache-Control'] = 'public, no-cache'
+
+            # Turns the response into a 304 when If-None-Match matches
+            return response.make_conditional(request)
+
+        return wrapper
+
+    def _make_key(self, view_args: Dict) -> Tuple:
+        args = tuple(sorted((name, value) for name, value in request.args.items(multi=True) if value != ''))
+        return (request.endpoint, tuple(sorted(view_args.items())), args)
+
+    def _get(self, key: Tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry.generation != self.generation or time.monotonic() - entry.created_at > self.ttl:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _set(self, key: Tuple, entry: CachedResponse):
+        with self._lock:
+            # Do not store a response rendered before a concurrent invalidation
+            if entry.generation != self.generation:
+                return
+
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'generation': self.generation,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+response_cache = ResponseCache()
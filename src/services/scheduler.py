@@ -0,0 +1,79 @@
+import os
+import time
+import threading
+from typing import Callable, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ScheduledTask:
+    def __init__(self, name: str, interval: float, func: Callable[[], None]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.next_run = time.monotonic()
+
+class Scheduler:
+    """
+    Runs registered tasks periodically in a daemon thread inside an app context.
+
+    Enabled with SCHEDULER_ENABLED=true; only one process per database should
+    run it (typically the standalone worker).
+    """
+
+    def __init__(self):
+        self.tasks: List[ScheduledTask] = []
+        self.app = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def register(self, name: str, interval: float, func: Callable[[], None]):
+        """
+        Run `func` every `interval` seconds, starting on the first tick
+        """
+        self.tasks.append(ScheduledTask(name, interval, func))
+
+    def init_app(self, app):
+        self.app = app
+
+    def start_if_enabled(self):
+        if os.getenv('SCHEDULER_ENABLED', 'false').lower() == 'true':
+            self.start()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run_due(self):
+        """
+        Run every task whose next run time has passed
+        """
+        now = time.monotonic()
+
+        for task in self.tasks:
+            if task.next_run > now:
+                continue
+
+            task.next_run = now + task.interval
+            try:
+                with self.app.app_context():
+                    task.func()
+            except Exception as e:
+                logger.error(f"Scheduled task '{task.name}' failed: {e}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_due()
+
+            if self.tasks:
+                delay = max(min(task.next_run for task in self.tasks) - time.monotonic(), 0.1)
+            else:
+                delay = 1.0
+            self._stop.wait(delay)
+
+scheduler = Scheduler()
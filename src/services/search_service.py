@@ -0,0 +1,150 @@
+import re
+import html
+from typing import Dict, List, Optional
+import logging
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from src.models.article import Article, db
+from src.services.pagination import encode_cursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Indexed columns, in FTS column order, with their bm25 weights
+FTS_COLUMNS = (
+    ('title', 10.0),
+    ('description', 4.0),
+    ('content', 1.0),
+    ('title_translated', 10.0),
+    ('description_translated', 4.0),
+    ('content_translated', 1.0),
+)
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# FTS5 wraps matches in these control characters; they are swapped for <mark> after escaping
+_MATCH_START, _MATCH_END = '\x02', '\x03'
+
+def render_highlight(value: Optional[str]) -> Optional[str]:
+    """
+    HTML-escape highlight()/snippet() output and turn the match markers into <mark> tags
+    """
+    if value is None:
+        return None
+    return html.escape(value).replace(_MATCH_START, '<mark>').replace(_MATCH_END, '</mark>')
+
+def create_search_index(conn: Connection):
+    """
+    Migration step: external-content FTS5 table over Article plus sync triggers
+    """
+    if conn.dialect.name != 'sqlite':
+        logger.warning('Full-text search index skipped: FTS5 requires SQLite')
+        return
+
+    columns = ', '.join(name for name, _ in FTS_COLUMNS)
+    new_values = ', '.join(f'new.{name}' for name, _ in FTS_COLUMNS)
+    old_values = ', '.join(f'old.{name}' for name, _ in FTS_COLUMNS)
+
+    conn.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS article_fts USING fts5("
+        f"{columns}, content='article', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS article_fts_ai AFTER INSERT ON article BEGIN "
+        f"INSERT INTO article_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS article_fts_ad AFTER DELETE ON article BEGIN "
+        f"INSERT INTO article_fts(article_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+    )
+    conn.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS article_fts_au AFTER UPDATE OF {columns} ON article BEGIN "
+        f"INSERT INTO article_fts(article_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO article_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+    )
+    # Index rows that existed before the table was created
+    conn.exec_driver_sql("INSERT INTO article_fts(article_fts) VALUES ('rebuild')")
+
+class SearchService:
+    def build_match_query(self, query: str) -> Optional[str]:
+        """
+        Turn free text into an FTS5 query: every word must match, the last one as a prefix
+        """
+        tokens = _TOKEN_RE.findall(query)
+        if not tokens:
+            return None
+
+        terms = [f'"{token}"' for token in tokens]
+        terms[-1] += '*'
+        return ' '.join(terms)
+
+    def search(self, query: str, per_page: int = 10, cursor: Optional[str] = None) -> Dict:
+        """
+        Rank matching articles with bm25 and return HTML-escaped highlighted snippets, paged by (rank, id) cursor
+        """
+        if db.session.get_bind().dialect.name != 'sqlite':
+            raise RuntimeError('Full-text search requires SQLite FTS5')
+
+        match = self.build_match_query(query)
+        if match is None:
+            raise ValueError('Search query must contain at least one word')
+
+        weights = ', '.join(str(weight) for _, weight in FTS_COLUMNS)
+        rank = f'bm25(article_fts, {weights})'
+        per_page = max(per_page, 1)
+        params = {'match': match, 'limit': per_page + 1, 'match_start': _MATCH_START, 'match_end': _MATCH_END}
+
+        seek = ''
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, 2)
+            try:
+                params['last_rank'] = float(last_rank)
+                params['last_id'] = int(last_id)
+            except (TypeError, ValueError):
+                raise ValueError('Invalid cursor')
+            seek = f'AND ({rank} > :last_rank OR ({rank} = :last_rank AND article_fts.rowid > :last_id))'
+
+        rows = db.session.execute(text(
+            f"SELECT article_fts.rowid, {rank} AS rank, "
+            f"highlight(article_fts, 0, :match_start, :match_end) AS title_highlight, "
+            f"highlight(article_fts, 3, :match_start, :match_end) AS title_translated_highlight, "
+            f"snippet(article_fts, -1, :match_start, :match_end, '…', 16) AS snippet "
+            f"FROM article_fts WHERE article_fts MATCH :match {seek} "
+            f"ORDER BY rank, article_fts.rowid LIMIT :limit"
+        ), params).all()
+
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+
+        articles = {
+            article.id: article
+            for article in Article.query.filter(Article.id.in_([row.rowid for row in rows]))
+        }
+
+        results: List[Dict] = []
+        for row in rows:
+            article = articles.get(row.rowid)
+            if article is None:
+                continue
+            result = article.to_dict()
+            result['search'] = {
+                'rank': row.rank,
+                'title': render_highlight(row.title_highlight),
+                'title_translated': render_highlight(row.title_translated_highlight or None),
+                'snippet': render_highlight(row.snippet)
+            }
+            results.append(result)
+
+        next_cursor = None
+        if has_next and rows:
+            next_cursor = encode_cursor([rows[-1].rank, rows[-1].rowid])
+
+        return {
+            'articles': results,
+            'pagination': {
+                'per_page': per_page,
+                'next_cursor': next_cursor,
+                'has_next': has_next
+            }
+        }
+
+search_service = SearchService()
@@ -0,0 +1,120 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    The first caller runs the function; callers arriving while it is in flight
+    wait and receive the same result (or the same exception). Nothing is kept
+    after the call completes, so this is not a cache.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'name': self.name,
+                'in_flight': len(self._calls),
+                'executed': self.executed,
+                'coalesced': self.coalesced
+            }
+
+class KeyedLocks:
+    """
+    One mutex per key, created on demand and dropped when nobody holds or waits for it
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key -> [lock, holders and waiters]
+        self._locks: Dict[Hashable, list] = {}
+
+    def _ref(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            slot = self._locks.get(key)
+            if slot is None:
+                slot = self._locks[key] = [threading.Lock(), 0]
+            slot[1] += 1
+            return slot[0]
+
+    def _unref(self, key: Hashable):
+        with self._lock:
+            slot = self._locks[key]
+            slot[1] -= 1
+            if slot[1] == 0:
+                del self._locks[key]
+
+    @contextmanager
+    def hold(self, key: Hashable) -> Iterator[None]:
+        """
+        Wait for and hold the lock of `key`
+        """
+        lock = self._ref(key)
+        try:
+            with lock:
+                yield
+        finally:
+            self._unref(key)
+
+    @contextmanager
+    def hold_available(self, keys: Iterable[Hashable]) -> Iterator[List[Hashable]]:
+        """
+        Hold the locks of every key that is free right now; yields the keys acquired
+        """
+        acquired = []
+        try:
+            for key in keys:
+                lock = self._ref(key)
+                if lock.acquire(blocking=False):
+                    acquired.append(key)
+                else:
+                    self._unref(key)
+            yield acquired
+        finally:
+            for key in acquired:
+                self._locks[key][0].release()
+                self._unref(key)
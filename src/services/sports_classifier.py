@@ -0,0 +1,156 @@
+import os
+import re
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Pattern
+
+# English keywords apply to every article; locale sets are added on top
+DEFAULT_KEYWORDS = [
+    'sports', 'football', 'basketball', 'soccer', 'tennis', 'baseball',
+    'hockey', 'golf', 'olympics', 'fifa', 'nfl', 'nba', 'mlb', 'nhl',
+    'championship', 'tournament', 'league', 'match', 'game', 'player',
+    'team', 'coach', 'stadium', 'score', 'goal', 'touchdown', 'victory'
+]
+
+LOCALE_KEYWORDS = {
+    'bs': ['sport', 'fudbal', 'nogomet', 'košarka', 'tenis', 'rukomet', 'odbojka', 'utakmica',
+           'utakmice', 'liga', 'prvenstvo', 'turnir', 'gol', 'golova', 'trener', 'igrač', 'stadion', 'reprezentacija'],
+    'hr': ['sport', 'nogomet', 'košarka', 'tenis', 'rukomet', 'odbojka', 'utakmica',
+           'utakmice', 'liga', 'prvenstvo', 'turnir', 'gol', 'golova', 'trener', 'igrač', 'stadion', 'reprezentacija'],
+    'sr': ['sport', 'fudbal', 'košarka', 'tenis', 'rukomet', 'odbojka', 'utakmica',
+           'utakmice', 'liga', 'prvenstvo', 'turnir', 'gol', 'golova', 'trener', 'igrač', 'stadion', 'reprezentacija'],
+    'es': ['deporte', 'deportes', 'fútbol', 'baloncesto', 'tenis', 'partido', 'liga', 'campeonato',
+           'torneo', 'gol', 'goles', 'entrenador', 'jugador', 'estadio'],
+    'fr': ['sport', 'football', 'basket', 'tennis', 'match', 'ligue', 'championnat',
+           'tournoi', 'but', 'entraîneur', 'joueur', 'stade'],
+    'de': ['sport', 'fußball', 'basketball', 'tennis', 'spiel', 'liga', 'meisterschaft',
+           'turnier', 'tor', 'trainer', 'spieler', 'stadion'],
+}
+
+# Text fields scanned for keywords
+TEXT_FIELDS = ('title', 'description', 'snippet')
+
+# Separates articles in batch mode; never matched by a \w-based pattern
+_SEPARATOR = '\n\x00\n'
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation factored by common prefixes, e.g. ['goal', 'golf'] -> go(?:al|lf)
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+class SportsClassifier:
+    """
+    Keyword classifier compiled once into a single prefix-factored alternation.
+
+    Keywords only match as whole words (with an optional plural ending), so
+    'game' no longer matches 'endgame' and 'goal' no longer matches 'goalkeeping'.
+    Extra keywords per language can be supplied with SPORTS_KEYWORDS_<LANG>
+    (comma separated), e.g. SPORTS_KEYWORDS_BS=derbi,premijer liga.
+    """
+
+    def __init__(self, keywords: Optional[Iterable[str]] = None,
+                 locale_keywords: Optional[Dict[str, Iterable[str]]] = None):
+        self.keywords = list(keywords if keywords is not None else DEFAULT_KEYWORDS)
+        self.locale_keywords = {
+            locale: list(words) for locale, words in (locale_keywords or LOCALE_KEYWORDS).items()
+        }
+        self._patterns: Dict[Optional[str], Pattern] = {}
+        self._lock = threading.Lock()
+
+    def _keywords_for(self, locale: Optional[str]) -> List[str]:
+        words = list(self.keywords)
+        if locale:
+            words.extend(self.locale_keywords.get(locale, []))
+            extra = os.getenv(f'SPORTS_KEYWORDS_{locale.upper()}', '')
+            words.extend(word.strip() for word in extra.split(',') if word.strip())
+        return words
+
+    def get_pattern(self, locale: Optional[str] = None) -> Pattern:
+        """
+        Return the compiled matcher for a locale, building it on first use
+        """
+        pattern = self._patterns.get(locale)
+        if pattern is not None:
+            return pattern
+
+        with self._lock:
+            pattern = self._patterns.get(locale)
+            if pattern is None:
+                words = set(word.lower() for word in self._keywords_for(locale))
+                # Applied to lowercased text, which is much faster than re.IGNORECASE
+                pattern = re.compile(rf'\b(?:{_trie_pattern(words)})(?:s|es)?\b')
+                self._patterns[locale] = pattern
+        return pattern
+
+    def is_sports_related(self, article: Dict, locale: Optional[str] = None) -> bool:
+        """
+        Check if an article is sports-related based on title, description, and categories
+        """
+        if self._has_sports_category(article):
+            return True
+
+        return self.get_pattern(locale).search(self._text_of(article).lower()) is not None
+
+    def classify_batch(self, articles: List[Dict], locale: Optional[str] = None) -> List[bool]:
+        """
+        Classify many articles with one regex scan over their concatenated text
+        """
+        results = [self._has_sports_category(article) for article in articles]
+
+        pending = [index for index, matched in enumerate(results) if not matched]
+        if not pending:
+            return results
+
+        # Start offset of every pending article inside the combined text
+        offsets = []
+        parts = []
+        position = 0
+        for index in pending:
+            # Lowercase per article: lower() may change length, which would shift offsets
+            text = self._text_of(articles[index]).lower()
+            offsets.append(position)
+            parts.append(text)
+            position += len(text) + len(_SEPARATOR)
+
+        combined = _SEPARATOR.join(parts)
+        pattern = self.get_pattern(locale)
+
+        search_from = 0
+        while True:
+            match = pattern.search(combined, search_from)
+            if match is None:
+                break
+
+            slot = bisect.bisect_right(offsets, match.start()) - 1
+            results[pending[slot]] = True
+
+            # The rest of this article cannot change the result; jump to the next one
+            if slot + 1 >= len(offsets):
+                break
+            search_from = offsets[slot + 1]
+
+        return results
+
+    @staticmethod
+    def _has_sports_category(article: Dict) -> bool:
+        categories = article.get('categories')
+        return isinstance(categories, list) and 'sports' in categories
+
+    @staticmethod
+    def _text_of(article: Dict) -> str:
+        return ' '.join(article[field] for field in TEXT_FIELDS if isinstance(article.get(field), str))
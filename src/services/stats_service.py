@@ -0,0 +1,178 @@
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+import logging
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.engine import Connection
+from src.models.article import Article, db
+from src.models.article_counter import ArticleCounter
+
+logger = logging.getLogger(__name__)
+
+CounterKey = Tuple[str, str]
+
+class StatsService:
+    """
+    Maintains materialized article counters so /stats is a single small read.
+
+    Ingestion and translation add their increments to the session before
+    committing, so counters and rows change in the same transaction.
+    `reconcile()` recomputes everything from the article table to correct drift.
+    """
+
+    def __init__(self):
+        self.histogram_days = int(os.getenv('STATS_HISTOGRAM_DAYS', 30))
+
+    def record_ingested(self, rows: Iterable[Dict]):
+        """
+        Count newly inserted article rows (dicts of column values)
+        """
+        increments = Counter()
+        for row in rows:
+            increments[('total', '')] += 1
+            increments[('category', row.get('category') or 'sports')] += 1
+            increments[('source', row.get('source') or 'unknown')] += 1
+            increments[('day', (row.get('created_at') or datetime.utcnow()).date().isoformat())] += 1
+        self._increment(db.session.connection(), increments)
+
+    def record_translated(self, articles: Iterable[Article]):
+        """
+        Count articles that just became translated
+        """
+        increments = Counter()
+        for article in articles:
+            increments[('translated', '')] += 1
+            increments[('translated_day', (article.translated_at or datetime.utcnow()).date().isoformat())] += 1
+        self._increment(db.session.connection(), increments)
+
+    def get_stats(self) -> Dict:
+        """
+        Read the counters and shape them like the /stats payload
+        """
+        today = datetime.utcnow().date()
+        histogram_start = (today - timedelta(days=self.histogram_days - 1)).isoformat()
+        recent_start = (today - timedelta(days=7)).isoformat()
+
+        counters = ArticleCounter.query.filter(
+            ~ArticleCounter.scope.in_(('day', 'translated_day')) | (ArticleCounter.key >= histogram_start)
+        ).all()
+
+        totals = {'total': 0, 'translated': 0}
+        by_category = {}
+        by_source = {}
+        daily = {}
+        daily_translated = {}
+
+        for counter in counters:
+            if counter.scope in totals:
+                totals[counter.scope] = counter.value
+            elif counter.scope == 'category':
+                by_category[counter.key] = counter.value
+            elif counter.scope == 'source':
+                by_source[counter.key] = counter.value
+            elif counter.scope == 'day':
+                daily[counter.key] = counter.value
+            elif counter.scope == 'translated_day':
+                daily_translated[counter.key] = counter.value
+
+        total_articles = totals['total']
+        translated_articles = totals['translated']
+
+        return {
+            'total_articles': total_articles,
+            'translated_articles': translated_articles,
+            'untranslated_articles': total_articles - translated_articles,
+            # Day-granular: everything ingested since the start of the day a week ago
+            'recent_articles': sum(value for day, value in daily.items() if day >= recent_start),
+            'translation_percentage': round((translated_articles / total_articles * 100) if total_articles > 0 else 0, 1),
+            'by_category': by_category,
+            'by_source': dict(sorted(by_source.items(), key=lambda item: item[1], reverse=True)),
+            'daily_ingested': dict(sorted(daily.items())),
+            'daily_translated': dict(sorted(daily_translated.items()))
+        }
+
+    def reconcile(self) -> int:
+        """
+        Recompute all counters from the article table and commit; returns the number of counters
+        """
+        count = rebuild_counters(db.session.connection())
+        db.session.commit()
+        logger.info(f"Reconciled {count} article counters")
+        return count
+
+    def _increment(self, conn: Connection, increments: Dict[CounterKey, int]):
+        if not increments:
+            return
+
+        table = ArticleCounter.__table__
+        rows = [{'scope': scope, 'key': key, 'value': value} for (scope, key), value in increments.items()]
+        dialect = conn.dialect.name
+
+        if dialect in ('sqlite', 'postgresql'):
+            insert = sqlite_insert if dialect == 'sqlite' else postgresql_insert
+            stmt = insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['scope', 'key'],
+                set_={'value': table.c.value + stmt.excluded.value}
+            )
+            conn.execute(stmt, rows)
+            return
+
+        for row in rows:
+            updated = conn.execute(
+                table.update()
+                .where(table.c.scope == row['scope'], table.c.key == row['key'])
+                .values(value=table.c.value + row['value'])
+            ).rowcount
+            if not updated:
+                conn.execute(table.insert().values(**row))
+
+def compute_counters(conn: Connection) -> List[Dict]:
+    """
+    Aggregate the article table into counter rows
+    """
+    article = Article.__table__
+    rows = []
+
+    total, translated = conn.execute(
+        select(func.count(), func.coalesce(func.sum(article.c.is_translated.cast(db.Integer)), 0))
+    ).one()
+    rows.append({'scope': 'total', 'key': '', 'value': total})
+    rows.append({'scope': 'translated', 'key': '', 'value': translated})
+
+    for key, value in conn.execute(select(article.c.category, func.count()).group_by(article.c.category)):
+        rows.append({'scope': 'category', 'key': key, 'value': value})
+
+    for key, value in conn.execute(select(article.c.source, func.count()).group_by(article.c.source)):
+        rows.append({'scope': 'source', 'key': key, 'value': value})
+
+    day = func.date(article.c.created_at)
+    for key, value in conn.execute(select(day, func.count()).group_by(day)):
+        rows.append({'scope': 'day', 'key': str(key), 'value': value})
+
+    translated_day = func.date(article.c.translated_at)
+    for key, value in conn.execute(
+        select(translated_day, func.count()).where(article.c.is_translated == True).group_by(translated_day)
+    ):
+        if key is not None:
+            rows.append({'scope': 'translated_day', 'key': str(key), 'value': value})
+
+    return rows
+
+def rebuild_counters(conn: Connection) -> int:
+    """
+    Replace every counter with freshly aggregated values inside the caller's transaction
+    """
+    table = ArticleCounter.__table__
+    rows = compute_counters(conn)
+
+    conn.execute(table.delete())
+    if rows:
+        conn.execute(table.insert(), rows)
+
+    return len(rows)
+
+stats_service = StatsService()
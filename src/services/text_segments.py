@@ -0,0 +1,61 @@
+import re
+from typing import Dict, List
+
+# Sentence end: terminal punctuation, optional closing quotes/brackets, then whitespace; or a line break
+_BOUNDARY_RE = re.compile(r'[.!?…]+["\'”’)\]]*(\s+)|(\s*\n\s*)')
+
+# Words ending in a period that do not end a sentence
+ABBREVIATIONS = frozenset({
+    'mr', 'mrs', 'ms', 'dr', 'st', 'jr', 'sr', 'vs', 'v', 'no', 'gen', 'col', 'lt', 'sgt', 'capt',
+    'coach', 'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+    'u.s', 'u.k', 'e.g', 'i.e', 'etc', 'inc', 'ltd', 'approx', 'est', 'fig', 'min', 'max'
+})
+
+_LAST_WORD_RE = re.compile(r'([\w.]+)[.!?…]+["\'”’)\]]*$')
+
+def _is_abbreviation(text_before: str) -> bool:
+    match = _LAST_WORD_RE.search(text_before)
+    if match is None:
+        return False
+    word = match.group(1).lower().rstrip('.')
+    # Initials such as "J. Smith"
+    return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into alternating [sentence, separator, sentence, ...] parts.
+
+    Even positions hold sentences (possibly empty), odd positions the
+    whitespace between them, so ''.join(parts) == text and translated
+    sentences can be put back with the original spacing and line breaks.
+    """
+    if not text:
+        return [text]
+
+    parts = []
+    start = 0
+    for match in _BOUNDARY_RE.finditer(text):
+        if match.group(1) is not None:
+            separator_start = match.start(1)
+            following = text[match.end():match.end() + 1]
+            # "3.5 points", "U.S. team": lowercase continuation or an abbreviation is not a new sentence
+            if following.islower() or _is_abbreviation(text[start:separator_start]):
+                continue
+        else:
+            separator_start = match.start(2)
+
+        parts.append(text[start:separator_start])
+        parts.append(text[separator_start:match.end()])
+        start = match.end()
+
+    parts.append(text[start:])
+    return parts
+
+def join_sentences(parts: List[str], translations: Dict[str, str]) -> str:
+    """
+    Reassemble split_sentences parts, replacing each sentence with its translation
+    """
+    return ''.join(
+        translations.get(part, part) if index % 2 == 0 else part
+        for index, part in enumerate(parts)
+    )
@@ -0,0 +1,249 @@
+import os
+import re
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple
+import logging
+from src.services.cache_backend import CacheBackend, shared_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'database', 'translation_cache.db'
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+CacheKey = Tuple[str, str, str, str]
+
+
+class TranslationCache:
+    """
+    Translation memory keyed by (normalized source text, source lang, target lang, provider).
+
+    Lookups go to a bounded in-process LRU first, then to the shared cache backend
+    when one is configured (Redis, so every worker and node reuses translations),
+    and then to a SQLite table, so translations survive restarts and are shared
+    by every process using the same file.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: Optional[int] = None,
+                 shared: Optional[CacheBackend] = None):
+        if db_path is None:
+            db_path = os.getenv('TRANSLATION_CACHE_PATH', DEFAULT_CACHE_PATH)
+        if max_entries is None:
+            max_entries = int(os.getenv('TRANSLATION_CACHE_SIZE', 10000))
+
+        self.db_path = db_path
+        self.max_entries = max(max_entries, 1)
+        # A process-local backend would only duplicate the LRU tier
+        if shared is None and shared_cache.is_shared:
+            shared = shared_cache
+        self.shared = shared
+        self.shared_ttl = float(os.getenv('TRANSLATION_SHARED_CACHE_TTL', 7 * 24 * 3600))
+
+        self._memory: 'OrderedDict[CacheKey, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.memory_hits = 0
+        self.shared_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.db_path:
+            self._open_database()
+
+    def _open_database(self):
+        """
+        Open the SQLite second tier, disabling it if the file cannot be used
+        """
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+            # Several workers share the file; WAL keeps their reads from blocking on writes
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS translation_memory ('
+                ' text_hash TEXT NOT NULL,'
+                ' source_language TEXT NOT NULL,'
+                ' target_language TEXT NOT NULL,'
+                ' provider TEXT NOT NULL,'
+                ' translated_text TEXT NOT NULL,'
+                ' created_at TEXT NOT NULL,'
+                ' PRIMARY KEY (text_hash, source_language, target_language, provider))'
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Translation cache database unavailable, using memory only: {e}")
+            self._conn = None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize source text so trivially different spellings share one entry
+        """
+        return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+    def _make_key(self, text: str, source_language: str, target_language: str, provider: str) -> CacheKey:
+        text_hash = hashlib.sha256(self.normalize(text).encode('utf-8')).hexdigest()
+        return (text_hash, source_language, target_language, provider)
+
+    @staticmethod
+    def _shared_key(key: CacheKey) -> str:
+        return 'translation:' + ':'.join(key)
+
+    def lookup(self, text: str, source_language: str, target_language: str,
+               providers: List[str]) -> Optional[str]:
+        """
+        Return a cached translation from the first provider (in order) that has one
+        """
+        return self.lookup_many([text], source_language, target_language, providers)[0]
+
+    def lookup_many(self, texts: List[str], source_language: str, target_language: str,
+                    providers: List[str]) -> List[Optional[str]]:
+        """
+        Batch lookup: one pass over the LRU, one round trip to the shared backend, then SQLite
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        keys = [
+            [self._make_key(text, source_language, target_language, p) for p in providers]
+            for text in texts
+        ]
+
+        with self._lock:
+            pending = []
+            for index, text_keys in enumerate(keys):
+                for key in text_keys:
+                    if key in self._memory:
+                        self._memory.move_to_end(key)
+                        self.memory_hits += 1
+                        results[index] = self._memory[key]
+                        break
+                else:
+                    pending.append(index)
+
+        if pending and self.shared is not None:
+            # Network round trip outside the lock
+            flat = [key for index in pending for key in keys[index]]
+            values = iter(self.shared.get_many([self._shared_key(key) for key in flat]))
+            by_key = {key: next(values) for key in flat}
+
+            still_pending = []
+            with self._lock:
+                for index in pending:
+                    for key in keys[index]:
+                        translated = by_key[key]
+                        if translated is not None:
+                            self._store_in_memory(key, translated)
+                            self.shared_hits += 1
+                            results[index] = translated
+                            break
+                    else:
+                        still_pending.append(index)
+            pending = still_pending
+
+        promoted = []
+        with self._lock:
+            for index in pending:
+                for key in keys[index]:
+                    translated = self._read_from_disk(key)
+                    if translated is not None:
+                        self._store_in_memory(key, translated)
+                        self.disk_hits += 1
+                        results[index] = translated
+                        promoted.append((key, translated))
+                        break
+                else:
+                    self.misses += 1
+
+        if self.shared is not None:
+            for key, translated in promoted:
+                self.shared.set(self._shared_key(key), translated, self.shared_ttl)
+
+        return results
+
+    def set(self, text: str, source_language: str, target_language: str,
+            provider: str, translated_text: str):
+        """
+        Store a provider translation in every tier
+        """
+        key = self._make_key(text, source_language, target_language, provider)
+
+        with self._lock:
+            self._store_in_memory(key, translated_text)
+            self._write_to_disk(key, translated_text)
+
+        if self.shared is not None:
+            self.shared.set(self._shared_key(key), translated_text, self.shared_ttl)
+
+    def _store_in_memory(self, key: CacheKey, translated_text: str):
+        self._memory[key] = translated_text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _read_from_disk(self, key: CacheKey) -> Optional[str]:
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                'SELECT translated_text FROM translation_memory'
+                ' WHERE text_hash = ? AND source_language = ? AND target_language = ? AND provider = ?',
+                key
+            ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.error(f"Translation cache read error: {e}")
+            return None
+
+    def _write_to_disk(self, key: CacheKey, translated_text: str):
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO translation_memory'
+                ' (text_hash, source_language, target_language, provider, translated_text, created_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                key + (translated_text, datetime.utcnow().isoformat())
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Translation cache write error: {e}")
+
+    def clear(self):
+        """
+        Drop the in-process tier (the SQLite tier is kept)
+        """
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict:
+        """
+        Return hit/miss/eviction counters for both tiers
+        """
+        with self._lock:
+            hits = self.memory_hits + self.shared_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                'memory_entries': len(self._memory),
+                'max_entries': self.max_entries,
+                'persistent': self._conn is not None,
+                'shared': self.shared.get_stats() if self.shared is not None else None,
+                'hits': hits,
+                'memory_hits': self.memory_hits,
+                'shared_hits': self.shared_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(hits / lookups * 100, 1) if lookups > 0 else 0
+            }
@@ -0,0 +1,116 @@
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+import logging
+from src.services.translation_service import TranslationService
+
+logger = logging.getLogger(__name__)
+
+# (segments, target_language, source_language)
+TranslationBatch = Tuple[List[str], str, str]
+
+class TranslationExecutor:
+    """
+    Thread pool that runs TranslationService.translate_batch calls concurrently.
+
+    Provider rate limits and 429/5xx backoff are enforced inside TranslationService,
+    so the pool size only bounds how many requests may be in flight at once.
+    """
+
+    def __init__(self, translation_service: TranslationService, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.getenv('TRANSLATION_WORKERS', 4))
+
+        self.translation_service = translation_service
+        self.max_workers = max(max_workers, 1)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='translation')
+
+    def translate_batches(self, batches: List[TranslationBatch]) -> List[Optional[List[Optional[str]]]]:
+        """
+        Translate many batches concurrently, returning results in input order.
+
+        A batch whose call raised is returned as None so the caller can leave the
+        corresponding rows untranslated.
+        """
+        if len(batches) == 1 or self.max_workers == 1:
+            return [self._translate(batch) for batch in batches]
+
+        futures = [self._pool.submit(self._translate, batch) for batch in batches]
+        return [future.result() for future in futures]
+
+    def _translate(self, batch: TranslationBatch) -> Optional[List[Optional[str]]]:
+        segments, target_language, source_language = batch
+        try:
+            return self.translation_service.translate_batch(segments, target_language, source_language)
+        except Exception as e:
+            logger.error(f"Error translating batch of {len(segments)} segments: {e}")
+            return None
+
+    def shutdown(self):
+        """
+        Stop accepting work and wait for running batches
+        """
+        self._pool.shutdown(wait=True)
+
+class AsyncTranslationExecutor:
+    """
+    Runs TranslationService.translate_batch_async on a dedicated event loop thread.
+
+    Same interface as TranslationExecutor, but in-flight provider requests are
+    coroutines rather than threads, so hundreds can be outstanding at once;
+    `max_concurrency` bounds how many batches run together.
+    """
+
+    def __init__(self, translation_service: TranslationService, max_concurrency: Optional[int] = None):
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('TRANSLATION_ASYNC_CONCURRENCY', 100))
+
+        self.translation_service = translation_service
+        self.max_concurrency = max(max_concurrency, 1)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='translation-async', daemon=True)
+        self._thread.start()
+
+    def translate_batches(self, batches: List[TranslationBatch]) -> List[Optional[List[Optional[str]]]]:
+        """
+        Translate many batches concurrently, returning results in input order (None for a failed batch)
+        """
+        future = asyncio.run_coroutine_threadsafe(self._translate_all(batches), self._loop)
+        return future.result()
+
+    async def _translate_all(self, batches: List[TranslationBatch]) -> List[Optional[List[Optional[str]]]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: TranslationBatch):
+            async with semaphore:
+                return await self._translate(batch)
+
+        return await asyncio.gather(*(run(batch) for batch in batches))
+
+    async def _translate(self, batch: TranslationBatch) -> Optional[List[Optional[str]]]:
+        segments, target_language, source_language = batch
+        try:
+            return await self.translation_service.translate_batch_async(segments, target_language, source_language)
+        except Exception as e:
+            logger.error(f"Error translating batch of {len(segments)} segments: {e}")
+            return None
+
+    def shutdown(self):
+        """
+        Close the async HTTP client and stop the loop thread
+        """
+        asyncio.run_coroutine_threadsafe(
+            self.translation_service.async_http.aclose(), self._loop
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+def create_translation_executor(translation_service: TranslationService):
+    """
+    Build the executor selected by TRANSLATION_EXECUTOR ('threads' or 'async')
+    """
+    if os.getenv('TRANSLATION_EXECUTOR', 'threads') == 'async':
+        return AsyncTranslationExecutor(translation_service)
+    return TranslationExecutor(translation_service)
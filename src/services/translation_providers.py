@@ -0,0 +1,324 @@
+import os
+import re
+import csv
+import threading
+import unicodedata
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import logging
+from src.services.text_segments import split_sentences
+
+# Prefix TranslationService puts on its demo fallback when every provider failed
+DEMO_TRANSLATION_PREFIX = '[DEMO PREVOD]'
+
+logger = logging.getLogger(__name__)
+
+Timeout = Tuple[float, float]
+
+class TranslationProvider:
+    """
+    A translation backend in the TranslationService fallback chain.
+
+    `translate` returns one result per text, None for texts it could not
+    translate (those fall through to the next provider). Rate limiting,
+    circuit breaking and caching are done by TranslationService around it.
+    """
+
+    name = ''
+    # Env prefix of the provider's <PREFIX>_RATE_LIMIT / <PREFIX>_BURST settings; None means no limit
+    rate_limit_env: Optional[str] = None
+    default_rate_limit = 0.0
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def translate(self, texts: List[str], target_language: str, source_language: str) -> List[Optional[str]]:
+        raise NotImplementedError
+
+class HttpTranslationProvider(TranslationProvider):
+    """
+    Provider reached over HTTP; TranslationService sends the request (with
+    retries and backoff, sync or async) and the provider only shapes it
+    """
+
+    def __init__(self, timeout: Timeout):
+        self.timeout = timeout
+
+    def build_request(self, texts: List[str], target_language: str, source_language: str) -> Tuple[str, Dict]:
+        """
+        Return (url, keyword arguments for the POST)
+        """
+        raise NotImplementedError
+
+    def parse_response(self, data: Dict, count: int) -> List[Optional[str]]:
+        raise NotImplementedError
+
+class GoogleTranslateProvider(HttpTranslationProvider):
+    """
+    Google Cloud Translation API v2 (repeated `q` parameters); enabled by GOOGLE_TRANSLATE_API_KEY
+    """
+
+    name = 'google'
+    rate_limit_env = 'GOOGLE_TRANSLATE'
+    default_rate_limit = 10.0
+
+    def __init__(self, timeout: Timeout, api_key: Optional[str] = None):
+        super().__init__(timeout)
+        self.api_key = api_key if api_key is not None else os.getenv('GOOGLE_TRANSLATE_API_KEY')
+
+    def is_enabled(self) -> bool:
+        return bool(self.api_key)
+
+    def build_request(self, texts: List[str], target_language: str, source_language: str) -> Tuple[str, Dict]:
+        url = 'https://translation.googleapis.com/language/translate/v2'
+        params = {'key': self.api_key}
+        data = {
+            'q': texts,
+            'target': target_language,
+            'source': source_language,
+            'format': 'text'
+        }
+        # Segments go in the form body so large batches do not hit URL length limits
+        return url, {'params': params, 'data': data, 'timeout': self.timeout}
+
+    def parse_response(self, data: Dict, count: int) -> List[Optional[str]]:
+        if 'data' in data and 'translations' in data['data']:
+            translations = data['data']['translations']
+            if len(translations) == count:
+                return [translation.get('translatedText') for translation in translations]
+            logger.error(f"Google Translate returned {len(translations)} translations for {count} segments")
+
+        return [None] * count
+
+class LibreTranslateProvider(HttpTranslationProvider):
+    """
+    LibreTranslate API (list-valued `q`) at LIBRETRANSLATE_URL; any compatible server works,
+    including a local one
+    """
+
+    name = 'libretranslate'
+    rate_limit_env = 'LIBRETRANSLATE'
+    default_rate_limit = 2.0
+
+    # LibreTranslate uses different language codes
+    # Map common codes to LibreTranslate format
+    LANGUAGE_MAPPING = {
+        'bs': 'hr',  # Use Croatian as closest to Bosnian if Bosnian not available
+        'en': 'en',
+        'es': 'es',
+        'fr': 'fr',
+        'de': 'de',
+        'it': 'it',
+        'pt': 'pt',
+        'ru': 'ru'
+    }
+
+    def __init__(self, timeout: Timeout, url: Optional[str] = None):
+        super().__init__(timeout)
+        self.url = (url or os.getenv('LIBRETRANSLATE_URL', 'https://libretranslate.com')).rstrip('/')
+
+    def build_request(self, texts: List[str], target_language: str, source_language: str) -> Tuple[str, Dict]:
+        data = {
+            'q': texts,
+            'source': self.LANGUAGE_MAPPING.get(source_language, source_language),
+            'target': self.LANGUAGE_MAPPING.get(target_language, target_language),
+            'format': 'text'
+        }
+        return f'{self.url}/translate', {'json': data, 'timeout': self.timeout}
+
+    def parse_response(self, result: Dict, count: int) -> List[Optional[str]]:
+        if 'translatedText' in result:
+            translated = result['translatedText']
+            if isinstance(translated, list) and len(translated) == count:
+                return translated
+            if isinstance(translated, str) and count == 1:
+                return [translated]
+            logger.error(f"LibreTranslate returned an unexpected result for {count} segments")
+
+        return [None] * count
+
+_TOKEN_RE = re.compile(r'(\W+)', re.UNICODE)
+
+def _phrase_key(text: str) -> str:
+    # Case and punctuation do not matter, so "Fans celebrated!" finds "Fans celebrated."
+    return ' '.join(word for word in _TOKEN_RE.split(unicodedata.normalize('NFC', text).lower())[0::2] if word)
+
+class PhraseTable:
+    """
+    In-memory translation memory of whole fields and sentences, per language pair.
+
+    Loaded from a TSV file with `source_language, target_language, source, translation`
+    rows, typically written by `flask build-phrase-table` from stored article
+    translations.
+    """
+
+    def __init__(self):
+        # (source, target) -> lowercased phrase -> translation
+        self.phrases: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+    def add(self, source_language: str, target_language: str, source: str, translation: str):
+        key = _phrase_key(source)
+        if not key or not translation:
+            return
+        self.phrases.setdefault((source_language, target_language), {})[key] = translation
+
+    def __len__(self) -> int:
+        return sum(len(phrases) for phrases in self.phrases.values())
+
+    def load(self, path: str) -> int:
+        """
+        Add the rows of a TSV phrase file; returns how many were read
+        """
+        count = 0
+        with open(path, encoding='utf-8', newline='') as f:
+            for row in csv.reader(f, delimiter='\t'):
+                if len(row) != 4:
+                    continue
+                self.add(*row)
+                count += 1
+        return count
+
+    @staticmethod
+    def write(path: str, rows: Iterable[Sequence[str]]) -> int:
+        count = 0
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        return count
+
+    def translate(self, text: str, source_language: str, target_language: str) -> Optional[str]:
+        """
+        The stored translation of the whole text, or of every one of its sentences;
+        None when any sentence is unknown, so no half-translated text is returned
+        """
+        phrases = self.phrases.get((source_language, target_language))
+        if not phrases:
+            return None
+
+        exact = phrases.get(_phrase_key(text))
+        if exact is not None:
+            return exact
+
+        parts = split_sentences(text)
+        for index in range(0, len(parts), 2):
+            sentence = parts[index]
+            if not sentence.strip():
+                continue
+            translated = phrases.get(_phrase_key(sentence))
+            if translated is None:
+                return None
+            parts[index] = translated
+
+        return ''.join(parts)
+
+class PhraseTableProvider(TranslationProvider):
+    """
+    Offline provider translating from a PhraseTable in this process.
+
+    The table is read from PHRASE_TABLE_PATH on first use. Texts with any
+    unknown sentence return None, so the next provider (or the demo fallback)
+    handles them.
+    """
+
+    name = 'phrase_table'
+
+    def __init__(self, path: Optional[str] = None, table: Optional[PhraseTable] = None):
+        self.path = path if path is not None else os.getenv('PHRASE_TABLE_PATH', '')
+        self._table = table
+        self._lock = threading.Lock()
+
+    @property
+    def table(self) -> PhraseTable:
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    table = PhraseTable()
+                    if self.path and os.path.exists(self.path):
+                        logger.info(f"Loaded {table.load(self.path)} phrases from {self.path}")
+                    elif self.path:
+                        logger.warning(f"Phrase table {self.path} not found; phrase_table provider is empty")
+                    self._table = table
+        return self._table
+
+    def translate(self, texts: List[str], target_language: str, source_language: str) -> List[Optional[str]]:
+        table = self.table
+        return [table.translate(text, source_language, target_language) for text in texts]
+
+# Provider name -> factory taking the request timeout
+PROVIDER_FACTORIES: Dict[str, Callable[[Timeout], TranslationProvider]] = {
+    'google': lambda timeout: GoogleTranslateProvider(timeout),
+    'libretranslate': lambda timeout: LibreTranslateProvider(timeout),
+    'phrase_table': lambda timeout: PhraseTableProvider(),
+}
+
+def register_provider(name: str, factory: Callable[[Timeout], TranslationProvider]):
+    """
+    Make a custom provider available to TRANSLATION_PROVIDERS
+    """
+    PROVIDER_FACTORIES[name] = factory
+
+def create_providers(names: Optional[str], timeout: Timeout) -> List[TranslationProvider]:
+    """
+    Build the fallback chain from a comma-separated list such as 'google,libretranslate'
+    """
+    providers = []
+    for name in (names or 'google,libretranslate').split(','):
+        name = name.strip()
+        if not name:
+            continue
+        if name not in PROVIDER_FACTORIES:
+            raise ValueError(f"Unknown translation provider '{name}', expected one of: {', '.join(PROVIDER_FACTORIES)}")
+        providers.append(PROVIDER_FACTORIES[name](timeout))
+    return providers
+
+def iter_article_phrases(pairs: Iterable[Tuple[str, str, str, str]]) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Turn (source lang, target lang, original, translation) field pairs into
+    phrase rows: the whole field, plus each sentence when both sides split
+    into the same number of sentences; demo fallbacks are never phrases
+    """
+    for source_language, target_language, original, translated in pairs:
+        if not original or not translated:
+            continue
+        if DEMO_TRANSLATION_PREFIX not in translated:
+            yield source_language, target_language, original, translated
+
+        original_parts, translated_parts = split_sentences(original), split_sentences(translated)
+        if len(original_parts) > 1 and len(original_parts) == len(translated_parts):
+            for source, target in zip(original_parts[0::2], translated_parts[0::2]):
+                if source.strip() and target.strip() and DEMO_TRANSLATION_PREFIX not in target:
+                    yield source_language, target_language, source, target
+
+def register_phrase_table_command(app):
+    """
+    Add the `flask build-phrase-table` command
+    """
+    import click
+    from src.models.article import Article, db
+    from src.services.article_translation_service import TRANSLATABLE_FIELDS
+
+    @app.cli.command('build-phrase-table')
+    @click.option('--output', '-o', type=click.Path(dir_okay=False),
+                  default=lambda: os.getenv('PHRASE_TABLE_PATH') or 'phrase_table.tsv',
+                  help='TSV file to write; defaults to PHRASE_TABLE_PATH.')
+    @click.option('--target', 'target_language', default='bs', help='Language the stored translations are in.')
+    def build_phrase_table_command(output, target_language):
+        """Write a phrase table for the phrase_table provider from stored article translations."""
+        columns = [Article.language] + [
+            getattr(Article, name) for pair in TRANSLATABLE_FIELDS for name in pair
+        ]
+        rows = db.session.execute(
+            db.select(*columns).where(Article.is_translated == True)
+            .execution_options(yield_per=1000)
+        )
+
+        def pairs():
+            for language, *values in rows:
+                for original, translated in zip(values[0::2], values[1::2]):
+                    # Demo fallbacks are not translations
+                    if translated and DEMO_TRANSLATION_PREFIX not in translated:
+                        yield language or 'en', target_language, original, translated
+
+        count = PhraseTable.write(output, iter_article_phrases(pairs()))
+        click.echo(f"Wrote {count} phrases to {output}")
@@ -1,115 +1,368 @@
 import requests
 import os
-from typing import Optional, Dict
+import time
+import random
+import asyncio
+from typing import Optional, Dict, List, Tuple
 import logging
+from src.services.translation_cache import TranslationCache
+from src.services.rate_limiter import TokenBucket
+from src.services.http_client import HttpClient, AsyncHttpClient, http_client
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.single_flight import SingleFlight
+from src.services.translation_providers import (
+    DEMO_TRANSLATION_PREFIX, HttpTranslationProvider, TranslationProvider, create_providers
+)
 
 logger = logging.getLogger(__name__)
 
 class TranslationService:
-    def __init__(self):
-        self.google_api_key = os.getenv('GOOGLE_TRANSLATE_API_KEY')
-        self.libretranslate_url = os.getenv('LIBRETRANSLATE_URL', 'https://libretranslate.com')
+    def __init__(self, cache: Optional[TranslationCache] = None, http: Optional[HttpClient] = None,
+                 async_http: Optional[AsyncHttpClient] = None, providers: Optional[List[TranslationProvider]] = None):
+        self.http = http if http is not None else http_client
+        # Created on first async call so httpx stays optional for sync deployments
+        self._async_http = async_http
+        self.cache = cache if cache is not None else TranslationCache()
+        # Google v2 accepts up to 128 `q` values per request
+        self.batch_size = int(os.getenv('TRANSLATION_BATCH_SIZE', 50))
+        self.batch_max_chars = int(os.getenv('TRANSLATION_BATCH_MAX_CHARS', 30000))
+        self.max_retries = int(os.getenv('TRANSLATION_MAX_RETRIES', 3))
+        # Translation calls are short; a slow provider should fail fast
+        self.timeout = (
+            float(os.getenv('TRANSLATION_CONNECT_TIMEOUT', 3.05)),
+            float(os.getenv('TRANSLATION_READ_TIMEOUT', 15))
+        )
+        self.backoff_base = float(os.getenv('TRANSLATION_BACKOFF_BASE', 0.5))
+        self.backoff_max = float(os.getenv('TRANSLATION_BACKOFF_MAX', 30))
+        # Fallback chain, e.g. TRANSLATION_PROVIDERS=libretranslate,phrase_table; with latency
+        # ordering in-process providers such as phrase_table are always tried last
+        if providers is None:
+            providers = create_providers(os.getenv('TRANSLATION_PROVIDERS'), self.timeout)
+        self.providers: Dict[str, TranslationProvider] = {provider.name: provider for provider in providers}
+        # Requests per second allowed for each provider (0 disables the limit)
+        self.rate_limiters = {
+            name: TokenBucket(
+                float(os.getenv(f'{provider.rate_limit_env}_RATE_LIMIT', provider.default_rate_limit)),
+                float(os.getenv(f'{provider.rate_limit_env}_BURST', 0))
+            ) if provider.rate_limit_env else TokenBucket(0)
+            for name, provider in self.providers.items()
+        }
+        self.breakers = {name: CircuitBreaker(name) for name in self.providers}
+        # 'latency' tries the fastest healthy provider first, 'fixed' keeps the fallback order
+        self.provider_ordering = os.getenv('TRANSLATION_PROVIDER_ORDERING', 'latency')
+        # Identical batches requested concurrently are translated once
+        self.flights = SingleFlight('translation')
+        
+    def _get_providers(self) -> List[str]:
+        """
+        Return the enabled translation providers in fallback order
+        """
+        return [name for name, provider in self.providers.items() if provider.is_enabled()]
+    
+    def _get_ordered_providers(self) -> List[str]:
+        """
+        Return enabled providers, healthy ones first, fastest HTTP provider first when ordering by latency
+        """
+        providers = self._get_providers()
+        
+        by_latency = self.provider_ordering == 'latency'
         
+        def sort_key(provider):
+            breaker = self.breakers[provider]
+            # Half-open providers stay in line so they get their trial request
+            unhealthy = breaker.state == CircuitBreaker.OPEN
+            # In-process providers answer in microseconds but only know stored text,
+            # so they stay behind the MT services as a fallback
+            local = by_latency and not isinstance(self.providers[provider], HttpTranslationProvider)
+            # Providers without latency samples keep their fallback position up front
+            latency = breaker.latency_ms if by_latency and breaker.latency_ms is not None else 0
+            return (unhealthy, local, latency, providers.index(provider))
+        
+        return sorted(providers, key=sort_key)
+    
     def translate_text(self, text: str, target_language: str = 'bs', source_language: str = 'en') -> Optional[str]:
         """
         Translate text to target language using available translation services
         """
         if not text or not text.strip():
             return text
+        
+        return self.translate_batch([text], target_language, source_language)[0]
+    
+    def translate_batch(self, segments: List[str], target_language: str = 'bs', source_language: str = 'en') -> List[Optional[str]]:
+        """
+        Translate many segments with as few provider requests as possible.
+        
+        Results are returned in the same order as the input. Each segment falls
+        through the provider chain on its own, so a failure only affects the
+        segments that were in the failed request.
+        """
+        key = (target_language, source_language, tuple(segments))
+        # Each caller gets its own list
+        return list(self.flights.do(key, lambda: self._translate_batch(segments, target_language, source_language)))
+    
+    def _translate_batch(self, segments: List[str], target_language: str, source_language: str) -> List[Optional[str]]:
+        results, pending = self._prepare_batch(segments, target_language, source_language)
+        remaining = list(pending)
+        
+        for provider in self._get_ordered_providers():
+            if not remaining:
+                break
             
-        # Try Google Translate first if API key is available
-        if self.google_api_key:
-            result = self._translate_with_google(text, target_language, source_language)
-            if result:
-                return result
+            breaker = self.breakers[provider]
+            failed = []
+            for chunk in self._chunk_segments(remaining):
+                # An open circuit fails over immediately instead of waiting for a timeout
+                if not breaker.allow_request():
+                    failed.extend(chunk)
+                    continue
+                
+                start = time.perf_counter()
+                translations = self._translate_chunk(provider, chunk, target_language, source_language)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                
+                failed.extend(self._apply_translations(
+                    provider, chunk, translations, elapsed_ms, pending, results, target_language, source_language
+                ))
+            
+            remaining = failed
+        
+        self._apply_demo_translations(remaining, pending, results, target_language)
+        return results
+    
+    async def translate_batch_async(self, segments: List[str], target_language: str = 'bs', source_language: str = 'en') -> List[Optional[str]]:
+        """
+        asyncio variant of translate_batch: all chunks for a provider are sent concurrently
+        """
+        results, pending = self._prepare_batch(segments, target_language, source_language)
+        remaining = list(pending)
+        
+        for provider in self._get_ordered_providers():
+            if not remaining:
+                break
+            
+            breaker = self.breakers[provider]
+            failed = []
+            allowed = []
+            for chunk in self._chunk_segments(remaining):
+                if breaker.allow_request():
+                    allowed.append(chunk)
+                else:
+                    failed.extend(chunk)
+            
+            outcomes = await asyncio.gather(*(
+                self._translate_chunk_async(provider, chunk, target_language, source_language)
+                for chunk in allowed
+            ))
+            
+            for chunk, (translations, elapsed_ms) in zip(allowed, outcomes):
+                failed.extend(self._apply_translations(
+                    provider, chunk, translations, elapsed_ms, pending, results, target_language, source_language
+                ))
+            
+            remaining = failed
+        
+        self._apply_demo_translations(remaining, pending, results, target_language)
+        return results
+    
+    def _prepare_batch(self, segments: List[str], target_language: str,
+                       source_language: str) -> Tuple[List[Optional[str]], Dict[str, List[int]]]:
+        """
+        Fill blank and cached segments; return the results list and the unique texts still to translate
+        """
+        results: List[Optional[str]] = [None] * len(segments)
+        providers = self._get_providers()
+        
+        # Unique untranslated texts mapped to every position they occur at
+        pending: Dict[str, List[int]] = {}
+        
+        for index, segment in enumerate(segments):
+            if not segment or not segment.strip():
+                results[index] = segment
+                continue
+            
+            pending.setdefault(segment, []).append(index)
+        
+        # Serve repeated strings from the translation memory in one batch lookup
+        texts = list(pending)
+        for text, cached in zip(texts, self.cache.lookup_many(texts, source_language, target_language, providers)):
+            if cached is None:
+                continue
+            for index in pending.pop(text):
+                results[index] = cached
+        
+        return results, pending
+    
+    def _apply_translations(self, provider: str, chunk: List[str], translations: List[Optional[str]],
+                            elapsed_ms: float, pending: Dict[str, List[int]], results: List[Optional[str]],
+                            target_language: str, source_language: str) -> List[str]:
+        """
+        Record the provider outcome, store successful translations and return the texts that failed
+        """
+        breaker = self.breakers[provider]
+        if any(translations):
+            breaker.record_success(elapsed_ms)
+        elif isinstance(self.providers[provider], HttpTranslationProvider):
+            breaker.record_failure()
+        # An in-process provider that knows none of the texts has missed, not failed
         
-        # Fallback to LibreTranslate
-        result = self._translate_with_libretranslate(text, target_language, source_language)
-        if result:
-            return result
+        failed = []
+        for text, translated in zip(chunk, translations):
+            if not translated:
+                failed.append(text)
+                continue
+            
+            self.cache.set(text, source_language, target_language, provider, translated)
+            for index in pending[text]:
+                results[index] = translated
         
+        return failed
+    
+    def _apply_demo_translations(self, remaining: List[str], pending: Dict[str, List[int]],
+                                 results: List[Optional[str]], target_language: str):
         # If all translation services fail, return demo translation
-        return self._get_demo_translation(text, target_language)
+        for text in remaining:
+            translated = self._get_demo_translation(text, target_language)
+            for index in pending[text]:
+                results[index] = translated
     
-    def _translate_with_google(self, text: str, target_language: str, source_language: str) -> Optional[str]:
+    def _post_with_backoff(self, provider: str, url: str, **kwargs) -> requests.Response:
         """
-        Translate using Google Cloud Translation API
+        POST to a provider under its rate limit, backing off on 429 and 5xx responses
         """
-        try:
-            url = 'https://translation.googleapis.com/language/translate/v2'
-            params = {
-                'key': self.google_api_key,
-                'q': text,
-                'target': target_language,
-                'source': source_language,
-                'format': 'text'
-            }
-            
-            response = requests.post(url, params=params, timeout=30)
-            response.raise_for_status()
+        attempt = 0
+        
+        while True:
+            self.rate_limiters[provider].acquire()
+            response = self.http.post(url, **kwargs)
             
-            data = response.json()
+            if response.status_code != 429 and response.status_code < 500:
+                return response
             
-            if 'data' in data and 'translations' in data['data']:
-                translations = data['data']['translations']
-                if translations and len(translations) > 0:
-                    return translations[0]['translatedText']
+            # Give up early once the provider's circuit has opened elsewhere
+            if attempt >= self.max_retries or self.breakers[provider].state == CircuitBreaker.OPEN:
+                return response
             
-            return None
+            delay = self._get_backoff_delay(response, attempt)
+            logger.warning(f"{provider} returned {response.status_code}, retrying in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
+    
+    @property
+    def async_http(self) -> AsyncHttpClient:
+        if self._async_http is None:
+            self._async_http = AsyncHttpClient(self.http)
+        return self._async_http
+    
+    async def _post_with_backoff_async(self, provider: str, url: str, **kwargs):
+        """
+        Non-blocking _post_with_backoff: waits for rate limit tokens and backoff with asyncio.sleep
+        """
+        attempt = 0
+        
+        while True:
+            await self.rate_limiters[provider].acquire_async()
+            response = await self.async_http.post(url, **kwargs)
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Google Translate API error: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error in Google Translate: {e}")
-            return None
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            
+            if attempt >= self.max_retries or self.breakers[provider].state == CircuitBreaker.OPEN:
+                return response
+            
+            delay = self._get_backoff_delay(response, attempt)
+            logger.warning(f"{provider} returned {response.status_code}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
     
-    def _translate_with_libretranslate(self, text: str, target_language: str, source_language: str) -> Optional[str]:
+    async def _translate_chunk_async(self, provider: str, texts: List[str], target_language: str,
+                                     source_language: str) -> Tuple[List[Optional[str]], float]:
         """
-        Translate using LibreTranslate API
+        Send one chunk to a provider over the async client; returns (translations, elapsed ms)
         """
+        backend = self.providers[provider]
+        start = time.perf_counter()
         try:
-            url = f"{self.libretranslate_url}/translate"
-            
-            # LibreTranslate uses different language codes
-            # Map common codes to LibreTranslate format
-            lang_mapping = {
-                'bs': 'hr',  # Use Croatian as closest to Bosnian if Bosnian not available
-                'en': 'en',
-                'es': 'es',
-                'fr': 'fr',
-                'de': 'de',
-                'it': 'it',
-                'pt': 'pt',
-                'ru': 'ru'
-            }
-            
-            target_lang = lang_mapping.get(target_language, target_language)
-            source_lang = lang_mapping.get(source_language, source_language)
-            
-            data = {
-                'q': text,
-                'source': source_lang,
-                'target': target_lang,
-                'format': 'text'
-            }
-            
-            response = requests.post(url, json=data, timeout=30)
-            response.raise_for_status()
+            if isinstance(backend, HttpTranslationProvider):
+                url, kwargs = backend.build_request(texts, target_language, source_language)
+                response = await self._post_with_backoff_async(provider, url, **kwargs)
+                response.raise_for_status()
+                translations = backend.parse_response(response.json(), len(texts))
+            else:
+                # In-process providers run off the loop so a slow one cannot stall other requests
+                translations = await asyncio.to_thread(backend.translate, texts, target_language, source_language)
+        except Exception as e:
+            logger.error(f"{provider} async translation error: {e!r}")
+            translations = [None] * len(texts)
+        
+        return translations, (time.perf_counter() - start) * 1000
+    
+    def get_provider_health(self) -> List[Dict]:
+        """
+        Return circuit breaker state and latency for each enabled provider, in the order they are tried
+        """
+        return [
+            dict(self.breakers[provider].to_dict(), rate_limit=self.rate_limiters[provider].rate)
+            for provider in self._get_ordered_providers()
+        ]
+    
+    def _get_backoff_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Honour Retry-After when present, otherwise use exponential backoff with full jitter
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def _chunk_segments(self, segments: List[str]) -> List[List[str]]:
+        """
+        Split segments into provider requests bounded by count and total characters
+        """
+        chunks = []
+        current: List[str] = []
+        current_chars = 0
+        
+        for segment in segments:
+            if current and (len(current) >= self.batch_size or current_chars + len(segment) > self.batch_max_chars):
+                chunks.append(current)
+                current = []
+                current_chars = 0
             
-            result = response.json()
+            current.append(segment)
+            current_chars += len(segment)
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    def _translate_chunk(self, provider: str, texts: List[str], target_language: str,
+                         source_language: str) -> List[Optional[str]]:
+        """
+        Translate one chunk with a provider; a failed request yields None for every text
+        """
+        backend = self.providers[provider]
+        try:
+            if not isinstance(backend, HttpTranslationProvider):
+                return backend.translate(texts, target_language, source_language)
             
-            if 'translatedText' in result:
-                return result['translatedText']
+            url, kwargs = backend.build_request(texts, target_language, source_language)
+            response = self._post_with_backoff(provider, url, **kwargs)
+            response.raise_for_status()
             
-            return None
+            return backend.parse_response(response.json(), len(texts))
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"LibreTranslate API error: {e}")
-            return None
+            logger.error(f"{provider} translation API error: {e}")
+            return [None] * len(texts)
         except Exception as e:
-            logger.error(f"Unexpected error in LibreTranslate: {e}")
-            return None
+            logger.error(f"Unexpected error in {provider} translation: {e}")
+            return [None] * len(texts)
     
     def _get_demo_translation(self, text: str, target_language: str) -> str:
         """
@@ -132,7 +385,7 @@ class TranslationService:
         if text in demo_translations:
             return demo_translations[text]
         else:
-            return f"[DEMO PREVOD] {text}"
+            return f"{DEMO_TRANSLATION_PREFIX} {text}"
     
     def get_supported_languages(self) -> Dict[str, str]:
         """
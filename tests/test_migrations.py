@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import create_engine
+from src.models.user import db
+from src.models.article import Article  # noqa: F401 (registers the table)
+from src.models.article_counter import ArticleCounter  # noqa: F401
+from src.models.feed_watermark import FeedWatermark  # noqa: F401
+from src.models.job import Job  # noqa: F401
+from src.database.migrations import explain_hot_queries, run_migrations
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    # Same order as main.py: create_all, then migrations
+    db.metadata.create_all(engine)
+    run_migrations(engine)
+    yield engine
+    engine.dispose()
+
+def test_hot_queries_use_their_indexes(engine):
+    report = explain_hot_queries(engine)
+
+    for name, result in report.items():
+        assert result['uses_index'], f"{name} does not use {result['expected_index']}: {result['plan']}"
+        assert not result['temp_sort'], f"{name} sorts in a temp b-tree: {result['plan']}"
+
+def test_migrations_are_idempotent(engine):
+    assert run_migrations(engine) == []
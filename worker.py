@@ -0,0 +1,14 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+# Same as `flask --app main worker`: jobs (and the scheduler, if enabled) run in this process
+from main import app
+from src.services.job_queue import job_queue
+from src.services.scheduler import scheduler
+
+
+if __name__ == '__main__':
+    job_queue.start_workers(int(os.getenv('JOB_WORKERS', 1)))
+    scheduler.start_if_enabled()
+    job_queue.join()
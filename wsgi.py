@@ -0,0 +1,11 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+# WSGI entry point for production servers, e.g.
+#   gunicorn wsgi:application --workers 2 --threads 8
+# Importing main alone starts no background threads; the serving process starts them here.
+from main import app, start_background_threads
+
+start_background_threads()
+application = app